@@ -48,4 +48,22 @@ class Config(BaseSettings):
         Annotated[Secret[str], NoDecode] | list[Annotated[Secret[str], NoDecode]] | None
     ) = None
 
+    # Thread pool size
+    #
+    # The maximum number of threads used to run synchronous code, like endpoints
+    # that are not declared safe to run in an asynchronous context.
+    # When not set, all synchronous code runs in a single, shared thread, which
+    # is safe for thread-bound resources like synchronous database sessions.
+    # When set, only functions decorated with `@thread_sensitive()` keep running
+    # in that single thread, so make sure the synchronous code of the application
+    # does not rely on thread-local state before enabling it.
+    thread_pool_size: int | None = None
+
+    # Container freezing
+    #
+    # When enabled, the container bindings are compiled and validated once all
+    # service providers have been booted. Missing bindings and circular dependencies
+    # are then reported at startup rather than on the first request.
+    freeze_container: bool = False
+
     model_config = SettingsConfigDict(env_prefix="app_", env_nested_delimiter="__")
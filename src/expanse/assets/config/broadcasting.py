@@ -0,0 +1,43 @@
+from typing import Any
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+from pydantic_settings import SettingsConfigDict
+
+
+class Config(BaseSettings):
+    # Broadcaster driver
+    #
+    # The driver delivering the published events to their subscribers.
+    # The "memory" driver only reaches the subscribers of the current process
+    # while the "redis" driver reaches the subscribers of all processes.
+    # Use the `BROADCASTING_DRIVER` environment variable to set this value in your `.env` file.
+    # For instance:
+    # >>> BROADCASTING_DRIVER=redis
+    driver: str = "memory"
+
+    # Subscription queue size
+    #
+    # The maximum number of events waiting to be consumed by a subscriber.
+    # The oldest events of slow subscribers are discarded beyond it.
+    # Use the `BROADCASTING_MAX_QUEUE` environment variable to set this value in your `.env` file.
+    max_queue: int = 100
+
+    # Redis broadcaster
+    #
+    # The configuration of the "redis" driver.
+    # It can be defined with environment variables in you `.env` file.
+    # For instance:
+    # >>> BROADCASTING_REDIS__CONNECTION=default
+    # >>> BROADCASTING_REDIS__PREFIX=myapp:broadcast:
+    redis: dict[str, Any] = Field(
+        default_factory=lambda: {
+            "connection": None,
+            "prefix": "expanse:broadcast:",
+            "batch_size": 100,
+        }
+    )
+
+    model_config = SettingsConfigDict(
+        env_prefix="broadcasting_", env_nested_delimiter="__"
+    )
@@ -1,4 +1,5 @@
 from typing import Annotated
+from typing import Any
 
 from pydantic import Field
 from pydantic import field_validator
@@ -43,11 +44,157 @@ class Config(BaseSettings):
     # >>> HTTP_TRUSTED_HOSTS=example.com,*.example.com
     trusted_hosts: Annotated[list[str], NoDecode] = Field(default_factory=list)
 
+    # Route match cache size
+    #
+    # The maximum number of dynamic route matches, keyed by method and path, that
+    # should be kept in memory to avoid walking the routes tree for hot URLs.
+    # The cache is disabled when set to 0.
+    # Use the `HTTP_ROUTE_MATCH_CACHE_SIZE` environment variable to set this value in your `.env` file.
+    route_match_cache_size: int = 0
+
+    # Maximum body size
+    #
+    # The maximum size, in bytes, of the body of incoming requests.
+    # Requests exceeding it are rejected with a 413 Content Too Large response
+    # while the body is being read. There is no limit when not set.
+    # Use the `HTTP_MAX_BODY_SIZE` environment variable to set this value in your `.env` file.
+    max_body_size: int | None = None
+
+    # Compression encodings
+    #
+    # The content codings the CompressResponse middleware can use, by order of preference.
+    # Encodings that are not available in the current environment, like zstd, are ignored.
+    # Use the `HTTP_COMPRESSION_ENCODINGS` environment variable to set this value in your `.env` file.
+    # For instance:
+    # >>> HTTP_COMPRESSION_ENCODINGS=zstd,gzip
+    compression_encodings: Annotated[list[str], NoDecode] = Field(
+        default_factory=lambda: ["zstd", "gzip", "deflate"]
+    )
+
+    # Compression level
+    #
+    # The compression level to use, or the default level of each encoding when not set.
+    # Use the `HTTP_COMPRESSION_LEVEL` environment variable to set this value in your `.env` file.
+    compression_level: int | None = None
+
+    # Compression minimum size
+    #
+    # The minimum size, in bytes, a response body must have to be compressed.
+    # Streamed responses of unknown size are always compressed.
+    # Use the `HTTP_COMPRESSION_MIN_SIZE` environment variable to set this value in your `.env` file.
+    compression_min_size: int = 500
+
+    # Compressible content types
+    #
+    # The content types of the responses that should be compressed.
+    # Types ending with `/*`, like `text/*`, match every subtype.
+    # Use the `HTTP_COMPRESSION_CONTENT_TYPES` environment variable to set this value in your `.env` file.
+    # For instance:
+    # >>> HTTP_COMPRESSION_CONTENT_TYPES=text/*,application/json
+    compression_content_types: Annotated[list[str], NoDecode] = Field(
+        default_factory=lambda: [
+            "text/*",
+            "application/json",
+            "application/ld+json",
+            "application/problem+json",
+            "application/javascript",
+            "application/xml",
+            "application/xhtml+xml",
+            "application/rss+xml",
+            "application/atom+xml",
+            "application/manifest+json",
+            "application/wasm",
+            "image/svg+xml",
+        ]
+    )
+
+    # Response cache store
+    #
+    # The cache store used by the `CacheResponse` middleware, the default cache store when not set.
+    # Use the `HTTP_RESPONSE_CACHE_STORE` environment variable to set this value in your `.env` file.
+    response_cache_store: str | None = None
+
+    # Response cache TTL
+    #
+    # The number of seconds responses are cached for by the `CacheResponse` middleware
+    # when neither the responses nor their route specify it.
+    # Use the `HTTP_RESPONSE_CACHE_TTL` environment variable to set this value in your `.env` file.
+    response_cache_ttl: int = 60
+
+    # Response cache varying headers
+    #
+    # The request headers that cached responses depend on, for every route.
+    # Use the `HTTP_RESPONSE_CACHE_VARY` environment variable to set this value in your `.env` file.
+    # For instance:
+    # >>> HTTP_RESPONSE_CACHE_VARY=Accept,Accept-Language
+    response_cache_vary: Annotated[list[str], NoDecode] = Field(default_factory=list)
+
+    # Request coalescing timeout
+    #
+    # The maximum number of seconds a request waits for the response of an identical
+    # request being processed, when using the `CoalesceRequests` middleware.
+    # Use the `HTTP_COALESCING_TIMEOUT` environment variable to set this value in your `.env` file.
+    coalescing_timeout: float = 5.0
+
+    # Request coalescing varying headers
+    #
+    # The request headers that responses depend on when coalescing requests.
+    # Requests are only coalesced if these headers have the same values.
+    # Use the `HTTP_COALESCING_VARY` environment variable to set this value in your `.env` file.
+    # For instance:
+    # >>> HTTP_COALESCING_VARY=Authorization,Cookie,Accept-Language
+    coalescing_vary: Annotated[list[str], NoDecode] = Field(
+        default_factory=lambda: ["Authorization", "Cookie"]
+    )
+
+    # Rate limit store
+    #
+    # The cache store keeping the counters of the `ThrottleRequests` middleware,
+    # the default cache store when not set.
+    # Use the `HTTP_RATE_LIMIT_STORE` environment variable to set this value in your `.env` file.
+    rate_limit_store: str | None = None
+
+    # Rate limits
+    #
+    # The named rate limits applied by the `ThrottleRequests` middleware,
+    # as a maximum number of requests per window of seconds. Requests are counted
+    # by client IP address ("ip") or route ("route"). Limits counting requests
+    # by user must be defined with `RateLimiter.define()` and a callable returning
+    # the identifier of the authenticated user.
+    # They can all be defined with environment variables in your `.env` file.
+    # For instance:
+    # >>> HTTP_RATE_LIMITS__API__LIMIT=1000
+    # >>> HTTP_RATE_LIMITS__API__WINDOW=3600
+    # >>> HTTP_RATE_LIMITS__API__BY=route
+    rate_limits: dict[str, dict[str, Any]] = Field(
+        default_factory=lambda: {"default": {"limit": 60, "window": 60, "by": "ip"}}
+    )
+
+    # WebSocket keepalive
+    #
+    # The number of seconds between the "ping" messages sent to WebSocket clients,
+    # which must answer with a "pong" message within the timeout for their
+    # connection to be kept open. The client messages are then read by the keepalive,
+    # so connections are kept open even when the endpoints only send messages.
+    # Keepalive is disabled when the interval is not set.
+    # Use the `HTTP_WEBSOCKET_PING_INTERVAL` and `HTTP_WEBSOCKET_PING_TIMEOUT`
+    # environment variables to set these values in your `.env` file.
+    websocket_ping_interval: float | None = None
+    websocket_ping_timeout: float | None = 20.0
+
     model_config = SettingsConfigDict(env_prefix="http_", env_nested_delimiter="__")
 
-    @field_validator("trusted_proxies", mode="before")
+    @field_validator(
+        "trusted_proxies",
+        "trusted_hosts",
+        "compression_encodings",
+        "compression_content_types",
+        "response_cache_vary",
+        "coalescing_vary",
+        mode="before",
+    )
     @classmethod
-    def decode_proxies(cls, v: str | list[str]) -> list[str]:
+    def decode_lists(cls, v: str | list[str]) -> list[str]:
         if isinstance(v, list):
             return v
 
@@ -60,11 +207,3 @@ class Config(BaseSettings):
             return v
 
         return [TrustedHeader(header.lower().strip()) for header in v.split(",")]
-
-    @field_validator("trusted_hosts", mode="before")
-    @classmethod
-    def decode_hosts(cls, v: str | list[str]) -> list[str]:
-        if isinstance(v, list):
-            return v
-
-        return [v.strip() for v in v.split(",")]
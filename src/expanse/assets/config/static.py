@@ -11,4 +11,40 @@ class Config(BaseSettings):
     prefix: str = "/static"
     paths: list[Path] = Field(default=[Path("static")])
 
+    # Serve static files
+    #
+    # Whether the application should serve static files itself outside of debug mode.
+    # Static files are always served in debug mode.
+    # Use the `STATIC_SERVE` environment variable to set this value in your `.env` file.
+    serve: bool = False
+
+    # Cache-Control
+    #
+    # The Cache-Control header of static files served outside of debug mode.
+    # Use the `STATIC_CACHE_CONTROL` environment variable to set this value in your `.env` file.
+    cache_control: str | None = "public, max-age=86400"
+
+    # Immutable Cache-Control
+    #
+    # The Cache-Control header of the fingerprinted files produced by the `static build` command.
+    # Use the `STATIC_IMMUTABLE_CACHE_CONTROL` environment variable to set this value in your `.env` file.
+    immutable_cache_control: str | None = "public, max-age=31536000, immutable"
+
+    # Build path
+    #
+    # The directory where the `static build` command writes the fingerprinted files
+    # and their manifest. Once built, they are used outside of debug mode.
+    # Use the `STATIC_BUILD_PATH` environment variable to set this value in your `.env` file.
+    build_path: Path = Path("build/static")
+
+    # In-memory files
+    #
+    # The maximum size, in bytes, of the static files that should be kept in memory
+    # once read, and the total size, in bytes, that they can use.
+    # Files are always read from disk in debug mode.
+    # Use the `STATIC_MEMORY_FILE_SIZE` and `STATIC_MEMORY_SIZE` environment variables
+    # to set these values in your `.env` file.
+    memory_file_size: int = 64 * 1024
+    memory_size: int = 32 * 1024 * 1024
+
     model_config = SettingsConfigDict(env_prefix="static_")
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import fnmatch
+
+from abc import ABC
+from abc import abstractmethod
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+from typing import Any
+
+import anyio
+
+from expanse.broadcasting.subscription import Event
+from expanse.broadcasting.subscription import Subscription
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+def is_pattern(channel: str) -> bool:
+    """
+    Check whether a channel name is a glob-style pattern.
+    """
+    return any(char in channel for char in "*?[")
+
+
+def matches(channel: str, pattern: str) -> bool:
+    """
+    Check whether a channel matches a channel name or glob-style pattern.
+    """
+    return pattern == channel or (
+        is_pattern(pattern) and fnmatch.fnmatchcase(channel, pattern)
+    )
+
+
+class Broadcaster(ABC):
+    """
+    Deliver the events published on channels to their subscribers.
+
+    Subscribers listen to channel names or glob-style patterns,
+    like `chat:*`, and receive the matching events through their own
+    bounded queue.
+    """
+
+    def __init__(self, *, max_queue: int = 100) -> None:
+        self._max_queue: int = max_queue
+        self._subscriptions: dict[str, set[Subscription]] = {}
+
+    @abstractmethod
+    async def publish(self, channel: str, data: Any) -> None:
+        """
+        Publish an event on a channel.
+
+        :param channel: The name of the channel.
+        :param data: The data of the event.
+        """
+        ...
+
+    @asynccontextmanager
+    async def subscribe(
+        self, *patterns: str, max_queue: int | None = None
+    ) -> AsyncIterator[Subscription]:
+        """
+        Subscribe to the events published on the matching channels
+        for the duration of the context.
+
+        :param patterns: The names or glob-style patterns of the channels.
+        :param max_queue: The maximum number of pending events of the subscription.
+        """
+        subscription = Subscription(
+            patterns, self._max_queue if max_queue is None else max_queue
+        )
+
+        new_patterns: list[str] = []
+        for pattern in subscription.patterns:
+            if pattern not in self._subscriptions:
+                self._subscriptions[pattern] = set()
+                new_patterns.append(pattern)
+
+            self._subscriptions[pattern].add(subscription)
+
+        try:
+            if new_patterns:
+                await self._listen(new_patterns)
+
+            yield subscription
+        finally:
+            subscription.close()
+
+            unused_patterns: list[str] = []
+            for pattern in subscription.patterns:
+                subscriptions = self._subscriptions.get(pattern)
+                if subscriptions is None:
+                    continue
+
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[pattern]
+                    unused_patterns.append(pattern)
+
+            if unused_patterns:
+                # Subscriptions are usually left when their consumer is cancelled
+                with anyio.CancelScope(shield=True):
+                    await self._unlisten(unused_patterns)
+
+    async def close(self) -> None:
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                subscription.close()
+
+        self._subscriptions.clear()
+
+    async def _listen(self, patterns: list[str]) -> None:
+        """
+        Start receiving the events of the given patterns, which had no subscribers.
+        """
+        return
+
+    async def _unlisten(self, patterns: list[str]) -> None:
+        """
+        Stop receiving the events of the given patterns, which have no subscribers left.
+        """
+        return
+
+    def _dispatch(self, channel: str, data: Any, pattern: str | None = None) -> None:
+        """
+        Deliver an event to the subscribers of the given pattern,
+        or to the subscribers of all the patterns matching the channel.
+        """
+        event = Event(channel, data)
+
+        if pattern is not None:
+            for subscription in self._subscriptions.get(pattern, ()):
+                # Events matching several patterns of a subscription are dispatched
+                # once per pattern but only delivered for the first matching one.
+                if len(subscription.patterns) > 1:
+                    first = next(
+                        (p for p in subscription.patterns if matches(channel, p)), None
+                    )
+                    if first is not None and first != pattern:
+                        continue
+
+                subscription.put(event)
+
+            return
+
+        recipients: set[Subscription] = set()
+        for subscribed, subscriptions in self._subscriptions.items():
+            if matches(channel, subscribed):
+                recipients.update(subscriptions)
+
+        for subscription in recipients:
+            subscription.put(event)
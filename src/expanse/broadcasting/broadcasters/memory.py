@@ -0,0 +1,14 @@
+from typing import Any
+from typing import override
+
+from expanse.broadcasting.broadcaster import Broadcaster
+
+
+class MemoryBroadcaster(Broadcaster):
+    """
+    Deliver events to the subscribers of the current process only.
+    """
+
+    @override
+    async def publish(self, channel: str, data: Any) -> None:
+        self._dispatch(channel, data)
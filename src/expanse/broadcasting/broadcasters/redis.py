@@ -0,0 +1,179 @@
+import asyncio
+import logging
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import override
+
+import anyio
+import msgspec
+
+from expanse.broadcasting.broadcaster import Broadcaster
+from expanse.broadcasting.broadcaster import is_pattern
+from expanse.redis.asynchronous.connections.connection import Connection
+
+
+if TYPE_CHECKING:
+    from redis.asyncio.client import PubSub
+
+
+logger = logging.getLogger(__name__)
+
+
+class _Batch:
+    __slots__ = ("done", "error", "messages")
+
+    def __init__(self) -> None:
+        self.messages: list[tuple[str, bytes]] = []
+        self.done: asyncio.Event = asyncio.Event()
+        self.error: Exception | None = None
+
+
+class RedisBroadcaster(Broadcaster):
+    """
+    Deliver events to the subscribers of all the processes sharing a Redis server.
+
+    Events are encoded as JSON and published through Redis pub/sub.
+    Events published concurrently are sent in a single pipeline, and
+    each process holds a single Redis subscription per channel or pattern,
+    whatever the number of its local subscribers.
+    """
+
+    def __init__(
+        self,
+        publisher: Connection,
+        subscriber: Connection,
+        *,
+        prefix: str = "expanse:broadcast:",
+        batch_size: int = 100,
+        max_queue: int = 100,
+    ) -> None:
+        super().__init__(max_queue=max_queue)
+
+        self._publisher: Connection = publisher
+        self._subscriber: Connection = subscriber
+        self._prefix: str = prefix
+        self._batch_size: int = batch_size
+        self._batch: _Batch | None = None
+        self._pubsub: PubSub | None = None
+        self._listen_task: asyncio.Task[None] | None = None
+
+    @override
+    async def publish(self, channel: str, data: Any) -> None:
+        message = (self._prefix + channel, msgspec.json.encode(data))
+
+        batch = self._batch
+        if batch is not None and len(batch.messages) < self._batch_size:
+            batch.messages.append(message)
+            await batch.done.wait()
+
+            if batch.error is not None:
+                raise batch.error
+
+            return
+
+        batch = self._batch = _Batch()
+        batch.messages.append(message)
+
+        # The batch must be sent even if its first publisher is cancelled
+        with anyio.CancelScope(shield=True):
+            # Let the concurrent publishers add their events to the batch
+            await asyncio.sleep(0)
+
+            if self._batch is batch:
+                self._batch = None
+
+            try:
+                async with self._publisher.pipeline(transaction=False) as pipeline:
+                    for channel_name, payload in batch.messages:
+                        pipeline.publish(channel_name, payload)
+
+                    await pipeline.execute()
+            except Exception as e:
+                batch.error = e
+            finally:
+                batch.done.set()
+
+        if batch.error is not None:
+            raise batch.error
+
+    @override
+    async def close(self) -> None:
+        await super().close()
+
+        if self._listen_task is not None:
+            self._listen_task.cancel()
+            self._listen_task = None
+
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+
+        await self._subscriber.aclose()
+
+    @override
+    async def _listen(self, patterns: list[str]) -> None:
+        if self._pubsub is None:
+            self._pubsub = self._subscriber.pubsub()
+
+        channels = [self._prefix + p for p in patterns if not is_pattern(p)]
+        if channels:
+            await self._pubsub.subscribe(*channels)
+
+        globs = [self._prefix + p for p in patterns if is_pattern(p)]
+        if globs:
+            await self._pubsub.psubscribe(*globs)
+
+        if self._listen_task is None:
+            self._listen_task = asyncio.create_task(self._read(self._pubsub))
+
+    @override
+    async def _unlisten(self, patterns: list[str]) -> None:
+        if self._pubsub is None:
+            return
+
+        channels = [self._prefix + p for p in patterns if not is_pattern(p)]
+        if channels:
+            await self._pubsub.unsubscribe(*channels)
+
+        globs = [self._prefix + p for p in patterns if is_pattern(p)]
+        if globs:
+            await self._pubsub.punsubscribe(*globs)
+
+    async def _read(self, pubsub: "PubSub") -> None:
+        prefix_length = len(self._prefix)
+
+        while True:
+            try:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Error while listening for broadcast events")
+
+                await asyncio.sleep(1.0)
+
+                continue
+
+            if message is None:
+                continue
+
+            channel: str = message["channel"]
+            pattern: str | None = message.get("pattern")
+
+            try:
+                data = msgspec.json.decode(message["data"])
+            except msgspec.DecodeError:
+                logger.warning(
+                    "Received an invalid broadcast event", extra={"channel": channel}
+                )
+
+                continue
+
+            self._dispatch(
+                channel[prefix_length:],
+                data,
+                (pattern or channel)[prefix_length:],
+            )
@@ -0,0 +1,60 @@
+from collections.abc import AsyncGenerator
+from typing import Any
+
+from expanse.broadcasting.broadcaster import Broadcaster
+from expanse.broadcasting.exceptions import UnsupportedBroadcasterDriverError
+from expanse.configuration.config import Config
+from expanse.support.service_provider import ServiceProvider
+
+
+class BroadcastingServiceProvider(ServiceProvider):
+    async def register(self) -> None:
+        self._container.singleton(Broadcaster, self._create_broadcaster)
+
+    async def _create_broadcaster(
+        self, config: Config
+    ) -> AsyncGenerator[Broadcaster, None]:
+        broadcaster = await self._build_broadcaster(
+            config.get("broadcasting.driver", "memory"),
+            config.get("broadcasting.max_queue", 100),
+            config.get("broadcasting.redis", {}),
+        )
+
+        yield broadcaster
+
+        await broadcaster.close()
+
+    async def _build_broadcaster(
+        self, driver: str, max_queue: int, redis_config: dict[str, Any]
+    ) -> Broadcaster:
+        match driver:
+            case "memory":
+                from expanse.broadcasting.broadcasters.memory import MemoryBroadcaster
+
+                return MemoryBroadcaster(max_queue=max_queue)
+
+            case "redis":
+                from expanse.broadcasting.broadcasters.redis import RedisBroadcaster
+                from expanse.broadcasting.config.redis import RedisBroadcasterConfig
+                from expanse.redis.asynchronous.redis_manager import RedisManager
+
+                config = RedisBroadcasterConfig.model_validate(redis_config)
+
+                redis_manager = await self._container.get(RedisManager)
+                connection = (
+                    config.connection or redis_manager.get_default_connection_name()
+                )
+
+                return RedisBroadcaster(
+                    redis_manager.connection(connection),
+                    # Subscriptions hold their connection
+                    redis_manager.create_connection(connection),
+                    prefix=config.prefix,
+                    batch_size=config.batch_size,
+                    max_queue=max_queue,
+                )
+
+            case _:
+                raise UnsupportedBroadcasterDriverError(
+                    f"Unsupported broadcaster driver '{driver}'."
+                )
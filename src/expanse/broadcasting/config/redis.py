@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class RedisBroadcasterConfig(BaseModel):
+    # The Redis connection to use, the default one when not set.
+    connection: str | None = None
+
+    # The prefix of the Redis channels.
+    prefix: str = "expanse:broadcast:"
+
+    # The maximum number of events published in a single pipeline.
+    batch_size: int = 100
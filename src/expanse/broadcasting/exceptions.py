@@ -0,0 +1,4 @@
+class UnsupportedBroadcasterDriverError(Exception):
+    """
+    Raised when the broadcaster is configured with an unsupported driver.
+    """
@@ -0,0 +1,87 @@
+import asyncio
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+from typing import Self
+
+
+@dataclass(frozen=True, slots=True)
+class Event:
+    # The channel the event was published on.
+    channel: str
+    # The published data.
+    data: Any
+
+
+# Wakes up the consumer of a closed subscription.
+_CLOSED = object()
+
+
+class Subscription:
+    """
+    The events published on the channels matching a set of patterns.
+
+    Events are kept in a bounded queue until they are consumed. When the queue
+    is full, the oldest event is discarded so that a slow subscriber never
+    holds back the publishers nor the other subscribers.
+    """
+
+    __slots__ = ("_closed", "_patterns", "_queue", "dropped")
+
+    def __init__(self, patterns: Sequence[str], max_queue: int = 100) -> None:
+        self._patterns: tuple[str, ...] = tuple(patterns)
+        self._queue: asyncio.Queue[Any] = asyncio.Queue(max(1, max_queue))
+        self._closed: bool = False
+
+        # The number of events discarded because the queue was full.
+        self.dropped: int = 0
+
+    @property
+    def patterns(self) -> tuple[str, ...]:
+        return self._patterns
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def put(self, event: Event) -> None:
+        if self._closed:
+            return
+
+        self._make_room()
+        self._queue.put_nowait(event)
+
+    async def get(self) -> Event:
+        """
+        Wait for the next event.
+
+        :raise StopAsyncIteration: If the subscription is closed.
+        """
+        if self._closed and self._queue.empty():
+            raise StopAsyncIteration
+
+        event = await self._queue.get()
+        if event is _CLOSED:
+            raise StopAsyncIteration
+
+        return event
+
+    def close(self) -> None:
+        if self._closed:
+            return
+
+        self._closed = True
+        self._make_room()
+        self._queue.put_nowait(_CLOSED)
+
+    def _make_room(self) -> None:
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> Event:
+        return await self.get()
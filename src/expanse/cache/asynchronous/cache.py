@@ -21,6 +21,7 @@ from expanse.support._concurrency import sync_to_async
 
 
 if TYPE_CHECKING:
+    from expanse.cache.asynchronous.limiters.limiter import Limiter
     from expanse.contracts.lock.asynchronous.lock import Lock
 
 _T = TypeVar("_T")
@@ -283,6 +284,15 @@ class Cache(CacheContract):
         """
         return self._store.lock(name, ttl, owner, refresh)
 
+    @override
+    def limiter(self) -> "Limiter":
+        """
+        Get a rate limiter for the cache.
+
+        :return: A Limiter instance keeping its counters in the cache store.
+        """
+        return self._store.limiter()
+
     async def _compute(
         self,
         key: str,
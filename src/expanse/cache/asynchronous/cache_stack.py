@@ -24,6 +24,7 @@ from expanse.support._concurrency import sync_to_async
 
 
 if TYPE_CHECKING:
+    from expanse.cache.asynchronous.limiters.limiter import Limiter
     from expanse.contracts.cache.asynchronous.locker import Locker
     from expanse.contracts.lock.asynchronous.lock import Lock
 
@@ -270,6 +271,11 @@ class CacheStack(CacheContract):
     ) -> "Lock":
         return self._l2_store.lock(name, ttl, owner, refresh)
 
+    @override
+    def limiter(self) -> "Limiter":
+        # Counters must be shared, so they are kept in the L2 store
+        return self._l2_store.limiter()
+
     async def _on_cache_item_set(self, message: CacheItemSet) -> None:
         logger.debug(
             "Invalidating cache items",
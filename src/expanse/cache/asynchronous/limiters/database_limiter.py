@@ -0,0 +1,94 @@
+import pickle
+import time
+
+from typing import override
+
+from sqlalchemy import LargeBinary
+from sqlalchemy import String
+from sqlalchemy import TableClause
+from sqlalchemy import column
+from sqlalchemy import select
+from sqlalchemy import table
+from sqlalchemy.exc import IntegrityError
+
+from expanse.cache.asynchronous.limiters.limiter import Limiter
+from expanse.cache.config.database import DatabaseStoreConfig
+from expanse.database.asynchronous.database_manager import AsyncDatabaseManager
+
+
+class DatabaseLimiter(Limiter):
+    """
+    A limiter keeping its counters in the cache table.
+
+    Counters are stored like any other cache item, so they are incremented
+    by inserting them or by updating them only if they have not changed
+    since they were read, retrying when another process updated them first.
+    """
+
+    def __init__(
+        self,
+        config: DatabaseStoreConfig,
+        db: AsyncDatabaseManager,
+        max_retries: int = 5,
+    ) -> None:
+        self._config: DatabaseStoreConfig = config
+        self._db: AsyncDatabaseManager = db
+        self._table: TableClause = table(
+            self._config.table, column("key"), column("data"), column("expiration")
+        )
+        self._max_retries: int = max_retries
+
+    @override
+    async def _hit(self, key: str, index: int, window: int) -> tuple[int, int]:
+        current_key = self._window_key(key, index)
+        previous_key = self._window_key(key, index - 1)
+
+        async with self._db.connection(self._config.connection) as connection:
+            for _ in range(self._max_retries + 1):
+                rows: dict[str, bytes] = {}
+                for window_key, data in await connection.execute(
+                    select(column("key", String), column("data", LargeBinary))
+                    .select_from(self._table)
+                    .where(column("key").in_([current_key, previous_key]))
+                ):
+                    rows[window_key] = data
+
+                current = (
+                    pickle.loads(rows[current_key]) if current_key in rows else 0
+                ) + 1
+                previous = (
+                    pickle.loads(rows[previous_key]) if previous_key in rows else 0
+                )
+
+                try:
+                    if current_key not in rows:
+                        await connection.execute(
+                            self._table.insert().values(
+                                key=current_key,
+                                data=pickle.dumps(current),
+                                expiration=int(time.time()) + 2 * window,
+                            )
+                        )
+                        await connection.commit()
+
+                        return current, previous
+
+                    result = await connection.execute(
+                        self._table.update()
+                        .where(
+                            column("key") == current_key,
+                            column("data") == rows[current_key],
+                        )
+                        .values(data=pickle.dumps(current))
+                    )
+                    await connection.commit()
+                except IntegrityError:
+                    await connection.rollback()
+
+                    continue
+
+                if result.rowcount > 0:
+                    return current, previous
+
+        # Under heavy contention, the attempt is counted without being recorded
+        return current, previous
@@ -0,0 +1,79 @@
+import math
+import time
+
+from abc import ABC
+from abc import abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class Attempt:
+    # Whether the attempt is within the limit.
+    allowed: bool
+    # The maximum number of attempts per window.
+    limit: int
+    # The number of attempts left in the current window.
+    remaining: int
+    # The number of seconds until the next attempt is allowed if the attempt
+    # has been rejected, or until the current window ends otherwise.
+    reset: int
+
+
+class Limiter(ABC):
+    """
+    Limit the rate of attempts with a sliding window.
+
+    Attempts are counted in fixed windows, and the number of attempts
+    in the sliding window is estimated by weighting the count
+    of the previous window by how much it overlaps the sliding window.
+    Only two counters per key are thus needed, whatever the limit.
+    """
+
+    async def attempt(self, key: str, limit: int, window: int) -> Attempt:
+        """
+        Record an attempt for the given key.
+
+        :param key: The key to record the attempt for.
+        :param limit: The maximum number of attempts per window.
+        :param window: The duration of the window in seconds.
+
+        :return: The state of the limit after the attempt.
+        """
+        index, elapsed = divmod(time.time(), window)
+        current, previous = await self._hit(key, int(index), window)
+
+        weight = 1 - elapsed / window
+        count = previous * weight + current
+        if count <= limit:
+            return Attempt(
+                True,
+                limit,
+                max(0, math.floor(limit - count)),
+                max(1, math.ceil(window - elapsed)),
+            )
+
+        if current < limit and previous > 0:
+            # The next attempt is allowed once the previous window
+            # weighs little enough in the sliding window.
+            retry_after = window * (1 - (limit - current - 1) / previous) - elapsed
+        else:
+            # The current window will itself become the previous one
+            retry_after = window - elapsed + window * (1 - (limit - 1) / current)
+
+        return Attempt(False, limit, 0, max(1, math.ceil(retry_after)))
+
+    @abstractmethod
+    async def _hit(self, key: str, index: int, window: int) -> tuple[int, int]:
+        """
+        Increment the counter of a window.
+
+        :param key: The key to increment the counter for.
+        :param index: The index of the window since the epoch.
+        :param window: The duration of the window in seconds.
+
+        :return: The number of attempts in the window, including this one,
+                 and the number of attempts in the previous window.
+        """
+
+    def _window_key(self, key: str, index: int) -> str:
+        return f"limiter:{key}:{index}"
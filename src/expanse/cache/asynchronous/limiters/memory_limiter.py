@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import override
+
+from expanse.cache.asynchronous.limiters.limiter import Limiter
+
+
+if TYPE_CHECKING:
+    from expanse.cache.synchronous.stores.memory import MemoryStore as SyncMemoryStore
+
+
+class MemoryLimiter(Limiter):
+    """
+    A limiter keeping its counters in process memory.
+
+    Each key only holds the index of its latest window and the counters
+    of this window and of the previous one.
+    """
+
+    def __init__(self, sync_store: SyncMemoryStore, max_keys: int = 10000) -> None:
+        self._counters: dict[str, list[int]] = sync_store.counters
+        self._max_keys: int = max_keys
+
+    @override
+    async def _hit(self, key: str, index: int, window: int) -> tuple[int, int]:
+        counter = self._counters.get(key)
+        if counter is None:
+            if len(self._counters) >= self._max_keys:
+                self._prune(index)
+
+            counter = self._counters[key] = [index, 0, 0]
+        elif counter[0] != index:
+            previous = counter[1] if counter[0] == index - 1 else 0
+            counter[:] = [index, 0, previous]
+
+        counter[1] += 1
+
+        return counter[1], counter[2]
+
+    def _prune(self, index: int) -> None:
+        # Keys whose counters no longer matter are discarded first,
+        # then the least recently created ones.
+        for key, counter in list(self._counters.items()):
+            if counter[0] < index - 1:
+                del self._counters[key]
+
+        while len(self._counters) >= self._max_keys:
+            del self._counters[next(iter(self._counters))]
@@ -0,0 +1,48 @@
+from typing import TYPE_CHECKING
+from typing import cast
+from typing import override
+
+from expanse.cache.asynchronous.limiters.limiter import Limiter
+from expanse.redis.asynchronous.connections.connection import Connection
+
+
+if TYPE_CHECKING:
+    from redis.commands.core import AsyncScript
+
+
+_HIT_SCRIPT = """
+local current = redis.call("incr", KEYS[1])
+if current == 1 then
+    redis.call("expire", KEYS[1], ARGV[1])
+end
+local previous = redis.call("get", KEYS[2])
+return {current, tonumber(previous) or 0}
+"""
+
+
+class RedisLimiter(Limiter):
+    """
+    A limiter updating its counters atomically with a Lua script,
+    in a single round trip.
+    """
+
+    def __init__(self, connection: Connection) -> None:
+        self._connection: Connection = connection
+        self._hit_script: AsyncScript = self._connection.register_script(_HIT_SCRIPT)
+
+    @override
+    async def _hit(self, key: str, index: int, window: int) -> tuple[int, int]:
+        current, previous = cast(
+            "list[int]",
+            await self._hit_script(
+                keys=[self._window_key(key, index), self._window_key(key, index - 1)],
+                args=[2 * window],
+            ),
+        )
+
+        return int(current), int(previous)
+
+    @override
+    def _window_key(self, key: str, index: int) -> str:
+        # The hash tag keeps the counters of a key on the same cluster node
+        return f"limiter:{{{key}}}:{index}"
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import override
+
+from expanse.cache.asynchronous.limiters.limiter import Limiter
+
+
+if TYPE_CHECKING:
+    from expanse.contracts.cache.asynchronous.store import Store
+
+
+class StoreLimiter(Limiter):
+    """
+    A limiter relying on the basic operations of a store.
+
+    Counters are read and written separately, so concurrent attempts
+    from several processes might not all be counted.
+    """
+
+    def __init__(self, store: Store) -> None:
+        self._store: Store = store
+
+    @override
+    async def _hit(self, key: str, index: int, window: int) -> tuple[int, int]:
+        current_key = self._window_key(key, index)
+        previous_key = self._window_key(key, index - 1)
+        items = await self._store.get_many([current_key, previous_key])
+
+        current = (items[current_key].value or 0) + 1
+        await self._store.set(current_key, current, ttl=2 * window)
+
+        return current, items[previous_key].value or 0
@@ -21,6 +21,7 @@ from expanse.database.asynchronous.database_manager import AsyncDatabaseManager
 
 
 if TYPE_CHECKING:
+    from expanse.cache.asynchronous.limiters.limiter import Limiter
     from expanse.contracts.lock.asynchronous.lock import Lock
 
 
@@ -223,3 +224,9 @@ class DatabaseStore(Store):
             owner=owner,
             refresh=refresh,
         )
+
+    @override
+    def limiter(self) -> "Limiter":
+        from expanse.cache.asynchronous.limiters.database_limiter import DatabaseLimiter
+
+        return DatabaseLimiter(self._config, self._db)
@@ -8,6 +8,7 @@ from expanse.contracts.cache.cache_item import CacheItem
 
 
 if TYPE_CHECKING:
+    from expanse.cache.asynchronous.limiters.limiter import Limiter
     from expanse.contracts.lock.asynchronous.lock import Lock
 
 
@@ -54,3 +55,9 @@ class MemoryStore(Store):
         from expanse.cache.asynchronous.locks.memory_lock import MemoryLock
 
         return MemoryLock(self._sync_store, name, ttl, owner, refresh)
+
+    @override
+    def limiter(self) -> "Limiter":
+        from expanse.cache.asynchronous.limiters.memory_limiter import MemoryLimiter
+
+        return MemoryLimiter(self._sync_store)
@@ -11,6 +11,7 @@ from expanse.redis.asynchronous.redis_manager import RedisManager
 
 
 if TYPE_CHECKING:
+    from expanse.cache.asynchronous.limiters.redis_limiter import RedisLimiter
     from expanse.cache.asynchronous.locks.redis_lock import RedisLock
 
 
@@ -104,3 +105,9 @@ class RedisStore(Store):
         from expanse.cache.asynchronous.locks.redis_lock import RedisLock
 
         return RedisLock(self._lock_connection, name, ttl, owner=owner, refresh=refresh)
+
+    @override
+    def limiter(self) -> "RedisLimiter":
+        from expanse.cache.asynchronous.limiters.redis_limiter import RedisLimiter
+
+        return RedisLimiter(self._connection)
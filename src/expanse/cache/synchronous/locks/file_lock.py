@@ -7,6 +7,7 @@ from filelock import BaseFileLock as _BaseFileLock
 from filelock import FileLock as _FileLock
 
 from expanse.cache.synchronous.locks.lock import Lock
+from expanse.support.helpers import thread_sensitive
 
 
 class FileLock(Lock):
@@ -22,7 +23,10 @@ class FileLock(Lock):
 
         self._lock: _BaseFileLock = _FileLock(path)
 
+    # File locks are owned by the thread that acquired them,
+    # so they must be released from that same thread.
     @override
+    @thread_sensitive()
     def _do_acquire(self) -> bool:
         try:
             self._lock.acquire(blocking=False)
@@ -32,6 +36,7 @@ class FileLock(Lock):
             return False
 
     @override
+    @thread_sensitive()
     def _do_release(self, force: bool = False) -> bool:
         if force:
             try:
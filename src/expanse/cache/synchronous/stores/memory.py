@@ -26,6 +26,14 @@ class MemoryStore(Store):
             max_items=max_items, size_limit_in_bytes=max_size, default_ttl=default_ttl
         )
         self._locks: dict[str, dict[str, Any]] = {}
+        self._counters: dict[str, list[int]] = {}
+
+    @property
+    def counters(self) -> dict[str, list[int]]:
+        """
+        The rate limiting counters, shared by the limiters of the store.
+        """
+        return self._counters
 
     @override
     def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
@@ -73,6 +81,7 @@ class MemoryStore(Store):
     @override
     def clear(self) -> bool:
         self._cache.clear()
+        self._counters.clear()
 
         return True
 
@@ -12,6 +12,7 @@ from functools import partial
 from inspect import Parameter
 from inspect import isasyncgenfunction
 from inspect import isgeneratorfunction
+from types import MappingProxyType
 from typing import Annotated
 from typing import Any
 from typing import Self
@@ -22,6 +23,7 @@ from typing import get_origin
 from typing import overload
 
 from expanse.container.exceptions import ContainerException
+from expanse.container.exceptions import FrozenContainerException
 from expanse.container.exceptions import ResolutionException
 from expanse.container.exceptions import UnboundAbstractException
 from expanse.support._concurrency import AsyncRLock
@@ -42,6 +44,13 @@ logger = logging.getLogger(__name__)
 
 _Callback = Callable[..., None] | Callable[..., Awaitable[None]]
 
+# A compiled dependency slot: the parameter name, the abstract to resolve
+# (or None for a default value) and the default value.
+_Slot = tuple[str, str | type | None, Any]
+
+# A factory compiled by Container.freeze(), building a class with its slots.
+_Factory = Callable[["Container"], Awaitable[Any]]
+
 # inspect.signature() re-walks the MRO, unwraps partials/descriptors, and
 # rebuilds a Signature object from scratch every time it's called; for
 # functions and classes (registered once, at startup) that work never
@@ -195,16 +204,24 @@ class _Scoped(TypedDict):
     aliases: dict[str, str | type]
 
 
+def _display(abstract: Any) -> str:
+    if isinstance(abstract, type):
+        return f"{abstract.__module__}.{abstract.__qualname__}"
+
+    return str(abstract)
+
+
 class Container:
     __slots__ = (
         "_after_resolving_callbacks",
         "_aliases",
         "_bindings",
+        "_compiled",
+        "_frozen",
         "_instances",
-        "_lock",
+        "_locks",
         "_resolved",
         "_scoped",
-        "_scoped_bindings",
         "_terminating_callbacks",
     )
 
@@ -214,8 +231,6 @@ class Container:
         self._instances: dict[str | type, Any] = {}
         self._aliases: dict[str, str | type] = {}
 
-        self._scoped_bindings: dict[str | type, Any] = {}
-
         self._after_resolving_callbacks: dict[str | type, list[_Callback]] = (
             defaultdict(list)
         )
@@ -227,7 +242,11 @@ class Container:
         }
 
         self._terminating_callbacks: list[_Callback] = []
-        self._lock = AsyncRLock()
+        self._locks: dict[str | type, AsyncRLock] = {}
+
+        # Factories compiled by freeze(), keyed by the class they build
+        self._compiled: dict[Any, _Factory] = {}
+        self._frozen: bool = False
 
     def register(
         self,
@@ -237,19 +256,35 @@ class Container:
         cached: bool = False,
         scoped: bool = False,
     ) -> None:
+        if self._frozen and (
+            abstract in self._bindings
+            or abstract in self._scoped_registry()["bindings"]
+        ):
+            raise FrozenContainerException(
+                f"The [{_display(abstract)}] binding cannot be overridden "
+                "once the container has been frozen"
+            )
+
         if concrete is None:
             concrete = abstract
 
+        target = concrete
+
         if not isinstance(concrete, types.FunctionType | types.MethodType):
             concrete = self._concrete_closure(abstract, concrete)
 
         if scoped:
-            self._scoped["bindings"][abstract] = {
+            self._scoped_registry()["bindings"][abstract] = {
                 "concrete": concrete,
                 "cached": cached,
+                "target": target,
             }
         else:
-            self._bindings[abstract] = {"concrete": concrete, "cached": cached}
+            self._bindings[abstract] = {
+                "concrete": concrete,
+                "cached": cached,
+                "target": target,
+            }
 
     def singleton(
         self, abstract: type | str, concrete: Any = None, *, scoped: bool = False
@@ -277,6 +312,9 @@ class Container:
         if args is None:
             args = ()
 
+        if not args and (factory := self._compiled.get(concrete)) is not None:
+            return await factory(self), None
+
         function: Callable[..., Any]
         is_class: bool = False
         if isinstance(concrete, types.FunctionType):
@@ -393,7 +431,7 @@ class Container:
         return await sync_to_async(callable_, *positional, **keywords)
 
     def has_scoped_bindings(self) -> bool:
-        return bool(self._scoped["bindings"])
+        return bool(self._scoped_registry()["bindings"])
 
     def resolved(self, abstract: str | type) -> bool:
         abstract = self._get_alias(abstract)
@@ -409,9 +447,11 @@ class Container:
             actual_abstract, *_ = get_args(abstract)
 
         if self._is_scoped(abstract):
-            self._scoped["after_resolving_callbacks"][abstract].append(callback)
+            scoped_callbacks = self._scoped_registry()["after_resolving_callbacks"]
+            scoped_callbacks[abstract].append(callback)
         elif self._is_scoped(actual_abstract):
-            self._scoped["after_resolving_callbacks"][actual_abstract].append(callback)
+            scoped_callbacks = self._scoped_registry()["after_resolving_callbacks"]
+            scoped_callbacks[actual_abstract].append(callback)
         elif abstract in self._bindings:
             self._after_resolving_callbacks[abstract].append(callback)
         elif actual_abstract in self._bindings:
@@ -421,7 +461,7 @@ class Container:
 
     def terminating(self, callback: _Callback, scoped: bool = False) -> None:
         if scoped:
-            self._scoped["terminating_callbacks"].append(callback)
+            self._scoped_registry()["terminating_callbacks"].append(callback)
         else:
             self._terminating_callbacks.append(callback)
 
@@ -429,6 +469,40 @@ class Container:
         for callback in self._terminating_callbacks:
             await self.call(callback)
 
+    def freeze(self) -> None:
+        """
+        Compile the bindings of the container and validate its dependency graph.
+
+        Classes bound in the container, and the classes they depend on, are compiled
+        into factories with pre-resolved dependency slots. Missing bindings and
+        circular dependencies are all reported at once.
+
+        Existing bindings can no longer be overridden once the container is frozen
+        while bindings registered afterwards are resolved dynamically.
+        """
+        bindings = {**self._bindings, **self._scoped_registry()["bindings"]}
+        # Factories are only installed once the whole graph has been compiled
+        # so that a failure does not leave the container half-frozen.
+        compiled: dict[Any, _Factory] = {}
+        visited: set[Any] = set()
+        errors: list[str] = []
+
+        for abstract in bindings:
+            self._compile_abstract(abstract, bindings, compiled, [], visited, errors)
+
+        if errors:
+            raise ResolutionException(
+                "The container dependency graph is invalid:\n"
+                + "\n".join(f"  - {error}" for error in errors)
+            )
+
+        # Scoped containers share the compiled factories of their base container
+        self._compiled.update(compiled)
+        self._frozen = True
+
+    def is_frozen(self) -> bool:
+        return self._frozen
+
     def create_scoped_container(self) -> "ScopedContainer":
         container = ScopedContainer(self)
 
@@ -466,7 +540,28 @@ class Container:
     async def _resolve(self, abstract: str) -> Any: ...
 
     async def _resolve(self, abstract: str | type[T]) -> Any | T:
-        async with self._lock:
+        abstract = self._get_alias(abstract)
+
+        # Already built instances do not need any synchronization
+        try:
+            return self._instances[abstract]
+        except KeyError:
+            pass
+
+        actual_abstract: str | type = abstract
+        if get_origin(abstract) is Annotated:
+            actual_abstract, *_ = get_args(abstract)
+
+        # Only cached bindings must be built once: each of them gets its own lock
+        # so that different singletons can be built concurrently.
+        if not self._is_cached(actual_abstract):
+            return await self._do_resolve(abstract)
+
+        lock = self._locks.get(abstract)
+        if lock is None:
+            lock = self._locks[abstract] = AsyncRLock()
+
+        async with lock:
             return await self._do_resolve(abstract)
 
     @overload
@@ -512,7 +607,7 @@ class Container:
             obj = await self.get(concrete)
 
         if self._is_cached(actual_abstract):
-            self._instances[abstract] = obj
+            self.instance(abstract, obj)
 
         self._mark_as_resolved(actual_abstract)
         if terminating_callback is not None:
@@ -797,8 +892,11 @@ class Container:
             "cached", False
         )
 
+    def _scoped_registry(self) -> _Scoped:
+        return self._scoped
+
     def _is_scoped(self, abstract: str | type) -> bool:
-        return self._get_alias(abstract) in self._scoped["bindings"]
+        return self._get_alias(abstract) in self._scoped_registry()["bindings"]
 
     def _mark_as_resolved(self, abstract: str | type) -> None:
         self._resolved[abstract] = True
@@ -814,33 +912,312 @@ class Container:
             isinstance(callable, types.FunctionType) and callable.__name__ == "<lambda>"
         )
 
+    def _compile_abstract(
+        self,
+        abstract: Any,
+        bindings: dict[str | type, Any],
+        compiled: dict[Any, _Factory],
+        path: list[Any],
+        visited: set[Any],
+        errors: list[str],
+    ) -> None:
+        abstract = self._get_alias(abstract)
+
+        if abstract in path:
+            cycle = [*path[path.index(abstract) :], abstract]
+            errors.append(
+                "Circular dependency: " + " -> ".join(_display(a) for a in cycle)
+            )
+
+            return
+
+        if abstract in visited or abstract in self._instances:
+            return
+
+        visited.add(abstract)
+        path = [*path, abstract]
+        required_by = f" (required by {_display(path[-2])})" if len(path) > 1 else ""
+
+        actual_abstract: Any = abstract
+        if get_origin(abstract) is Annotated:
+            actual_abstract, *_ = get_args(abstract)
+
+        if actual_abstract in bindings:
+            target = bindings[actual_abstract]["target"]
+
+            if target == actual_abstract:
+                if isinstance(get_origin(target) or target, type):
+                    self._compile_class(
+                        target, bindings, compiled, path, visited, errors
+                    )
+            elif isinstance(target, types.FunctionType | types.MethodType):
+                # Factories are called as-is, only their dependencies are validated.
+                if not self._is_lambda(target):
+                    self._compile_signature(
+                        _cached_signature(target),
+                        getattr(target, "__globals__", None),
+                        bindings,
+                        compiled,
+                        path,
+                        visited,
+                        errors,
+                    )
+            else:
+                self._compile_abstract(
+                    target, bindings, compiled, path, visited, errors
+                )
+
+            return
+
+        if isinstance(actual_abstract, str):
+            errors.append(f"Unbound abstract [{actual_abstract}]{required_by}")
+
+            return
+
+        klass = get_origin(actual_abstract) or actual_abstract
+        if not isinstance(klass, type):
+            return
+
+        if inspect.isabstract(klass) or getattr(klass, "_is_protocol", False):
+            errors.append(f"Missing binding for [{_display(klass)}]{required_by}")
+
+            return
+
+        self._compile_class(actual_abstract, bindings, compiled, path, visited, errors)
+
+    def _compile_class(
+        self,
+        concrete: Any,
+        bindings: dict[str | type, Any],
+        compiled: dict[Any, _Factory],
+        path: list[Any],
+        visited: set[Any],
+        errors: list[str],
+    ) -> None:
+        klass = get_origin(concrete) or concrete
+        function = klass.__init__
+
+        if isinstance(function, types.WrapperDescriptorType):
+            compiled[concrete] = self._compiled_factory(klass, (), function)
+
+            return
+
+        try:
+            signature = _cached_signature(klass)
+        except (TypeError, ValueError):
+            # Classes without an introspectable signature are built dynamically
+            return
+
+        slots = self._compile_signature(
+            signature,
+            getattr(function, "__globals__", None),
+            bindings,
+            compiled,
+            path,
+            visited,
+            errors,
+        )
+
+        if slots is not None:
+            compiled[concrete] = self._compiled_factory(klass, slots, function)
+
+    def _compile_signature(
+        self,
+        signature: inspect.Signature,
+        _globals: dict[str, Any] | None,
+        bindings: dict[str | type, Any],
+        compiled: dict[Any, _Factory],
+        path: list[Any],
+        visited: set[Any],
+        errors: list[str],
+    ) -> tuple[_Slot, ...] | None:
+        """
+        Validate the dependencies of a signature and compile them into slots.
+
+        None is returned if the signature cannot be called
+        with pre-resolved keyword arguments only.
+        """
+        slots: list[_Slot] = []
+        compilable = True
+
+        for parameter in signature.parameters.values():
+            klass = _cached_class_for_parameter(parameter, _globals)
+
+            if parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD):
+                compilable = compilable and klass is None
+
+                continue
+
+            if klass is None:
+                if (
+                    parameter.kind == parameter.POSITIONAL_ONLY
+                    or parameter.default is parameter.empty
+                ):
+                    compilable = False
+                else:
+                    slots.append((parameter.name, None, parameter.default))
+
+                continue
+
+            if parameter.kind == parameter.POSITIONAL_ONLY:
+                compilable = False
+
+            if klass is Container:
+                slots.append((parameter.name, Container, None))
+
+                continue
+
+            dependency = self._get_alias(klass)
+            if isinstance(dependency, str) and dependency not in bindings:
+                # Unresolved forward references may still be provided
+                # at runtime, for instance as scoped instances.
+                compilable = False
+
+                continue
+
+            self._compile_abstract(
+                dependency, bindings, compiled, path, visited, errors
+            )
+            slots.append((parameter.name, dependency, None))
+
+        return tuple(slots) if compilable else None
+
+    def _compiled_factory(
+        self, klass: type, slots: tuple[_Slot, ...], function: Callable[..., Any]
+    ) -> Callable[["Container"], Awaitable[Any]]:
+        async def factory(container: Container) -> Any:
+            arguments: dict[str, Any] = {}
+
+            for name, dependency, default in slots:
+                if dependency is None:
+                    arguments[name] = default
+                elif dependency is Container:
+                    # Shortcut for the container itself, see _resolve_class()
+                    arguments[name] = container
+                else:
+                    try:
+                        arguments[name] = await container.get(dependency)
+                    except ContainerException as e:
+                        raise ResolutionException(
+                            f'Unable to resolve dependency with name "{name}" '
+                            f"(type: {_display(dependency)}) "
+                            f"in {function.__qualname__}"
+                        ) from e
+
+            return klass(**arguments)
+
+        return factory
+
+
+# Read-only placeholder shared by scoped containers until they need
+# a state of their own.
+_EMPTY_MAPPING: MappingProxyType[Any, Any] = MappingProxyType({})
+
 
 class ScopedContainer(Container):
-    __slots__ = ("_base_container",)
+    """
+    A container bound to a single scope, typically a request.
 
-    def __init__(self, base_container: Container):
-        super().__init__()
+    The scoped registry of the base container is shared as-is rather than copied:
+    the bindings, callbacks and resolved instances specific to the scope are only
+    allocated when they are first written.
+    """
 
+    __slots__ = ("_base_container", "_own_scoped")
+
+    def __init__(self, base_container: Container):
+        # The parent constructor is deliberately not called
+        # so that no per-scope state is allocated upfront.
         self._base_container = base_container
 
-        # Bind scoped bindings from the base container
-        self._bindings.update(
-            {k: {**v} for k, v in self._base_container._scoped["bindings"].items()}
-        )
+        base_scoped = base_container._scoped_registry()
+        self._bindings = base_scoped["bindings"]
+        self._terminating_callbacks = base_scoped["terminating_callbacks"]
+        self._after_resolving_callbacks = base_scoped["after_resolving_callbacks"]
+
+        self._compiled = base_container._compiled
+        self._frozen = False
+
+        self._instances = _EMPTY_MAPPING  # type: ignore[assignment]
+        self._resolved = _EMPTY_MAPPING  # type: ignore[assignment]
+        self._aliases = _EMPTY_MAPPING  # type: ignore[assignment]
+        # Scoped containers never build cached bindings themselves
+        self._locks = _EMPTY_MAPPING  # type: ignore[assignment]
+        # The scoped registry of the scope is only accessed through
+        # _scoped_registry(), which allocates it on first use.
+        self._scoped = _EMPTY_MAPPING  # type: ignore[assignment]
+        self._own_scoped: _Scoped | None = None
+
+    def _scoped_registry(self) -> _Scoped:
+        if self._own_scoped is None:
+            self._own_scoped = {
+                "bindings": {},
+                "terminating_callbacks": [],
+                "after_resolving_callbacks": defaultdict(list),
+                "aliases": {},
+            }
 
-        # Setup terminating callbacks
-        self._terminating_callbacks = [
-            *self._base_container._scoped["terminating_callbacks"]
-        ]
+        return self._own_scoped
 
-        # Setup resolving callbacks
-        self._after_resolving_callbacks = {
-            **self._base_container._scoped["after_resolving_callbacks"]
-        }
+    def register(
+        self,
+        abstract: type | str,
+        concrete: Any = None,
+        *,
+        cached: bool = False,
+        scoped: bool = False,
+    ) -> None:
+        base_bindings = self._base_container._scoped_registry()["bindings"]
+        if not scoped and self._bindings is base_bindings:
+            self._bindings = {**self._bindings}
+
+        super().register(abstract, concrete, cached=cached, scoped=scoped)
+
+    def instance(self, abstract: type | str, instance: Any) -> None:
+        if self._instances is _EMPTY_MAPPING:
+            self._instances = {}
+
+        super().instance(abstract, instance)
+
+    def alias(self, abstract: str | type, alias: str) -> None:
+        if self._aliases is _EMPTY_MAPPING:
+            self._aliases = {}
+
+        super().alias(abstract, alias)
+
+    def after_resolving(self, abstract: str | type, callback: _Callback) -> None:
+        base_scoped = self._base_container._scoped_registry()
+        base_callbacks = base_scoped["after_resolving_callbacks"]
+        if self._after_resolving_callbacks is base_callbacks:
+            self._after_resolving_callbacks = defaultdict(
+                list, {k: [*v] for k, v in base_callbacks.items()}
+            )
+
+        super().after_resolving(abstract, callback)
+
+    def terminating(self, callback: _Callback, scoped: bool = False) -> None:
+        base_scoped = self._base_container._scoped_registry()
+        base_callbacks = base_scoped["terminating_callbacks"]
+        if not scoped and self._terminating_callbacks is base_callbacks:
+            self._terminating_callbacks = [*base_callbacks]
+
+        super().terminating(callback, scoped=scoped)
 
     def bound(self, abstract: str | type) -> bool:
         return self._base_container.bound(abstract) or super().bound(abstract)
 
+    def has_scoped_bindings(self) -> bool:
+        return self._own_scoped is not None and bool(self._own_scoped["bindings"])
+
+    def _is_scoped(self, abstract: str | type) -> bool:
+        return self._own_scoped is not None and super()._is_scoped(abstract)
+
+    def _mark_as_resolved(self, abstract: str | type) -> None:
+        if self._resolved is _EMPTY_MAPPING:
+            self._resolved = {}
+
+        super()._mark_as_resolved(abstract)
+
     def _directly_bound(self, abstract: str | type) -> bool:
         return super().bound(abstract)
 
@@ -7,3 +7,7 @@ class ResolutionException(ContainerException):
 
 class UnboundAbstractException(ContainerException):
     pass
+
+
+class FrozenContainerException(ContainerException):
+    pass
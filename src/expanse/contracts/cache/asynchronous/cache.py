@@ -10,6 +10,7 @@ from typing import overload
 
 
 if TYPE_CHECKING:
+    from expanse.cache.asynchronous.limiters.limiter import Limiter
     from expanse.contracts.lock.asynchronous.lock import Lock
 
 
@@ -183,3 +184,11 @@ class Cache(ABC):
 
         :return: A Lock instance that can be used to synchronize access to the resource associated with the name.
         """
+
+    @abstractmethod
+    def limiter(self) -> "Limiter":
+        """
+        Get a rate limiter keeping its counters in the cache.
+
+        :return: A Limiter instance.
+        """
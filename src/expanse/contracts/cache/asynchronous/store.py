@@ -7,6 +7,7 @@ from expanse.contracts.cache.cache_item import CacheItem
 
 
 if TYPE_CHECKING:
+    from expanse.cache.asynchronous.limiters.limiter import Limiter
     from expanse.contracts.lock.asynchronous.lock import Lock
 
 
@@ -99,3 +100,16 @@ class Store(ABC):
 
         :return: A Lock instance for the given name.
         """
+
+    def limiter(self) -> "Limiter":
+        """
+        Get a rate limiter keeping its counters in the store.
+
+        Stores should override this method to provide a limiter
+        counting attempts atomically.
+
+        :return: A Limiter instance for the store.
+        """
+        from expanse.cache.asynchronous.limiters.store_limiter import StoreLimiter
+
+        return StoreLimiter(self)
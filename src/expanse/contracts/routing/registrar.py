@@ -107,6 +107,19 @@ class Registrar(ABC):
         """
         ...
 
+    @abstractmethod
+    def websocket(
+        self, path: str, endpoint: Endpoint, *, name: str | None = None
+    ) -> Route:
+        """
+        Register a new WebSocket route.
+
+        :param uri: The URI of the route.
+        :param endpoint: The route handler, receiving the WebSocket connection.
+        :param name: The name of the route.
+        """
+        ...
+
     @contextmanager
     def group(
         self,
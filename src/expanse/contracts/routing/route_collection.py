@@ -4,6 +4,7 @@ from collections.abc import Iterator
 
 from expanse.http.request import Request
 from expanse.routing.route import Route
+from expanse.routing.url_template import URLTemplate
 
 
 class RouteCollection(ABC):
@@ -33,6 +34,18 @@ class RouteCollection(ABC):
         """
         ...
 
+    def template(self, name: str) -> URLTemplate | None:
+        """
+        Retrieve the compiled URL template of a route by its name.
+
+        :param name: The name of the route.
+        """
+        route = self.find(name)
+        if route is None:
+            return None
+
+        return URLTemplate.compile(route.path)
+
     @abstractmethod
     def __iter__(self) -> Iterator[Route]:
         """
@@ -16,6 +16,7 @@ from expanse.core.application_builder import ApplicationBuilder
 from expanse.core.bootstrap.load_configuration import LoadConfiguration
 from expanse.core.bootstrap.load_environment_variables import LoadEnvironmentVariables
 from expanse.exceptions.handler import ExceptionHandler
+from expanse.support._concurrency import configure_thread_pool
 from expanse.support._utils import string_to_class
 
 
@@ -147,9 +148,14 @@ class Application:
         if self.is_booted():
             return
 
+        configure_thread_pool(self._config.get("app.thread_pool_size"))
+
         for service_provider in self._service_providers:
             await self._boot_provider(service_provider)
 
+        if self._config.get("app.freeze_container", False):
+            self._container.freeze()
+
         self._booted = True
 
     async def bootstrap(self) -> Self:
@@ -12,3 +12,17 @@ if TYPE_CHECKING:
 
 class Middleware(Protocol):
     async def handle(self, request: Request, next_call: RequestHandler) -> Response: ...
+
+
+def singleton[M: type](middleware: M) -> M:
+    """
+    Decorator to mark a middleware as a singleton.
+
+    Singleton middleware are resolved the first time they are needed and the same
+    instance is then reused for every subsequent request, instead of being resolved
+    from the request scoped container each time. As such, they must not depend
+    on request scoped services nor keep request-specific state.
+    """
+    setattr(middleware, "is_singleton", True)  # noqa: B010
+
+    return middleware
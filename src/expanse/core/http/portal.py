@@ -1,12 +1,18 @@
 from functools import partial
 from typing import Self
 
+import anyio
+
 from expanse.contracts.routing.router import Router
 from expanse.core.application import Application
 from expanse.core.http.middleware.middleware import Middleware
 from expanse.core.http.middleware.middleware_group import MiddlewareGroup
+from expanse.http.exceptions import WebSocketDisconnectedError
 from expanse.http.request import Request
 from expanse.http.response import Response
+from expanse.http.websocket import WebSocket
+from expanse.http.websocket import WebSocketState
+from expanse.routing.middleware_chain import MiddlewareChain
 from expanse.routing.pipeline import Pipeline
 from expanse.types import Receive
 from expanse.types import Scope
@@ -24,6 +30,7 @@ class Portal:
         self._router = router
         self._middleware: list[type[Middleware]] = []
         self._middleware_groups: dict[str, MiddlewareGroup] = {}
+        self._middleware_chain: MiddlewareChain | None = None
 
     async def handle(self, request: Request) -> Response:
         async with self._app.container.create_scoped_container() as container:
@@ -32,12 +39,7 @@ class Portal:
             try:
                 response = await (
                     Pipeline(container)
-                    .use(
-                        [
-                            (await container.get(middleware)).handle
-                            for middleware in self._middleware
-                        ]
-                    )
+                    .use(await self._get_middleware_chain().pipes(container))
                     .send(request)
                     .to(partial(self._router.handle, container))
                 )
@@ -59,9 +61,71 @@ class Portal:
 
             return response
 
+    async def handle_websocket(self, websocket: WebSocket) -> None:
+        """
+        Handle a WebSocket connection.
+
+        The global middleware only apply to HTTP requests, connections only go
+        through the middleware of their route before reaching the endpoint.
+        Connections that are not accepted by the endpoint are denied
+        with the returned response, and accepted ones are closed
+        once the endpoint returns.
+        """
+        async with self._app.container.create_scoped_container() as container:
+            container.instance(Request, websocket)
+            container.instance(WebSocket, websocket)
+
+            response: Response | None = None
+            error: Exception | None = None
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(websocket.keepalive, tg.cancel_scope)
+
+                try:
+                    response = await self._router.handle(container, websocket)
+                except Exception as e:
+                    error = e
+
+                tg.cancel_scope.cancel()
+
+            if isinstance(error, WebSocketDisconnectedError):
+                return
+
+            if error is not None:
+                from expanse.contracts.debug.exception_handler import ExceptionHandler
+
+                if not self._app.container.has(ExceptionHandler):
+                    raise error
+
+                exception_handler = await self._app.container.get(ExceptionHandler)
+
+                await exception_handler.report(error)
+
+                if websocket.state is not WebSocketState.CONNECTING:
+                    await websocket.close(1011)
+
+                    return
+
+                response = await exception_handler.render(websocket, error)
+
+            if response is None:
+                # The connection was closed by the keepalive
+                return
+
+            if websocket.state is WebSocketState.CONNECTING:
+                await response.prepare(websocket, container)
+                await websocket.deny(response)
+
+                return
+
+            # Errors raised by the endpoint are rendered by the route pipeline
+            await websocket.close(1011 if response.is_server_error() else 1000)
+
     def set_middleware(self, middleware: list[type[Middleware]]) -> Self:
         self._middleware = middleware
 
+        self._middleware_chain = None
+
         self._configure_router()
 
         return self
@@ -70,6 +134,8 @@ class Portal:
         if middleware not in self._middleware:
             self._middleware.insert(0, middleware)
 
+        self._middleware_chain = None
+
         self._configure_router()
 
         return self
@@ -78,6 +144,8 @@ class Portal:
         if middleware not in self._middleware:
             self._middleware.append(middleware)
 
+        self._middleware_chain = None
+
         self._configure_router()
 
         return self
@@ -89,12 +157,35 @@ class Portal:
 
         return self
 
+    def _get_middleware_chain(self) -> MiddlewareChain:
+        if self._middleware_chain is None:
+            self._middleware_chain = MiddlewareChain(self._middleware)
+
+        return self._middleware_chain
+
     def _configure_router(self) -> None:
         for name, group in self._middleware_groups.items():
             self._router.middleware_group(name, group.middleware)
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        request = Request(scope, receive, send)
+        if scope["type"] == "websocket":
+            config = self._app.config
+
+            await self.handle_websocket(
+                WebSocket(
+                    scope,
+                    receive,
+                    send,
+                    ping_interval=config.get("http.websocket_ping_interval"),
+                    ping_timeout=config.get("http.websocket_ping_timeout", 20.0),
+                )
+            )
+
+            return
+
+        request = Request(scope, receive, send).set_max_body_size(
+            self._app.config.get("http.max_body_size")
+        )
 
         response = await self.handle(request)
 
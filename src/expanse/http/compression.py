@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import zlib
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from typing import Protocol
+
+from expanse.http.accept_header import AcceptHeader
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Sequence
+
+
+class StreamCompressor(Protocol):
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compress a chunk of data and flush what can be decoded by the client.
+        """
+        ...
+
+    def finish(self) -> bytes:
+        """
+        Terminate the compressed stream.
+        """
+        ...
+
+
+class _ZlibCompressor:
+    __slots__ = ("_compressor",)
+
+    def __init__(self, level: int, wbits: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, wbits)
+
+    def compress(self, data: bytes) -> bytes:
+        # Flushing after every chunk keeps streamed responses responsive
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class ContentEncoding:
+    """
+    An HTTP content coding, like gzip or deflate.
+    """
+
+    __slots__ = ("_compress", "_factory", "default_level", "name")
+
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[[int], StreamCompressor],
+        compress: Callable[[bytes, int], bytes],
+        default_level: int,
+    ) -> None:
+        self.name: str = name
+        self.default_level: int = default_level
+        self._factory: Callable[[int], StreamCompressor] = factory
+        self._compress: Callable[[bytes, int], bytes] = compress
+
+    def compressor(self, level: int | None = None) -> StreamCompressor:
+        """
+        Create a compressor for incremental, streamed, compression.
+        """
+        return self._factory(self.default_level if level is None else level)
+
+    def compress(self, data: bytes, level: int | None = None) -> bytes:
+        """
+        Compress a complete body in one shot.
+        """
+        return self._compress(data, self.default_level if level is None else level)
+
+
+ENCODINGS: dict[str, ContentEncoding] = {
+    "gzip": ContentEncoding(
+        "gzip",
+        lambda level: _ZlibCompressor(level, 31),
+        lambda data, level: zlib.compress(data, level, wbits=31),
+        6,
+    ),
+    "deflate": ContentEncoding(
+        "deflate",
+        lambda level: _ZlibCompressor(level, 15),
+        lambda data, level: zlib.compress(data, level, wbits=15),
+        6,
+    ),
+}
+
+try:
+    from compression import zstd  # type: ignore[import-not-found]
+
+    class _ZstdCompressor:
+        __slots__ = ("_compressor",)
+
+        def __init__(self, level: int) -> None:
+            self._compressor = zstd.ZstdCompressor(level=level)
+
+        def compress(self, data: bytes) -> bytes:
+            return self._compressor.compress(data, zstd.ZstdCompressor.FLUSH_BLOCK)
+
+        def finish(self) -> bytes:
+            return self._compressor.flush(zstd.ZstdCompressor.FLUSH_FRAME)
+
+    ENCODINGS["zstd"] = ContentEncoding(
+        "zstd", _ZstdCompressor, lambda data, level: zstd.compress(data, level), 3
+    )
+except ImportError:
+    try:
+        import zstandard  # type: ignore[import-not-found]
+
+        class _ZstandardCompressor:
+            __slots__ = ("_compressor",)
+
+            def __init__(self, level: int) -> None:
+                self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+            def compress(self, data: bytes) -> bytes:
+                return self._compressor.compress(data) + self._compressor.flush(
+                    zstandard.COMPRESSOBJ_FLUSH_BLOCK
+                )
+
+            def finish(self) -> bytes:
+                return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+        ENCODINGS["zstd"] = ContentEncoding(
+            "zstd",
+            _ZstandardCompressor,
+            lambda data, level: zstandard.ZstdCompressor(level=level).compress(data),
+            3,
+        )
+    except ImportError:
+        pass
+
+
+@lru_cache(maxsize=256)
+def negotiate_encoding(
+    accept_encoding: str, encodings: tuple[str, ...] = tuple(ENCODINGS)
+) -> str | None:
+    """
+    Select the content coding to use for the given Accept-Encoding header.
+
+    The coding with the highest quality is selected. Ties are resolved
+    by following the order of the given encodings.
+
+    :param accept_encoding: The value of the Accept-Encoding header.
+    :param encodings: The supported encodings, by order of preference.
+    """
+    if not accept_encoding:
+        return None
+
+    qualities: dict[str, float] = {}
+    for item in AcceptHeader.from_string(accept_encoding.lower()).all():
+        qualities.setdefault(item.value, item.quality)
+
+    wildcard = qualities.get("*", 0.0)
+    selected: str | None = None
+    selected_quality = 0.0
+    for encoding in encodings:
+        quality = qualities.get(encoding, wildcard)
+        if quality > selected_quality:
+            selected, selected_quality = encoding, quality
+
+    return selected
+
+
+class Compression:
+    """
+    The compression negotiated for a response.
+
+    Whether the response is actually compressed is decided when it is prepared,
+    once its content type and size are known.
+    """
+
+    __slots__ = ("content_types", "encoding", "level", "min_size")
+
+    def __init__(
+        self,
+        encoding: ContentEncoding,
+        *,
+        level: int | None = None,
+        min_size: int = 0,
+        content_types: Sequence[str] = ("*/*",),
+    ) -> None:
+        self.encoding: ContentEncoding = encoding
+        self.level: int | None = level
+        self.min_size: int = min_size
+        self.content_types: tuple[str, ...] = tuple(
+            content_type.lower() for content_type in content_types
+        )
+
+    def applies_to(self, content_type: str | None, size: int | None) -> bool:
+        """
+        Check whether a response should be compressed.
+
+        :param content_type: The content type of the response.
+        :param size: The size of the response body, if known.
+        """
+        if size is not None and size < self.min_size:
+            return False
+
+        media_type = (content_type or "").split(";", 1)[0].strip().lower()
+        if not media_type:
+            return False
+
+        for allowed in self.content_types:
+            if allowed == "*/*" or allowed == media_type:
+                return True
+
+            if allowed.endswith("/*") and media_type.startswith(allowed[:-1]):
+                return True
+
+        return False
+
+    def compressor(self) -> StreamCompressor:
+        return self.encoding.compressor(self.level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self.encoding.compress(data, self.level)
+
+
+__all__ = [
+    "ENCODINGS",
+    "Compression",
+    "ContentEncoding",
+    "StreamCompressor",
+    "negotiate_encoding",
+]
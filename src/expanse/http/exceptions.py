@@ -39,3 +39,30 @@ class NoUploadFileFoundError(HTTPException):
         super().__init__(
             status_code=400, detail=message or "No upload file found in the request"
         )
+
+
+class ContentTooLargeError(HTTPException):
+    def __init__(self, message: str | None = None) -> None:
+        super().__init__(status_code=413, detail=message or "Content Too Large")
+
+
+class PreconditionFailedError(HTTPException):
+    def __init__(self, message: str | None = None) -> None:
+        super().__init__(status_code=412, detail=message or "Precondition Failed")
+
+
+class TooManyRequestsError(HTTPException):
+    def __init__(
+        self, message: str | None = None, headers: dict[str, str] | None = None
+    ) -> None:
+        super().__init__(
+            status_code=429, detail=message or "Too Many Requests", headers=headers
+        )
+
+
+class WebSocketDisconnectedError(ClientDisconnectedError):
+    def __init__(self, code: int = 1000, reason: str | None = None) -> None:
+        super().__init__(f"WebSocket disconnected with code {code}")
+
+        self.code: int = code
+        self.reason: str | None = reason
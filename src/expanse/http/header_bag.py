@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from collections.abc import Mapping
 from collections.abc import MutableMapping
 from typing import Literal
@@ -129,3 +130,132 @@ class HeaderBag(MutableMapping[str, str]):
             )
             + "\r\n"
         )
+
+
+class RawHeaderBag(HeaderBag):
+    """
+    A header bag backed by raw ASGI headers.
+
+    Headers are only decoded when they are looked up and lookups are memoized,
+    so requests only pay for the headers they actually access. Repeated headers
+    are kept as multiple values, the last one being returned by single-value
+    lookups. The full mapping is built on first iteration or modification.
+    """
+
+    __slots__ = ("_materialized", "_raw")
+
+    def __init__(self, raw: list[tuple[bytes, bytes]]) -> None:
+        super().__init__()
+
+        self._raw: list[tuple[bytes, bytes]] = raw
+        self._materialized: bool = False
+
+    @overload
+    def all(self, key: str) -> list[str | None]: ...
+
+    @overload
+    def all(self, key: Literal[None] = None) -> dict[str, list[str | None]]: ...
+
+    def all(
+        self, key: str | None = None
+    ) -> list[str | None] | dict[str, list[str | None]]:
+        if self._materialized:
+            return super().all(key)
+
+        if key is None:
+            self._materialize()
+
+            return self._headers
+
+        name = self._normalize_name(key)
+        if name not in self._headers:
+            raw_name = name.encode("latin-1")
+            # Misses are memoized as well until the bag is materialized
+            self._headers[name] = [
+                value.decode("latin-1")
+                for header_name, value in self._raw
+                if header_name.lower() == raw_name
+            ]
+
+        return self._headers[name]
+
+    @overload
+    def get(self, key: str, /) -> str | None: ...
+
+    @overload
+    def get(self, key: str, /, default: str | T) -> str | T: ...
+
+    def get(self, key: str, /, default: str | T | None = None) -> str | T | None:
+        headers = self.all(key)
+
+        if not headers:
+            return default
+
+        return headers[-1]
+
+    def set(
+        self, name: str, value: str | list[str | None] | None, replace: bool = True
+    ) -> None:
+        self._materialize()
+
+        super().set(name, value, replace=replace)
+
+    def has(self, name: str) -> bool:
+        return bool(self.all(name))
+
+    def remove(self, name: str) -> None:
+        self._materialize()
+
+        super().remove(name)
+
+    def encode(self) -> list[tuple[bytes, bytes]]:
+        self._materialize()
+
+        return super().encode()
+
+    def _materialize(self) -> None:
+        if self._materialized:
+            return
+
+        headers: dict[str, list[str | None]] = {}
+        for name, value in self._raw:
+            headers.setdefault(name.decode("latin-1").lower(), []).append(
+                value.decode("latin-1")
+            )
+
+        self._headers = headers
+        self._materialized = True
+
+    def __getitem__(self, name: str) -> str:
+        values = self.all(name)
+        if not values:
+            raise KeyError(f"Header '{self._normalize_name(name)}' not found.")
+
+        value = values[-1]
+
+        assert isinstance(value, str)
+
+        return value
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self.has(name)
+
+    def __iter__(self) -> Iterator[str]:
+        self._materialize()
+
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        self._materialize()
+
+        return super().__len__()
+
+    def __repr__(self) -> str:
+        self._materialize()
+
+        return f"RawHeaderBag({self._headers})"
+
+    def __str__(self) -> str:
+        self._materialize()
+
+        return super().__str__()
@@ -17,6 +17,8 @@ if TYPE_CHECKING:
     from collections.abc import MutableMapping
     from os import PathLike
 
+    from expanse.http.responses.event_stream import EventSource
+    from expanse.http.responses.event_stream import EventStreamResponse
     from expanse.http.responses.view import ViewResponse
 
 
@@ -117,6 +119,27 @@ def download(
     )
 
 
+def sse(
+    events: EventSource,
+    *,
+    headers: Mapping[str, str] | None = None,
+    heartbeat: float | None = 15.0,
+    retry: int | None = None,
+    max_queue: int = 64,
+    policy: Literal["block", "drop"] = "block",
+) -> EventStreamResponse:
+    from expanse.http.responses.event_stream import EventStreamResponse
+
+    return EventStreamResponse(
+        events,
+        headers=headers,
+        heartbeat=heartbeat,
+        retry=retry,
+        max_queue=max_queue,
+        policy=policy,
+    )
+
+
 def redirect(
     status_code: int = 302, *, headers: Mapping[str, Any] | None = None
 ) -> RedirectResponse:
@@ -142,4 +165,4 @@ def view(
     )
 
 
-__all__ = ["abort", "file_", "json", "redirect", "view"]
+__all__ = ["abort", "file_", "json", "redirect", "sse", "view"]
@@ -4,6 +4,7 @@ from expanse.contracts.storage.synchronous.storage_manager import (
 )
 from expanse.http._datastructures import RawUploadFile
 from expanse.http.exceptions import NoUploadFileFoundError
+from expanse.http.rate_limiter import RateLimiter
 from expanse.http.request import Request
 from expanse.http.response_adapter import ResponseAdapter
 from expanse.http.upload_file import UploadFile
@@ -13,6 +14,7 @@ from expanse.support.service_provider import ServiceProvider
 class HTTPServiceProvider(ServiceProvider):
     async def register(self) -> None:
         self._container.singleton(ResponseAdapter)
+        self._container.singleton(RateLimiter)
         self._container.scoped(UploadFile, self._retrieve_upload_file)
 
     async def _retrieve_upload_file(
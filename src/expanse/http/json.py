@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 from typing import Annotated
+from typing import Any
 from typing import Self
 from typing import TypeVar
 
@@ -13,6 +14,7 @@ from pydantic import BaseModel
 T = TypeVar("T", bound=BaseModel | msgspec.Struct)
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from typing import Union
 
     JSON = Union[T, T]  # noqa: UP007
@@ -21,3 +23,31 @@ else:
     class JSON:
         def __class_getitem__(cls, item: type[T]) -> Annotated[type[T], type[Self]]:
             return Annotated[item, cls]
+
+
+# Decoders are cached in a mapping rather than with functools.cache
+# whose Hashable parameter type rejects model classes.
+_decoders: dict[type[Any], Callable[[bytes | str], Any]] = {}
+
+
+def json_decoder[M: BaseModel | msgspec.Struct](
+    model: type[M],
+) -> Callable[[bytes | str], M]:
+    """
+    Retrieve the function decoding raw JSON documents into the given model.
+
+    The decoder is built once per model and validates the document while decoding
+    it, without materializing intermediate Python objects.
+    """
+    decoder = _decoders.get(model)
+    if decoder is not None:
+        return decoder
+
+    if issubclass(model, BaseModel):
+        decoder = model.model_validate_json
+    else:
+        decoder = msgspec.json.Decoder(model, strict=False).decode
+
+    _decoders[model] = decoder
+
+    return decoder
@@ -0,0 +1,54 @@
+from expanse.core.application import Application
+from expanse.core.http.middleware.middleware import Middleware
+from expanse.core.http.middleware.middleware import singleton
+from expanse.http.request import Request
+from expanse.http.response import Response
+from expanse.http.response_cache import ResponseCache
+from expanse.types.http.middleware import RequestHandler
+
+
+@singleton
+class CacheResponse(Middleware):
+    """
+    Serve the responses of safe requests from the cache.
+
+    Only successful responses that do not set cookies are stored, for as long as
+    their Cache-Control header allows it, falling back to the TTL of the route
+    or the configured default TTL. Requests carrying credentials, in an
+    Authorization header or in cookies, always reach the endpoint.
+    """
+
+    def __init__(self, app: Application, cache: ResponseCache) -> None:
+        self._app = app
+        self._cache = cache
+
+    async def handle(self, request: Request, next_call: RequestHandler) -> Response:
+        headers = request.headers
+        if (
+            request.method not in ("GET", "HEAD")
+            # Responses to requests carrying credentials, like session cookies,
+            # might be specific to a user so they are never cached.
+            or headers.has("Authorization")
+            or headers.has("Cookie")
+        ):
+            return await next_call(request)
+
+        config = self._app.config
+        ttl: int | None = config.get("http.response_cache_ttl", 60)
+        vary: list[str] = list(config.get("http.response_cache_vary", []))
+
+        route = request.route
+        if route is not None and (options := route.response_cache) is not None:
+            if options.ttl is not None:
+                ttl = options.ttl
+
+            vary.extend(options.vary)
+
+        if (response := await self._cache.get(request, vary)) is not None:
+            return response
+
+        response = await next_call(request)
+
+        await self._cache.put(request, response, ttl, vary)
+
+        return response
@@ -0,0 +1,85 @@
+import asyncio
+
+from dataclasses import dataclass
+
+from expanse.core.application import Application
+from expanse.core.http.middleware.middleware import Middleware
+from expanse.core.http.middleware.middleware import singleton
+from expanse.http.request import Request
+from expanse.http.response import Response
+from expanse.http.utils.snapshots import ResponseSnapshot
+from expanse.http.utils.snapshots import request_fingerprint
+from expanse.http.utils.snapshots import restore_response
+from expanse.http.utils.snapshots import snapshot_response
+from expanse.types.http.middleware import RequestHandler
+
+
+@dataclass(frozen=True, slots=True)
+class CoalescingOptions:
+    # The maximum number of seconds to wait for the response of an identical request.
+    timeout: float | None = None
+    # The request headers the responses depend on.
+    vary: tuple[str, ...] = ()
+
+
+@singleton
+class CoalesceRequests(Middleware):
+    """
+    Collapse identical concurrent requests into a single call to the endpoint.
+
+    The first request, the leader, goes through while identical requests arriving
+    before it completes wait for its response, whose rendered body is shared
+    with all of them. Requests waiting for longer than the configured timeout,
+    or whose leader failed or produced a response that cannot be shared,
+    go through on their own.
+    """
+
+    def __init__(self, app: Application) -> None:
+        self._app = app
+        self._in_flight: dict[str, asyncio.Future[ResponseSnapshot | None]] = {}
+
+    async def handle(self, request: Request, next_call: RequestHandler) -> Response:
+        if request.method not in ("GET", "HEAD"):
+            return await next_call(request)
+
+        config = self._app.config
+        timeout: float | None = config.get("http.coalescing_timeout", 5.0)
+        vary: list[str] = list(
+            config.get("http.coalescing_vary", ["Authorization", "Cookie"])
+        )
+
+        route = request.route
+        if route is not None and (options := route.coalescing) is not None:
+            if options.timeout is not None:
+                timeout = options.timeout
+
+            vary.extend(options.vary)
+
+        key = request_fingerprint(request, vary)
+
+        if (leader := self._in_flight.get(key)) is not None:
+            try:
+                # The leader must not be cancelled if this request times out
+                snapshot = await asyncio.wait_for(asyncio.shield(leader), timeout)
+            except TimeoutError:
+                snapshot = None
+
+            if snapshot is not None:
+                return restore_response(snapshot)
+
+            return await next_call(request)
+
+        future: asyncio.Future[ResponseSnapshot | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._in_flight[key] = future
+        snapshot = None
+
+        try:
+            response = await next_call(request)
+            snapshot = await snapshot_response(response)
+
+            return response
+        finally:
+            del self._in_flight[key]
+            future.set_result(snapshot)
@@ -0,0 +1,60 @@
+from expanse.core.application import Application
+from expanse.core.http.middleware.middleware import Middleware
+from expanse.core.http.middleware.middleware import singleton
+from expanse.http.compression import ENCODINGS
+from expanse.http.compression import Compression
+from expanse.http.compression import negotiate_encoding
+from expanse.http.request import Request
+from expanse.http.response import Response
+from expanse.types.http.middleware import RequestHandler
+
+
+@singleton
+class CompressResponse(Middleware):
+    """
+    Compress responses with the best content coding accepted by the client.
+
+    Buffered responses are compressed in one shot while streamed and file
+    responses are compressed incrementally as they are sent.
+    """
+
+    def __init__(self, app: Application) -> None:
+        self._app = app
+
+    async def handle(self, request: Request, next_call: RequestHandler) -> Response:
+        response = await next_call(request)
+
+        if response.headers.has("Content-Encoding"):
+            # The response has already been encoded
+            return response
+
+        self.vary_header(response)
+
+        # The defaults of these settings are defined by the HTTP configuration
+        config = self._app.config
+        encoding = negotiate_encoding(
+            request.headers.get("Accept-Encoding", ""),
+            tuple(
+                encoding
+                for encoding in config["http.compression_encodings"]
+                if encoding in ENCODINGS
+            ),
+        )
+
+        if encoding is None:
+            return response
+
+        return response.with_compression(
+            Compression(
+                ENCODINGS[encoding],
+                level=config["http.compression_level"],
+                min_size=config["http.compression_min_size"],
+                content_types=config["http.compression_content_types"],
+            )
+        )
+
+    def vary_header(self, response: Response) -> None:
+        if "Vary" not in response.headers:
+            response.headers["Vary"] = "Accept-Encoding"
+        elif "accept-encoding" not in response.headers["Vary"].lower():
+            response.headers["Vary"] += ", Accept-Encoding"
@@ -1,8 +1,10 @@
+from expanse.core.http.middleware.middleware import singleton
 from expanse.http.request import Request
 from expanse.http.responses.response import Response
 from expanse.types.http.middleware import RequestHandler
 
 
+@singleton
 class PreferJsonResponse:
     async def handle(self, request: Request, next_call: RequestHandler) -> Response:
         accept = request.headers.get("accept")
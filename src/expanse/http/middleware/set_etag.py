@@ -0,0 +1,21 @@
+from expanse.core.http.middleware.middleware import singleton
+from expanse.http.request import Request
+from expanse.http.response import Response
+from expanse.types.http.middleware import RequestHandler
+
+
+@singleton
+class SetETag:
+    """
+    Tag the responses to GET and HEAD requests with a strong entity tag computed
+    from their body, so that clients revalidating them receive a 304 Not Modified
+    response if the body did not change.
+    """
+
+    async def handle(self, request: Request, next_call: RequestHandler) -> Response:
+        response = await next_call(request)
+
+        if request.method in ("GET", "HEAD") and not response.headers.has("ETag"):
+            response.with_etag()
+
+        return response
@@ -0,0 +1,59 @@
+from expanse.core.application import Application
+from expanse.core.http.middleware.middleware import Middleware
+from expanse.core.http.middleware.middleware import singleton
+from expanse.http.exceptions import TooManyRequestsError
+from expanse.http.rate_limiter import RateLimiter
+from expanse.http.request import Request
+from expanse.http.response import Response
+from expanse.types.http.middleware import RequestHandler
+
+
+@singleton
+class ThrottleRequests(Middleware):
+    """
+    Reject requests exceeding the rate limits of their route.
+
+    Routes use the limits given to Route.throttle(), or the `default` limit.
+    Responses carry the `RateLimit-Limit`, `RateLimit-Remaining` and
+    `RateLimit-Reset` headers of the most restrictive limit, and rejected
+    requests get a 429 response with a `Retry-After` header.
+    """
+
+    def __init__(self, app: Application, limiter: RateLimiter) -> None:
+        self._app = app
+        self._limiter = limiter
+
+    async def handle(self, request: Request, next_call: RequestHandler) -> Response:
+        names: tuple[str, ...] = ("default",)
+        route = request.route
+        if route is not None and route.rate_limits:
+            names = route.rate_limits
+
+        headers: dict[str, str] = {}
+        remaining: int | None = None
+        for name in names:
+            attempt = await self._limiter.attempt(request, name)
+            if not attempt.allowed:
+                raise TooManyRequestsError(
+                    headers={
+                        "RateLimit-Limit": str(attempt.limit),
+                        "RateLimit-Remaining": "0",
+                        "RateLimit-Reset": str(attempt.reset),
+                        "Retry-After": str(attempt.reset),
+                    }
+                )
+
+            if remaining is None or attempt.remaining < remaining:
+                remaining = attempt.remaining
+                headers = {
+                    "RateLimit-Limit": str(attempt.limit),
+                    "RateLimit-Remaining": str(attempt.remaining),
+                    "RateLimit-Reset": str(attempt.reset),
+                }
+
+        response = await next_call(request)
+
+        for header, value in headers.items():
+            response.headers[header] = value
+
+        return response
@@ -1,13 +1,17 @@
 from expanse.core.application import Application
 from expanse.core.http.middleware.middleware import Middleware
+from expanse.core.http.middleware.middleware import singleton
 from expanse.http.request import Request
 from expanse.http.response import Response
+from expanse.http.trust import HostPolicy
 from expanse.types.http.middleware import RequestHandler
 
 
+@singleton
 class TrustHosts(Middleware):
     def __init__(self, app: Application) -> None:
         self._app = app
+        self._policy: HostPolicy | None = None
 
     async def handle(self, request: Request, next_call: RequestHandler) -> Response:
         await self.set_trusted_hosts(request)
@@ -24,7 +28,11 @@ class TrustHosts(Middleware):
             # If debug mode is enabled, we only trust local hosts
             trusted_hosts = [".localhost", "127.0.0.1", "::1"]
 
-        request.set_trusted_hosts(trusted_hosts)
+        # The policy is only compiled again if the configuration changes
+        if self._policy is None or self._policy.hosts != trusted_hosts:
+            self._policy = HostPolicy(trusted_hosts)
+
+        request.set_trusted_hosts(self._policy)
 
     def should_trust_hosts(self) -> bool:
         return self._app.environment == "test"
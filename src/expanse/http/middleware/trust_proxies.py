@@ -1,7 +1,9 @@
 from expanse.core.application import Application
 from expanse.core.http.middleware.middleware import Middleware
+from expanse.core.http.middleware.middleware import singleton
 from expanse.http.request import Request
 from expanse.http.response import Response
+from expanse.http.trust import ProxyPolicy
 from expanse.http.trusted_header import TrustedHeader
 from expanse.types.http.middleware import RequestHandler
 
@@ -14,9 +16,12 @@ _DEFAULT_TRUSTED_HEADERS: list[str] = [
 ]
 
 
+@singleton
 class TrustProxies(Middleware):
     def __init__(self, app: Application) -> None:
         self._app = app
+        self._policy: ProxyPolicy | None = None
+        self._trusted_headers: tuple[list[str], list[TrustedHeader]] | None = None
 
     async def handle(self, request: Request, next_call: RequestHandler) -> Response:
         await self.set_trusted_proxies(request)
@@ -27,18 +32,28 @@ class TrustProxies(Middleware):
         trusted_proxies: list[str] | None = self._app.config.get("http.trusted_proxies")
 
         if trusted_proxies:
-            if "*" in trusted_proxies and request.client.host:
-                # Trust the calling ip address
-                request.set_trusted_proxies([request.client.host])
-            else:
-                request.set_trusted_proxies(trusted_proxies)
+            request.set_trusted_proxies(self._get_policy(trusted_proxies))
 
         trusted_headers: list[str] | None = self._app.config.get("http.trusted_headers")
 
         if trusted_headers is None:
-            trusted_headers = _DEFAULT_TRUSTED_HEADERS.copy()
+            trusted_headers = _DEFAULT_TRUSTED_HEADERS
 
         if trusted_headers:
-            request.set_trusted_headers(
-                [TrustedHeader(header.lower()) for header in trusted_headers]
+            request.set_trusted_headers(self._get_trusted_headers(trusted_headers))
+
+    def _get_policy(self, trusted_proxies: list[str]) -> ProxyPolicy:
+        # The policy is only compiled again if the configuration changes
+        if self._policy is None or self._policy.proxies != trusted_proxies:
+            self._policy = ProxyPolicy(trusted_proxies)
+
+        return self._policy
+
+    def _get_trusted_headers(self, trusted_headers: list[str]) -> list[TrustedHeader]:
+        if self._trusted_headers is None or self._trusted_headers[0] != trusted_headers:
+            self._trusted_headers = (
+                list(trusted_headers),
+                [TrustedHeader(header.lower()) for header in trusted_headers],
             )
+
+        return self._trusted_headers[1]
@@ -0,0 +1,152 @@
+import time
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Any
+
+from expanse.cache.asynchronous.cache_manager import CacheManager
+from expanse.cache.asynchronous.limiters.limiter import Attempt
+from expanse.configuration.config import Config
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from expanse.cache.asynchronous.limiters.limiter import Limiter
+    from expanse.http.request import Request
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimit:
+    # The maximum number of requests per window.
+    limit: int
+    # The duration of the window in seconds.
+    window: int = 60
+    # What requests are counted by: the client IP address ("ip"),
+    # the route ("route"), or a callable returning the key of a request,
+    # like the identifier of the authenticated user. Requests without a key
+    # are counted by IP address.
+    by: "str | Callable[[Request], str | None]" = "ip"
+
+
+class RateLimiter:
+    """
+    Limit the rate of requests with named limits.
+
+    The limits are defined in the `http.rate_limits` configuration or
+    with the `define()` method. Their counters are kept in a cache store,
+    and the keys known to be exhausted are also remembered locally
+    until they are replenished, so that subsequent requests for these keys
+    are rejected without reaching the store.
+    """
+
+    # The maximum number of exhausted keys remembered locally.
+    max_exhausted_keys: int = 10000
+
+    def __init__(self, manager: CacheManager, config: Config) -> None:
+        self._manager: CacheManager = manager
+        self._config: Config = config
+        self._limits: dict[str, RateLimit] = {}
+        self._limiter: Limiter | None = None
+        # The exhausted keys with the monotonic time they are replenished at
+        self._exhausted: dict[str, tuple[float, int]] = {}
+
+    def define(
+        self,
+        name: str,
+        limit: int,
+        window: int = 60,
+        *,
+        by: "str | Callable[[Request], str | None]" = "ip",
+    ) -> None:
+        """
+        Define a named rate limit.
+
+        :param name: The name of the limit.
+        :param limit: The maximum number of requests per window.
+        :param window: The duration of the window in seconds.
+        :param by: What requests are counted by.
+        """
+        self._limits[name] = RateLimit(limit, window, by)
+
+    def get(self, name: str) -> RateLimit:
+        """
+        Retrieve a named rate limit.
+
+        :param name: The name of the limit.
+        """
+        if (rate_limit := self._limits.get(name)) is not None:
+            return rate_limit
+
+        limits: dict[str, dict[str, Any]] = self._config.get("http.rate_limits", {})
+        if name not in limits:
+            raise ValueError(f"Rate limit {name} is not defined")
+
+        rate_limit = self._limits[name] = RateLimit(**limits[name])
+
+        return rate_limit
+
+    async def attempt(self, request: "Request", name: str) -> Attempt:
+        """
+        Record a request against a named rate limit.
+
+        :param request: The request to record.
+        :param name: The name of the limit.
+
+        :return: The state of the limit for the request.
+        """
+        rate_limit = self.get(name)
+        key = self._key(request, name, rate_limit)
+
+        now = time.monotonic()
+        if (exhausted := self._exhausted.get(key)) is not None:
+            until, limit = exhausted
+            if until > now:
+                return Attempt(False, limit, 0, max(1, round(until - now)))
+
+            del self._exhausted[key]
+
+        limiter = await self.limiter()
+        attempt = await limiter.attempt(key, rate_limit.limit, rate_limit.window)
+        if not attempt.allowed:
+            self._remember_exhausted(key, now + attempt.reset, attempt.limit)
+
+        return attempt
+
+    async def limiter(self) -> "Limiter":
+        if self._limiter is None:
+            cache = await self._manager.cache(self._config.get("http.rate_limit_store"))
+            self._limiter = cache.limiter()
+
+        return self._limiter
+
+    def _key(self, request: "Request", name: str, rate_limit: RateLimit) -> str:
+        by = rate_limit.by
+        if callable(by):
+            # The key is prefixed so that it cannot collide with an IP address
+            key = by(request)
+            discriminator = f"key:{key}" if key is not None else request.ip
+        elif by == "ip":
+            discriminator = request.ip
+        elif by == "route":
+            route = request.route
+            discriminator = (route.name or route.path) if route is not None else None
+        else:
+            raise ValueError(f"Invalid rate limit key {by}")
+
+        return f"http:throttle:{name}:{discriminator or ''}"
+
+    def _remember_exhausted(self, key: str, until: float, limit: int) -> None:
+        if len(self._exhausted) >= self.max_exhausted_keys:
+            now = time.monotonic()
+            for exhausted_key, (exhausted_until, _) in list(self._exhausted.items()):
+                if exhausted_until <= now:
+                    del self._exhausted[exhausted_key]
+
+            while len(self._exhausted) >= self.max_exhausted_keys:
+                del self._exhausted[next(iter(self._exhausted))]
+
+        self._exhausted[key] = (until, limit)
+
+
+__all__ = ["RateLimit", "RateLimiter"]
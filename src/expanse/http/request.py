@@ -6,6 +6,7 @@ import re
 
 from datetime import UTC
 from datetime import datetime
+from email.utils import format_datetime
 from email.utils import parsedate_to_datetime
 from http import cookies as http_cookies
 from typing import TYPE_CHECKING
@@ -18,6 +19,8 @@ import msgspec
 from baize.asgi import empty_receive
 from baize.asgi import empty_send
 from baize.multipart_helper import parse_async_stream
+from pydantic import BaseModel
+from pydantic import ValidationError
 
 from expanse.http._datastructures import Address
 from expanse.http._datastructures import ContentType
@@ -27,13 +30,21 @@ from expanse.http._datastructures import RawUploadFile
 from expanse.http.accept_header import AcceptHeader
 from expanse.http.exceptions import ClientDisconnectedError
 from expanse.http.exceptions import ConflictingForwardedHeadersError
+from expanse.http.exceptions import ContentTooLargeError
 from expanse.http.exceptions import MalformedJSONError
 from expanse.http.exceptions import MalformedMultipartError
+from expanse.http.exceptions import PreconditionFailedError
 from expanse.http.exceptions import SuspiciousOperationError
 from expanse.http.exceptions import UnsupportedContentTypeError
 from expanse.http.header_bag import HeaderBag
+from expanse.http.header_bag import RawHeaderBag
+from expanse.http.json import json_decoder
+from expanse.http.trust import HostPolicy
+from expanse.http.trust import ProxyPolicy
 from expanse.http.trusted_header import TrustedHeader
 from expanse.http.url import URL
+from expanse.http.utils.conditional import evaluate_preconditions
+from expanse.http.utils.conditional import format_etag
 from expanse.support._utils import cached_property
 
 
@@ -43,12 +54,18 @@ if TYPE_CHECKING:
 
     from expanse.routing.route import Route
     from expanse.session.session import HTTPSession
+    from expanse.types import HTTPScope
     from expanse.types import PartialScope
     from expanse.types import Receive
     from expanse.types import Scope
     from expanse.types import Send
 
 
+_PORT_REGEX = re.compile(r":\d+$")
+_HOST_REGEX = re.compile(r"^[a-zA-Z0-9._-]+$")
+_NO_PROXIES = ProxyPolicy([])
+_ANY_HOST = HostPolicy(["*"])
+
 FORWARDED_PARAMS = {
     TrustedHeader.X_FORWARDED_FOR: "for",
     TrustedHeader.X_FORWARDED_HOST: "host",
@@ -66,18 +83,23 @@ class Request:
         self._send: Send = send
         self._route: Route | None = None
         self._session: HTTPSession | None = None
-        self._trusted_proxies: list[str] = []
+        self._proxy_policy: ProxyPolicy = _NO_PROXIES
         self._trusted_headers: list[TrustedHeader] = []
-        self._trusted_hosts: list[str] = ["*"]
+        self._host_policy: HostPolicy = _ANY_HOST
         self._url: URL = URL.from_scope(scope)
         self._stream_consumed: bool = False
         self._is_disconnected: bool = False
         self._preferred_format: str | None = None
+        self._max_body_size: int | None = None
         self.path_params: dict[str, Any] = {}
 
     @cached_property
     def method(self) -> str:
-        return self._scope["method"]
+        scope = self._scope
+        if scope["type"] == "websocket":
+            return "WEBSOCKET"
+
+        return scope["method"]
 
     @cached_property
     def content_type(self) -> ContentType:
@@ -157,14 +179,25 @@ class Request:
     def url(self) -> URL:
         return self._url.replace(scheme=self.scheme, hostname=self.http_host, port=None)
 
+    @property
+    def extensions(self) -> dict[str, dict[object, object]]:
+        """
+        The ASGI extensions supported by the server.
+        """
+        return self._scope.get("extensions") or {}
+
+    @property
+    def spec_version(self) -> tuple[int, ...]:
+        """
+        The version of the ASGI HTTP spec implemented by the server.
+        """
+        asgi = self._scope.get("asgi") or {}
+
+        return tuple(int(part) for part in asgi.get("spec_version", "2.0").split("."))
+
     @cached_property
     def headers(self) -> HeaderBag:
-        return HeaderBag(
-            {
-                key.decode("latin-1").lower(): value.decode("latin-1")
-                for key, value in self._scope.get("headers", [])
-            }
-        )
+        return RawHeaderBag(self._scope.get("headers", []))
 
     @cached_property
     def host(self) -> str:
@@ -182,27 +215,12 @@ class Request:
         else:
             host = self.headers["Host"]
 
-        host = re.sub(r":\d+$", "", host).lower()
+        host = _PORT_REGEX.sub("", host).lower()
 
         if host and not self._validate_host(host):
             raise SuspiciousOperationError(f"Invalid host header: '{host}'")
 
-        is_trusted: bool = False
-        for trusted_host in self._trusted_hosts:
-            if trusted_host.startswith("."):
-                # Check if the host ends with the trusted host
-                if host.endswith(trusted_host[1:]):
-                    is_trusted = True
-                    break
-            elif host == trusted_host:
-                is_trusted = True
-                break
-            elif trusted_host == "*":
-                # If the trusted host is "*", we trust any host
-                is_trusted = True
-                break
-
-        if not is_trusted:
+        if not self._host_policy.trusts(host):
             # If the host is not trusted, we should not return it
             raise SuspiciousOperationError(f"Host '{host}' is not trusted")
 
@@ -315,13 +333,16 @@ class Request:
 
         return self._url.scheme == "https"
 
-    def set_trusted_proxies(self, trusted_proxies: list[str]) -> Self:
+    def set_trusted_proxies(self, trusted_proxies: list[str] | ProxyPolicy) -> Self:
         """
         Set trusted proxies for the request.
 
-        :param trusted_proxies: List of trusted proxies.
+        :param trusted_proxies: List of trusted proxies or a precompiled policy.
         """
-        self._trusted_proxies = trusted_proxies
+        if not isinstance(trusted_proxies, ProxyPolicy):
+            trusted_proxies = ProxyPolicy(trusted_proxies)
+
+        self._proxy_policy = trusted_proxies
 
         return self
 
@@ -335,27 +356,29 @@ class Request:
 
         return self
 
-    def set_trusted_hosts(self, trusted_hosts: list[str]) -> Self:
+    def set_trusted_hosts(self, trusted_hosts: list[str] | HostPolicy) -> Self:
         """
         Set trusted hosts for the request.
 
-        :param trusted_hosts: List of trusted hosts.
+        :param trusted_hosts: List of trusted hosts or a precompiled policy.
         """
-        self._trusted_hosts = trusted_hosts
+        if not isinstance(trusted_hosts, HostPolicy):
+            trusted_hosts = HostPolicy(trusted_hosts)
+
+        self._host_policy = trusted_hosts
 
         return self
 
-    def is_from_trusted_proxy(self) -> bool:
-        if not self._trusted_proxies:
-            return False
+    @property
+    def _trusted_proxies(self) -> list[str]:
+        return self._proxy_policy.proxies
 
-        if not self.client.host:
-            return False
+    @property
+    def _trusted_hosts(self) -> list[str]:
+        return self._host_policy.hosts
 
-        return any(
-            ipaddress.ip_address(self.client.host) in ipaddress.ip_network(proxy)
-            for proxy in self._trusted_proxies
-        )
+    def is_from_trusted_proxy(self) -> bool:
+        return self._proxy_policy.trusts(self.client.host)
 
     def is_header_trusted(self, header: TrustedHeader) -> bool:
         """
@@ -419,6 +442,34 @@ class Request:
     def is_pjax(self) -> bool:
         return self.headers.get("X-PJAX") == "true"
 
+    def check_preconditions(
+        self, etag: str | None = None, last_modified: datetime | None = None
+    ) -> None:
+        """
+        Evaluate the conditional headers of the request against the current
+        state of the targeted resource.
+
+        Responses only evaluate the preconditions of GET and HEAD requests,
+        once the endpoint has run, so endpoints handling unsafe methods, like PUT,
+        PATCH or DELETE, must call this before modifying the resource.
+
+        :param etag: The current entity tag of the resource, if any.
+        :param last_modified: The date the resource was last modified, if known.
+
+        :raise PreconditionFailedError: If a precondition is not met (mapped to a 412 Precondition Failed).
+        """
+        status_code = evaluate_preconditions(
+            self,
+            format_etag(etag) if etag is not None else None,
+            format_datetime(last_modified, usegmt=True)
+            if last_modified is not None
+            else None,
+        )
+
+        # Safe requests that are not modified are answered when the response is prepared
+        if status_code == 412:
+            raise PreconditionFailedError()
+
     def set_route(self, route: Route) -> Self:
         self._route = route
 
@@ -429,6 +480,16 @@ class Request:
 
         return self
 
+    def set_max_body_size(self, size: int | None) -> Self:
+        """
+        Limit the size of the request body, in bytes.
+
+        :param size: The maximum size of the body or None for no limit.
+        """
+        self._max_body_size = size
+
+        return self
+
     async def input(self, name: str, default: Any = None) -> Any:
         """
         Retrieve an input item from the request.
@@ -461,12 +522,26 @@ class Request:
         if self._stream_consumed:
             raise RuntimeError("Request stream has already been consumed.")
 
+        max_size = self._max_body_size
+        if (
+            max_size is not None
+            and self.content_length is not None
+            and self.content_length > max_size
+        ):
+            raise ContentTooLargeError()
+
         self._stream_consumed = True
+        size = 0
         while True:
             message = await self._receive()
             if message["type"] == "http.request":
                 body = message.get("body", b"")
                 if body:
+                    size += len(body)
+                    # The declared length cannot be trusted
+                    if max_size is not None and size > max_size:
+                        raise ContentTooLargeError()
+
                     yield body
                 if not message.get("more_body", False):
                     break
@@ -489,16 +564,50 @@ class Request:
         :raise MalformedJSONError: If the JSON is malformed (mapped to a 400 Bad Request).
         :raise UnsupportedContentTypeError: If the content type is not JSON (mapped to a 415 Unsupported Media Type).
         """
-        if self.is_json():
-            data = await self.body
-            try:
-                return msgspec.json.decode(
-                    data.decode(self.content_type.options.get("charset", "utf8"))
-                )
-            except msgspec.DecodeError as exc:
-                raise MalformedJSONError(str(exc)) from None
+        try:
+            return msgspec.json.decode(await self._json_body())
+        except msgspec.DecodeError as exc:
+            raise MalformedJSONError(str(exc)) from None
+
+    async def decode_json[M: BaseModel | msgspec.Struct](self, model: type[M]) -> M:
+        """
+        Decode the request body as JSON directly into the given model.
+
+        The raw body is validated and decoded in a single pass,
+        without building the intermediate JSON object.
+
+        :param model: The pydantic model or msgspec struct to decode into.
+
+        :raise MalformedJSONError: If the JSON is malformed (mapped to a 400 Bad Request).
+        :raise UnsupportedContentTypeError: If the content type is not JSON (mapped to a 415 Unsupported Media Type).
+        """
+        data = await self._json_body()
+
+        try:
+            return json_decoder(model)(data)
+        except msgspec.ValidationError:
+            raise
+        except msgspec.DecodeError as exc:
+            raise MalformedJSONError(str(exc)) from None
+        except ValidationError as exc:
+            errors = exc.errors()
+            if errors and errors[0]["type"] == "json_invalid":
+                raise MalformedJSONError(errors[0]["msg"]) from None
+
+            raise
+
+    async def _json_body(self) -> bytes | str:
+        if not self.is_json():
+            raise UnsupportedContentTypeError("application/json")
+
+        data = await self.body
+
+        charset = self.content_type.options.get("charset", "utf8")
+        if charset.lower().replace("-", "") == "utf8":
+            # UTF-8 documents are decoded from the raw bytes directly
+            return data
 
-        raise UnsupportedContentTypeError("application/json")
+        return data.decode(charset)
 
     async def _parse_multipart(self, boundary: bytes, charset: str) -> FormData:
         return FormData(
@@ -558,7 +667,7 @@ class Request:
             b"Accept": b"text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             b"Accept-Language": b"en-us,en;q=0.5",
         }
-        base_scope: Scope = {
+        base_scope: HTTPScope = {
             "type": "http",
             "asgi": {
                 "version": "3.0",
@@ -580,10 +689,10 @@ class Request:
             base_scope.update(scope)
 
         headers = base_scope["headers"]
-        header_names = {header[0] for header in headers}
+        header_names = {header[0].lower() for header in headers}
 
         for default_header in default_headers:
-            if default_header not in header_names:
+            if default_header.lower() not in header_names:
                 headers.append((default_header, default_headers[default_header]))
 
         url = URL(raw_url)
@@ -689,7 +798,7 @@ class Request:
             except ValueError:
                 return False
 
-        return bool(re.match(r"^[a-zA-Z0-9._-]+$", host))
+        return _HOST_REGEX.match(host) is not None
 
 
 __all__ = ["Request"]
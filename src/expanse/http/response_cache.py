@@ -0,0 +1,181 @@
+import secrets
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Any
+
+from expanse.cache.asynchronous.cache_manager import CacheManager
+from expanse.configuration.config import Config
+from expanse.http.response import Response
+from expanse.http.utils.snapshots import ResponseSnapshot
+from expanse.http.utils.snapshots import request_fingerprint
+from expanse.http.utils.snapshots import restore_response
+from expanse.http.utils.snapshots import snapshot_response
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from expanse.contracts.cache.asynchronous.cache import Cache
+    from expanse.http.request import Request
+
+
+@dataclass(frozen=True, slots=True)
+class ResponseCacheOptions:
+    # The number of seconds responses are cached for, when the responses
+    # themselves do not specify it.
+    ttl: int | None = None
+    # The request headers the responses depend on.
+    vary: tuple[str, ...] = ()
+
+
+def response_ttl(cache_control: str | None, default: int | None) -> int | None:
+    """
+    Determine how long a response can be stored by a shared cache.
+
+    :param cache_control: The Cache-Control header of the response.
+    :param default: The number of seconds to use when the header does not specify it.
+
+    :return: The number of seconds, or None if the response must not be stored.
+    """
+    if not cache_control:
+        return default
+
+    directives: dict[str, str | None] = {}
+    for directive in cache_control.lower().split(","):
+        name, _, argument = directive.strip().partition("=")
+        directives[name] = argument.strip('"') or None
+
+    if "no-store" in directives or "private" in directives:
+        return None
+
+    if "no-cache" in directives:
+        return None
+
+    for name in ("s-maxage", "max-age"):
+        if (value := directives.get(name)) is not None:
+            try:
+                ttl = int(value)
+            except ValueError:
+                return None
+
+            return ttl if ttl > 0 else None
+
+    return default
+
+
+class ResponseCache:
+    """
+    Store rendered responses in a cache store.
+
+    Entries are keyed by the route, the method, the path, the query parameters
+    and the values of the request headers the responses vary on.
+    Every key also contains a version specific to its route so that
+    purging the cached responses of a route only requires to change it.
+    """
+
+    __slots__ = ("_config", "_manager")
+
+    def __init__(self, manager: CacheManager, config: Config) -> None:
+        self._manager: CacheManager = manager
+        self._config: Config = config
+
+    async def cache(self) -> "Cache":
+        return await self._manager.cache(self._config.get("http.response_cache_store"))
+
+    async def get(
+        self, request: "Request", vary: "Sequence[str]" = ()
+    ) -> Response | None:
+        """
+        Retrieve the cached response for a request, if any.
+
+        :param request: The request to retrieve the response for.
+        :param vary: The request headers the response depends on.
+        """
+        cache = await self.cache()
+        snapshot: ResponseSnapshot | None = await cache.get(
+            await self._key(cache, request, vary)
+        )
+        if snapshot is None:
+            return None
+
+        return restore_response(snapshot)
+
+    async def put(
+        self,
+        request: "Request",
+        response: Response,
+        ttl: int | None = None,
+        vary: "Sequence[str]" = (),
+    ) -> bool:
+        """
+        Store a response if it can be shared between clients.
+
+        :param request: The request the response was produced for.
+        :param response: The response to store.
+        :param ttl: The number of seconds to store the response for,
+                    if the response does not specify it.
+        :param vary: The request headers the response depends on.
+
+        :return: Whether the response has been stored.
+        """
+        if not self.is_cacheable(response, vary):
+            return False
+
+        ttl = response_ttl(response.headers.get("Cache-Control"), ttl)
+        if ttl is None:
+            return False
+
+        snapshot = await snapshot_response(response)
+        if snapshot is None:
+            return False
+
+        cache = await self.cache()
+
+        return await cache.set(await self._key(cache, request, vary), snapshot, ttl=ttl)
+
+    async def purge(self, route_name: str) -> None:
+        """
+        Discard the cached responses of a route.
+
+        :param route_name: The name of the route.
+        """
+        cache = await self.cache()
+
+        await cache.set(self._version_key(route_name), secrets.token_hex(8))
+
+    def is_cacheable(self, response: Response, vary: "Sequence[str]" = ()) -> bool:
+        if response.status_code != 200:
+            return False
+
+        headers = response.headers
+        if headers.has("Content-Encoding"):
+            return False
+
+        if (response_vary := headers.get("Vary")) is not None:
+            # The response must not depend on headers that are not part of the key
+            known = {header.lower() for header in vary} | {"accept-encoding"}
+            for header in response_vary.split(","):
+                if header.strip().lower() not in known:
+                    return False
+
+        return True
+
+    async def _key(
+        self, cache: "Cache", request: "Request", vary: "Sequence[str]"
+    ) -> str:
+        route = request.route
+        route_name = route.name if route is not None and route.name else ""
+        version: Any = "0"
+        if route_name:
+            version = await cache.get(self._version_key(route_name), "0")
+
+        return (
+            f"http:response:{route_name}:{version}:{request_fingerprint(request, vary)}"
+        )
+
+    def _version_key(self, route_name: str) -> str:
+        return f"http:response:{route_name}:version"
+
+
+__all__ = ["ResponseCache", "ResponseCacheOptions", "response_ttl"]
@@ -0,0 +1,217 @@
+from collections.abc import AsyncIterable
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Literal
+
+import msgspec.json
+
+from anyio import CancelScope
+from anyio import EndOfStream
+from anyio import WouldBlock
+from anyio import create_memory_object_stream
+from anyio import create_task_group
+from anyio import move_on_after
+from anyio.streams.memory import MemoryObjectSendStream
+
+from expanse.http.responses.streamed import StreamedResponse
+from expanse.http.responses.streamed import StreamType
+from expanse.support._concurrency import AsyncIteratorWrapper
+from expanse.types import Send
+
+
+if TYPE_CHECKING:
+    from expanse.container.container import Container
+    from expanse.http.request import Request
+
+
+_HEARTBEAT = b": heartbeat\n\n"
+
+
+@dataclass(frozen=True, slots=True)
+class ServerSentEvent:
+    # The data of the event, encoded as JSON if it is not a string.
+    data: Any = None
+    # The type of the event, "message" for clients when not set.
+    event: str | None = None
+    # The ID of the event, sent back by clients in the Last-Event-ID header
+    # when they reconnect.
+    id: str | None = None
+    # The number of milliseconds clients wait for before reconnecting.
+    retry: int | None = None
+    # A comment, ignored by clients.
+    comment: str | None = None
+
+    def encode(self) -> bytes:
+        lines: list[str] = []
+
+        if self.comment is not None:
+            lines.extend(f": {line}" for line in self.comment.splitlines())
+
+        if self.id is not None:
+            if "\n" in self.id or "\r" in self.id or "\0" in self.id:
+                raise ValueError("Event IDs cannot contain line breaks or null bytes")
+
+            lines.append(f"id: {self.id}")
+
+        if self.event is not None:
+            if "\n" in self.event or "\r" in self.event:
+                raise ValueError("Event types cannot contain line breaks")
+
+            lines.append(f"event: {self.event}")
+
+        if self.retry is not None:
+            lines.append(f"retry: {self.retry}")
+
+        if self.data is not None:
+            data = (
+                self.data
+                if isinstance(self.data, str)
+                else msgspec.json.encode(self.data).decode()
+            )
+            lines.extend(f"data: {line}" for line in data.splitlines() or [""])
+
+        return ("\n".join(lines) + "\n\n").encode()
+
+
+type EventSource = (
+    StreamType[ServerSentEvent | Any] | Callable[[str | None], StreamType[Any]]
+)
+
+
+class EventStreamResponse(StreamedResponse):
+    """
+    A stream of Server-Sent Events.
+
+    Events are produced in a task of their own and queued until they are sent,
+    so that heartbeats can be sent while no event is produced without
+    waking the producer. When the client does not keep up and the queue is
+    full, the producer either waits for the client, with the "block" policy,
+    or stops so that the stream ends once the queued events have been sent,
+    with the "drop" policy, leaving the client to reconnect.
+    """
+
+    __slots__ = ("events", "heartbeat", "last_event_id", "max_queue", "policy", "retry")
+
+    def __init__(
+        self,
+        events: EventSource,
+        *,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        heartbeat: float | None = 15.0,
+        retry: int | None = None,
+        max_queue: int = 64,
+        policy: Literal["block", "drop"] = "block",
+    ) -> None:
+        """
+        :param events: The events to send, or a callable receiving the ID
+                       of the last event received by the client, if any,
+                       and returning them. Values that are not events
+                       are sent as the data of an event.
+        :param heartbeat: The number of seconds without events after which
+                          a comment is sent to keep the connection alive.
+        :param retry: The number of milliseconds clients wait for
+                      before reconnecting.
+        :param max_queue: The number of events queued while the client
+                          does not keep up.
+        :param policy: What to do when the queue is full.
+        """
+        super().__init__(
+            (),
+            status_code=status_code,
+            headers=headers,
+            content_type="text/event-stream",
+        )
+
+        self.events: EventSource = events
+        self.heartbeat: float | None = heartbeat
+        self.retry: int | None = retry
+        self.max_queue: int = max_queue
+        self.policy: Literal["block", "drop"] = policy
+        self.last_event_id: str | None = None
+
+        self.headers.set("Cache-Control", "no-cache")
+        # Proxies must not buffer the events
+        self.headers.set("X-Accel-Buffering", "no")
+
+    async def prepare(self, request: "Request", container: "Container") -> None:
+        self.last_event_id = request.headers.get("Last-Event-ID") or None
+
+        await super().prepare(request, container)
+
+    async def _stream(self, send: Send) -> None:
+        compressor = (
+            self._compression.compressor() if self._compression is not None else None
+        )
+        events, queue = create_memory_object_stream[bytes](self.max_queue)
+
+        async with create_task_group() as task_group, queue:
+            task_group.start_soon(self._produce, events)
+
+            if self.retry is not None:
+                await self._send_chunk(
+                    send, compressor, ServerSentEvent(retry=self.retry).encode()
+                )
+
+            while True:
+                try:
+                    chunk = queue.receive_nowait()
+                except WouldBlock:
+                    chunk = None
+                    with move_on_after(self.heartbeat):
+                        try:
+                            chunk = await queue.receive()
+                        except EndOfStream:
+                            break
+                except EndOfStream:
+                    break
+
+                await self._send_chunk(send, compressor, chunk or _HEARTBEAT)
+
+        await send(
+            {
+                "type": "http.response.body",
+                "body": compressor.finish() if compressor is not None else b"",
+                "more_body": False,
+            }
+        )
+
+    async def _produce(self, events: MemoryObjectSendStream[bytes]) -> None:
+        source = self.events
+        if callable(source):
+            source = source(self.last_event_id)
+
+        iterator: AsyncIterable[Any] | AsyncIterator[Any] = (
+            source
+            if isinstance(source, AsyncIterable | AsyncIterator)
+            else AsyncIteratorWrapper[Any](source)
+        )
+
+        async with events:
+            try:
+                async for event in iterator:
+                    chunk = (
+                        event.encode()
+                        if isinstance(event, ServerSentEvent)
+                        else ServerSentEvent(event).encode()
+                    )
+
+                    if self.policy == "block":
+                        await events.send(chunk)
+                        continue
+
+                    try:
+                        events.send_nowait(chunk)
+                    except WouldBlock:
+                        # The client does not keep up, so the stream ends
+                        # and the client will resume from the last event it received.
+                        return
+            finally:
+                # The producer must not outlive the response
+                with CancelScope(shield=True):
+                    if (aclose := getattr(iterator, "aclose", None)) is not None:
+                        await aclose()
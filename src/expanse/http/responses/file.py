@@ -1,4 +1,5 @@
 import os
+import secrets
 
 from collections.abc import AsyncIterable
 from collections.abc import Callable
@@ -19,6 +20,9 @@ from expanse.container.container import Container
 from expanse.http.request import Request
 from expanse.http.responses.streamed import StreamedResponse
 from expanse.http.responses.streamed import StreamType
+from expanse.http.utils.conditional import format_etag
+from expanse.http.utils.conditional import parse_http_date
+from expanse.http.utils.ranges import parse_range_header
 from expanse.types import Receive
 from expanse.types import Send
 
@@ -26,10 +30,15 @@ from expanse.types import Send
 class Metadata(TypedDict, total=False):
     size: NotRequired[int]
     last_modified: NotRequired[datetime | int]
+    etag: NotRequired[str]
 
 
 class FileResponse(StreamedResponse):
     __slots__ = (
+        "_extensions",
+        "_parts",
+        "_ranges",
+        "_stat",
         "chunk_size",
         "content_disposition",
         "content_type",
@@ -64,6 +73,12 @@ class FileResponse(StreamedResponse):
         )
         self.content_disposition: Literal["attachment", "inline"] = content_disposition
         self.metadata: Metadata = {}
+        self._stat: os.stat_result | None = None
+        # The byte ranges to send, for partial content responses,
+        # along with the headers of each part for multipart responses.
+        self._ranges: list[tuple[int, int]] | None = None
+        self._parts: list[bytes] = []
+        self._extensions: dict[str, dict[object, object]] = {}
 
         super().__init__(
             self.create_iterator() if isinstance(self.path, Path) else self.path,
@@ -94,8 +109,9 @@ class FileResponse(StreamedResponse):
             if encoding is not None:
                 self.headers["Content-Encoding"] = encoding
 
+        stat = self._file_stat()
         size: int | None = self.metadata.get("size") or (
-            os.stat(self.path).st_size if isinstance(self.path, Path) else None
+            stat.st_size if stat is not None else None
         )
         last_modified: whenever.ZonedDateTime | None = None
 
@@ -120,9 +136,9 @@ class FileResponse(StreamedResponse):
                 last_modified = whenever.ZonedDateTime.from_timestamp(
                     meta_last_modified, tz="UTC"
                 )
-        elif isinstance(self.path, Path):
+        elif stat is not None:
             last_modified = whenever.ZonedDateTime.from_timestamp(
-                os.stat(self.path).st_mtime, tz="UTC"
+                stat.st_mtime, tz="UTC"
             )
 
         if size is not None:
@@ -153,22 +169,195 @@ class FileResponse(StreamedResponse):
                 f"{self.content_disposition}; filename*=UTF-8''{filename}",
             )
 
-        # TODO: Etag
+        if not self.headers.has("ETag"):
+            if etag := self.metadata.get("etag"):
+                self.headers.set("ETag", format_etag(etag))
+            elif stat is not None:
+                # Files are identified by their size and modification time,
+                # which do not guarantee byte-for-byte equality, so the tag is weak
+                # and If-Range relies on the modification date instead.
+                self.headers.set("ETag", f'W/"{stat.st_size:x}-{stat.st_mtime_ns:x}"')
+
+        range_header: str | None = None
+        if stat is not None:
+            self.headers.set("Accept-Ranges", "bytes")
+
+            if request.method == "GET" and self.status_code == 200:
+                range_header = request.headers.get("Range")
+
+        if range_header is not None:
+            # Ranges apply to the file itself, not to a compressed version of it
+            self._compression = None
+
+        self._extensions = request.extensions
 
         await super().prepare(request, container)
 
+        if (
+            range_header is not None
+            and stat is not None
+            and self.status_code == 200
+            and self._if_range_matches(request)
+        ):
+            self._prepare_ranges(range_header, stat.st_size)
+
     async def send_body(self, send: Send, receive: Receive) -> None:
-        if self.chunk_size < int(self.headers["Content-Length"]):
+        if (
+            self._omit_body
+            or self._compression is not None
+            or self._ranges is not None
+            or not isinstance(self.path, Path)
+        ):
             return await super().send_body(send, receive)
 
-        if isinstance(self.path, Path):
-            async with AsyncFile(self.path.open("rb")) as f:
-                return await send(
-                    {
-                        "type": "http.response.body",
-                        "body": await f.read(),
-                        "more_body": False,
-                    }
-                )
-        else:
+        if "http.response.pathsend" in self._extensions:
+            # The server sends the file itself, without going through Python
+            return await send(
+                {"type": "http.response.pathsend", "path": str(self.path.resolve())}
+            )
+
+        stat = self._file_stat()
+        assert stat is not None
+
+        if (
+            "http.response.zerocopysend" in self._extensions
+            or self.chunk_size < stat.st_size
+        ):
             return await super().send_body(send, receive)
+
+        async with AsyncFile(self.path.open("rb")) as f:
+            return await send(
+                {
+                    "type": "http.response.body",
+                    "body": await f.read(),
+                    "more_body": False,
+                }
+            )
+
+    async def _stream(self, send: Send) -> None:
+        stat = self._file_stat()
+        zerocopy = "http.response.zerocopysend" in self._extensions
+
+        if (
+            not isinstance(self.path, Path)
+            or stat is None
+            or self._compression is not None
+            or (self._ranges is None and (not zerocopy or not stat.st_size))
+        ):
+            return await super()._stream(send)
+
+        ranges = self._ranges or [(0, stat.st_size - 1)]
+
+        async with AsyncFile(self.path.open("rb")) as file:
+            for i, (start, end) in enumerate(ranges):
+                if self._parts:
+                    await send(
+                        {
+                            "type": "http.response.body",
+                            "body": self._parts[i],
+                            "more_body": True,
+                        }
+                    )
+
+                await self._send_range(send, file, start, end, zerocopy)
+
+        await send(
+            {
+                "type": "http.response.body",
+                "body": self._parts[-1] if self._parts else b"",
+                "more_body": False,
+            }
+        )
+
+    async def _send_range(
+        self, send: Send, file: AsyncFile[bytes], start: int, end: int, zerocopy: bool
+    ) -> None:
+        count = end - start + 1
+
+        if zerocopy:
+            await send(
+                {
+                    "type": "http.response.zerocopysend",
+                    "file": file.wrapped,
+                    "offset": start,
+                    "count": count,
+                    "more_body": True,
+                }
+            )
+
+            return
+
+        await file.seek(start)
+        while count > 0 and (chunk := await file.read(min(self.chunk_size, count))):
+            count -= len(chunk)
+
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+
+    def _file_stat(self) -> os.stat_result | None:
+        if self._stat is None and isinstance(self.path, Path):
+            self._stat = os.stat(self.path)
+
+        return self._stat
+
+    def _if_range_matches(self, request: Request) -> bool:
+        if_range = request.headers.get("If-Range")
+        if if_range is None:
+            return True
+
+        if if_range.startswith(('"', "W/")):
+            # If-Range requires a strong comparison, which weak entity tags never satisfy
+            etag = self.headers.get("ETag")
+
+            return not if_range.startswith("W/") and if_range == etag
+
+        date = parse_http_date(if_range)
+        last_modified = parse_http_date(self.headers.get("Last-Modified"))
+
+        return date is not None and last_modified is not None and date == last_modified
+
+    def _prepare_ranges(self, range_header: str, size: int) -> None:
+        ranges = parse_range_header(range_header, size)
+        if ranges is None:
+            # Invalid ranges are ignored and the whole file is sent
+            return
+
+        if not ranges:
+            self.status_code = 416
+            self._omit_body = True
+            self.headers.set("Content-Range", f"bytes */{size}")
+            self.headers.set("Content-Length", "0")
+
+            return
+
+        self.status_code = 206
+        self._ranges = ranges
+
+        if len(ranges) == 1:
+            start, end = ranges[0]
+            self.headers.set("Content-Range", f"bytes {start}-{end}/{size}")
+            self.headers.set("Content-Length", str(end - start + 1))
+
+            return
+
+        boundary = secrets.token_hex(16)
+        content_type = self.headers.get("Content-Type", "application/octet-stream")
+        # Every part but the first one starts with the CRLF ending the previous one
+        self._parts = [
+            (b"\r\n" if i else b"")
+            + (
+                f"--{boundary}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Range: bytes {start}-{end}/{size}\r\n\r\n"
+            ).encode("latin-1")
+            for i, (start, end) in enumerate(ranges)
+        ]
+        self._parts.append(f"\r\n--{boundary}--\r\n".encode("latin-1"))
+
+        self.headers.set("Content-Type", f"multipart/byteranges; boundary={boundary}")
+        self.headers.set(
+            "Content-Length",
+            str(
+                sum(len(part) for part in self._parts)
+                + sum(end - start + 1 for start, end in ranges)
+            ),
+        )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import inspect
 
 from typing import TYPE_CHECKING
@@ -10,6 +11,8 @@ from typing import overload
 from expanse.http.cookie import Cookie
 from expanse.http.cookie import SameSite
 from expanse.http.response_header_bag import ResponseHeaderBag
+from expanse.http.utils.conditional import evaluate_preconditions
+from expanse.http.utils.conditional import format_etag
 from expanse.support._concurrency import should_run_as_async
 from expanse.support._concurrency import sync_to_async
 
@@ -21,6 +24,7 @@ if TYPE_CHECKING:
     from datetime import datetime
 
     from expanse.container.container import Container
+    from expanse.http.compression import Compression
     from expanse.http.request import Request
     from expanse.types import Receive
     from expanse.types import Send
@@ -33,8 +37,11 @@ type Cookies = dict[str, Cookie]
 class Response:
     __slots__ = (
         "_body",
+        "_compression",
+        "_compute_etag",
         "_content",
         "_deferred",
+        "_omit_body",
         "_prepared",
         "_rendered",
         "content_type",
@@ -62,6 +69,9 @@ class Response:
         self._prepared: bool = False
         self._rendered: bool = False
         self._body: bytes | None = None
+        self._compression: Compression | None = None
+        self._compute_etag: bool = False
+        self._omit_body: bool = False
         self._deferred: list[Callable[[], None] | Callable[[], Awaitable[None]]] = []
 
     def with_status(self, status_code: int) -> Self:
@@ -154,6 +164,47 @@ class Response:
 
         return self
 
+    def with_etag(self, etag: str | None = None, *, weak: bool = False) -> Self:
+        """
+        Set the entity tag of the response.
+
+        The conditional headers of GET and HEAD requests are evaluated
+        against it when the response is prepared. Requests with unsafe methods
+        must be checked before the resource is modified,
+        with `Request.check_preconditions()`.
+
+        :param etag: The entity tag or None to compute a strong one from the body.
+        :param weak: Whether the given entity tag is a weak validator.
+        """
+        if etag is None:
+            self._compute_etag = True
+        else:
+            self.headers.set("ETag", format_etag(etag, weak=weak))
+
+        return self
+
+    def with_last_modified(self, last_modified: datetime) -> Self:
+        """
+        Set the Last-Modified header of the response.
+
+        :param last_modified: The date the content was last modified.
+        """
+        from email.utils import format_datetime
+
+        self.headers.set("Last-Modified", format_datetime(last_modified, usegmt=True))
+
+        return self
+
+    def with_compression(self, compression: Compression | None) -> Self:
+        """
+        Compress the response body, if it is eligible, when preparing the response.
+
+        :param compression: The negotiated compression, or None to disable it.
+        """
+        self._compression = compression
+
+        return self
+
     def defer(self, func: Callable[[], None] | Callable[[], Awaitable[None]]) -> Self:
         """
         Defers the running of a function after the response is sent.
@@ -194,13 +245,50 @@ class Response:
         if not headers.has("Content-Length") and body is not None:
             headers.set("Content-Length", str(len(body)))
 
+        if self._compute_etag and body is not None and not headers.has("ETag"):
+            digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+            headers.set("ETag", f'"{digest}"')
+
+        if (
+            self.status_code == 200
+            and request.method in ("GET", "HEAD")
+            and (headers.has("ETag") or headers.has("Last-Modified"))
+        ):
+            status_code = evaluate_preconditions(
+                request, headers.get("ETag"), headers.get("Last-Modified")
+            )
+
+            if status_code == 304:
+                self.status_code = 304
+            elif status_code == 412:
+                self.status_code = 412
+                self._body = body = b""
+                self._omit_body = True
+                headers.set("Content-Length", "0")
+
+        if self._compression is not None:
+            if (
+                self.is_informational()
+                or self.is_empty()
+                or headers.has("Content-Encoding")
+                or self._omit_body
+                or not self._apply_compression(self._compression, body)
+            ):
+                self._compression = None
+            elif (etag := headers.get("ETag")) is not None:
+                # The compressed representation is no longer byte-for-byte
+                # identical to the one the entity tag was computed for.
+                headers.set("ETag", format_etag(etag, weak=True))
+
         if self.is_informational() or self.is_empty():
             self._body = None
+            self._omit_body = True
             headers.remove("Content-Type")
             headers.remove("Content-Length")
         else:
             if request.method == "HEAD":
                 self._body = None
+                self._omit_body = True
 
         for cookie in self.cookies.values():
             if is_request_secure:
@@ -208,6 +296,27 @@ class Response:
 
         self._prepared = True
 
+    def _apply_compression(self, compression: Compression, body: bytes | None) -> bool:
+        """
+        Compress the rendered body in one shot.
+
+        :return: Whether the body has been compressed.
+        """
+        if body is None or not compression.applies_to(
+            self.headers.get("Content-Type"), len(body)
+        ):
+            return False
+
+        compressed = compression.compress(body)
+        if len(compressed) >= len(body):
+            return False
+
+        self._body = compressed
+        self.headers.set("Content-Encoding", compression.encoding.name)
+        self.headers.set("Content-Length", str(len(compressed)))
+
+        return True
+
     def encode_headers(self) -> list[tuple[bytes, bytes]]:
         """
         Encodes the headers to a list of tuples with bytes.
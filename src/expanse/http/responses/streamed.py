@@ -1,3 +1,5 @@
+import time
+
 from collections.abc import AsyncGenerator
 from collections.abc import AsyncIterable
 from collections.abc import AsyncIterator
@@ -5,25 +7,51 @@ from collections.abc import Callable
 from collections.abc import Iterable
 from collections.abc import Iterator
 from collections.abc import Mapping
-from functools import partial
+from contextlib import suppress
+from typing import TYPE_CHECKING
+from typing import Final
 from typing import TypeVar
 
 from anyio import CancelScope
 from anyio import create_task_group
 
+from expanse.http.compression import Compression
+from expanse.http.compression import StreamCompressor
+from expanse.http.exceptions import ClientDisconnectedError
 from expanse.http.responses.response import Response
 from expanse.support._concurrency import AsyncIteratorWrapper
+from expanse.types import Message
 from expanse.types import Receive
 from expanse.types import Send
 
 
+if TYPE_CHECKING:
+    from expanse.container.container import Container
+    from expanse.http.request import Request
+
+
 T = TypeVar("T")
 
 type StreamType[T] = Iterable[T] | Iterator[T] | AsyncIterable[T] | AsyncIterator[T]
 
 
+class _Flush(bytes):
+    __slots__ = ()
+
+
+# Yield this marker to send the buffered chunks immediately.
+FLUSH: Final[bytes] = _Flush()
+
+
 class StreamedResponse(Response):
-    __slots__ = ("iterator",)
+    __slots__ = (
+        "_send_detects_disconnect",
+        "batch_bytes",
+        "batch_size",
+        "buffer_size",
+        "flush_interval",
+        "iterator",
+    )
 
     def __init__(
         self,
@@ -33,7 +61,22 @@ class StreamedResponse(Response):
         headers: Mapping[str, str] | None = None,
         content_type: str | None = None,
         encoding: str = "utf-8",
+        batch_size: int | None = None,
+        batch_bytes: int | None = None,
+        buffer_size: int = 0,
+        flush_interval: float | None = None,
     ) -> None:
+        """
+        :param batch_size: The number of chunks pulled at once from synchronous
+                           iterators, in a worker thread.
+        :param batch_bytes: The number of bytes pulled at once from synchronous
+                            iterators, in a worker thread.
+        :param buffer_size: The number of bytes chunks are coalesced up to
+                            before being sent. Chunks are sent as soon as they
+                            are produced by default.
+        :param flush_interval: The maximum number of seconds chunks are buffered
+                               for, checked whenever a chunk is produced.
+        """
         super().__init__(
             content=None,
             status_code=status_code,
@@ -45,6 +88,18 @@ class StreamedResponse(Response):
         self.iterator: (
             StreamType[bytes | str] | Callable[[], StreamType[bytes | str]]
         ) = iterator
+        self.batch_size: int | None = batch_size
+        self.batch_bytes: int | None = batch_bytes
+        self.buffer_size: int = buffer_size
+        self.flush_interval: float | None = flush_interval
+        self._send_detects_disconnect: bool = False
+
+    async def prepare(self, request: "Request", container: "Container") -> None:
+        # Since version 2.4 of the ASGI spec, sending to a disconnected client
+        # raises an error, so there is no need to listen for disconnections.
+        self._send_detects_disconnect = request.spec_version >= (2, 4)
+
+        await super().prepare(request, container)
 
     async def _stream(self, send: Send) -> None:
         """
@@ -58,38 +113,128 @@ class StreamedResponse(Response):
             it = it()
 
         if not isinstance(it, AsyncIterable | AsyncIterator):
-            iterator = AsyncIteratorWrapper[bytes | str](it)
+            iterator = AsyncIteratorWrapper[bytes | str](
+                it, batch_size=self.batch_size, batch_bytes=self.batch_bytes
+            )
         else:
             iterator = it
 
-        async for chunk in iterator:
-            await send(
-                {
-                    "type": "http.response.body",
-                    "body": chunk.encode(self.encoding)
-                    if isinstance(chunk, str)
-                    else chunk,
-                    "more_body": True,
-                }
-            )
+        compressor = (
+            self._compression.compressor() if self._compression is not None else None
+        )
+        buffer_size = self.buffer_size
+        flush_interval = self.flush_interval
+        buffer: list[bytes] = []
+        buffered = 0
+        flushed_at = time.monotonic() if flush_interval is not None else 0.0
+
+        try:
+            async for chunk in iterator:
+                if chunk is FLUSH:
+                    if not buffer:
+                        continue
+                elif isinstance(chunk, str):
+                    if not chunk:
+                        continue
+
+                    buffer.append(chunk.encode(self.encoding))
+                    buffered += len(buffer[-1])
+                else:
+                    if not chunk:
+                        continue
+
+                    buffer.append(chunk)
+                    buffered += len(chunk)
+
+                if chunk is not FLUSH and buffered < buffer_size:
+                    if flush_interval is None:
+                        continue
+
+                    if time.monotonic() - flushed_at < flush_interval:
+                        continue
+
+                await self._send_chunk(send, compressor, b"".join(buffer))
+                buffer.clear()
+                buffered = 0
+                if flush_interval is not None:
+                    flushed_at = time.monotonic()
+        finally:
+            if isinstance(iterator, AsyncIteratorWrapper):
+                # Stop prefetching chunks if the client disconnected
+                await iterator.aclose()
+
+        body = b"".join(buffer)
+        if compressor is not None:
+            body = compressor.compress(body) + compressor.finish()
+
+        await send({"type": "http.response.body", "body": body, "more_body": False})
+
+    async def _send_chunk(
+        self, send: Send, compressor: StreamCompressor | None, body: bytes
+    ) -> None:
+        if compressor is not None:
+            body = compressor.compress(body)
+            if not body:
+                return
 
-        await send({"type": "http.response.body", "body": b"", "more_body": False})
+        await send({"type": "http.response.body", "body": body, "more_body": True})
+
+    def _apply_compression(self, compression: Compression, body: bytes | None) -> bool:
+        """
+        Compress the body incrementally while it is streamed.
+
+        :return: Whether the body will be compressed.
+        """
+        content_length = self.headers.get("Content-Length")
+        if not compression.applies_to(
+            self.headers.get("Content-Type"),
+            int(content_length) if content_length is not None else None,
+        ):
+            return False
+
+        # The size of the compressed body is not known in advance
+        self.headers.remove("Content-Length")
+        self.headers.set("Content-Encoding", compression.encoding.name)
+
+        return True
 
     async def _listen_for_disconnect(
         self, cancel_scope: CancelScope, receive: Receive
     ) -> None:
-        if not cancel_scope.cancel_called:
+        while not cancel_scope.cancel_called:
             message = await receive()
             if message["type"] == "http.disconnect":
                 cancel_scope.cancel()
-            else:
-                await self._listen_for_disconnect(
-                    cancel_scope=cancel_scope, receive=receive
-                )
 
     async def send_body(self, send: Send, receive: Receive) -> None:
+        if self._omit_body:
+            # HEAD requests, 304 Not Modified and similar responses have no body
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+            return
+
+        if self._send_detects_disconnect:
+
+            async def send_or_disconnect(message: Message) -> None:
+                try:
+                    await send(message)
+                except OSError as e:
+                    raise ClientDisconnectedError() from e
+
+            with suppress(ClientDisconnectedError):
+                await self._stream(send_or_disconnect)
+
+            return
+
         async with create_task_group() as task_group:
-            task_group.start_soon(partial(self._stream, send))
+
+            async def stream() -> None:
+                await self._stream(send)
+
+                # The response is complete, so disconnections no longer matter
+                task_group.cancel_scope.cancel()
+
+            task_group.start_soon(stream)
             await self._listen_for_disconnect(
                 cancel_scope=task_group.cancel_scope, receive=receive
             )
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import ipaddress
+
+from bisect import bisect_right
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+class ProxyPolicy:
+    """
+    A precompiled set of trusted proxies.
+
+    The configured addresses and networks are parsed once and merged into
+    sorted, non-overlapping intervals — one table per IP version — so that
+    checking an address is a single binary search.
+    """
+
+    __slots__ = ("_ends", "_starts", "proxies", "trust_all")
+
+    def __init__(self, proxies: Sequence[str]) -> None:
+        self.proxies: list[str] = list(proxies)
+        # "*" trusts the calling address, whatever it is.
+        self.trust_all: bool = "*" in self.proxies
+
+        intervals: dict[int, list[tuple[int, int]]] = {4: [], 6: []}
+        for proxy in self.proxies:
+            if proxy == "*":
+                continue
+
+            network = ipaddress.ip_network(proxy)
+            intervals[network.version].append(
+                (int(network.network_address), int(network.broadcast_address))
+            )
+
+        self._starts: dict[int, list[int]] = {}
+        self._ends: dict[int, list[int]] = {}
+        for version, ranges in intervals.items():
+            merged: list[list[int]] = []
+            for start, end in sorted(ranges):
+                if merged and start <= merged[-1][1] + 1:
+                    merged[-1][1] = max(merged[-1][1], end)
+                else:
+                    merged.append([start, end])
+
+            self._starts[version] = [start for start, _ in merged]
+            self._ends[version] = [end for _, end in merged]
+
+    def trusts(self, host: str | None) -> bool:
+        """
+        Check whether the given address belongs to a trusted proxy.
+
+        :param host: The IP address to check.
+        """
+        if not host:
+            return False
+
+        if self.trust_all:
+            return True
+
+        try:
+            address = ipaddress.ip_address(host)
+        except ValueError:
+            return False
+
+        value = int(address)
+        index = bisect_right(self._starts[address.version], value) - 1
+
+        return index >= 0 and value <= self._ends[address.version][index]
+
+    def __bool__(self) -> bool:
+        return bool(self.proxies)
+
+
+class HostPolicy:
+    """
+    A precompiled set of trusted hosts.
+
+    Exact hosts are kept in a set while wildcard domains, like `.example.com`,
+    are stored in a trie of reversed labels so that the domain itself
+    and all of its subdomains are matched in a single walk.
+    """
+
+    __slots__ = ("_exact", "_suffixes", "hosts", "trust_all")
+
+    # Marks the end of a wildcard domain in the suffix trie.
+    _TERMINAL = ""
+
+    def __init__(self, hosts: Sequence[str]) -> None:
+        self.hosts: list[str] = list(hosts)
+        self.trust_all: bool = "*" in self.hosts
+        self._exact: frozenset[str] = frozenset(
+            host.lower() for host in self.hosts if not host.startswith(".")
+        )
+        self._suffixes: dict[str, dict] = {}
+
+        for host in self.hosts:
+            if not host.startswith("."):
+                continue
+
+            node = self._suffixes
+            for label in reversed(host[1:].lower().split(".")):
+                node = node.setdefault(label, {})
+
+            node[self._TERMINAL] = {}
+
+    def trusts(self, host: str) -> bool:
+        """
+        Check whether the given host is trusted.
+
+        :param host: The lowercase host, without port.
+        """
+        if self.trust_all or host in self._exact:
+            return True
+
+        node = self._suffixes
+        for label in reversed(host.split(".")):
+            node = node.get(label)  # type: ignore[assignment]
+            if node is None:
+                return False
+
+            if self._TERMINAL in node:
+                return True
+
+        return False
+
+
+__all__ = ["HostPolicy", "ProxyPolicy"]
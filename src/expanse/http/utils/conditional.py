@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import re
+
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from expanse.http.request import Request
+
+
+_ETAG_REGEX = re.compile(r'\*|(?:W/)?"[^"]*"')
+
+
+def format_etag(etag: str, weak: bool = False) -> str:
+    """
+    Format an entity tag, quoting it if necessary.
+
+    :param etag: The entity tag, quoted or not.
+    :param weak: Whether the entity tag is a weak validator.
+    """
+    if not etag.startswith(('"', "W/")):
+        etag = f'"{etag}"'
+
+    if weak and not etag.startswith("W/"):
+        etag = f"W/{etag}"
+
+    return etag
+
+
+def parse_etags(header: str) -> list[str]:
+    """
+    Parse the list of entity tags of an If-Match or If-None-Match header.
+    """
+    return _ETAG_REGEX.findall(header)
+
+
+def parse_http_date(value: str | None) -> datetime | None:
+    if not value:
+        return None
+
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _strong_match(etags: list[str], etag: str | None) -> bool:
+    if etag is None:
+        return False
+
+    if "*" in etags:
+        return True
+
+    return not etag.startswith("W/") and etag in etags
+
+
+def _weak_match(etags: list[str], etag: str | None) -> bool:
+    if etag is None:
+        return False
+
+    if "*" in etags:
+        return True
+
+    etag = etag.removeprefix("W/")
+
+    return any(candidate.removeprefix("W/") == etag for candidate in etags)
+
+
+def evaluate_preconditions(
+    request: Request, etag: str | None, last_modified: str | None
+) -> int | None:
+    """
+    Evaluate the conditional headers of a request against a representation.
+
+    The preconditions are evaluated in the order defined by RFC 9110, section 13.2.2.
+
+    :param request: The request holding the conditional headers.
+    :param etag: The entity tag of the representation, if any.
+    :param last_modified: The Last-Modified header of the representation, if any.
+
+    :return: The status code to respond with — 304 or 412 — or None if the
+             representation should be sent as is.
+    """
+    headers = request.headers
+    is_safe = request.method in ("GET", "HEAD")
+
+    if (if_match := headers.get("If-Match")) is not None:
+        if not _strong_match(parse_etags(if_match), etag):
+            return 412
+    elif (
+        (if_unmodified_since := parse_http_date(headers.get("If-Unmodified-Since")))
+        is not None
+        and (modified := parse_http_date(last_modified)) is not None
+        and modified > if_unmodified_since
+    ):
+        return 412
+
+    if (if_none_match := headers.get("If-None-Match")) is not None:
+        if _weak_match(parse_etags(if_none_match), etag):
+            return 304 if is_safe else 412
+    elif (
+        is_safe
+        and (if_modified_since := parse_http_date(headers.get("If-Modified-Since")))
+        is not None
+        and (modified := parse_http_date(last_modified)) is not None
+        and modified <= if_modified_since
+    ):
+        return 304
+
+    return None
+
+
+__all__ = ["evaluate_preconditions", "format_etag", "parse_etags", "parse_http_date"]
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+
+def parse_range_header(
+    header: str, size: int, max_ranges: int = 16
+) -> list[tuple[int, int]] | None:
+    """
+    Parse a Range header into a list of inclusive byte ranges.
+
+    Overlapping and adjacent ranges are coalesced.
+
+    :param header: The value of the Range header.
+    :param size: The size of the representation.
+    :param max_ranges: The maximum number of ranges to accept.
+
+    :return: The satisfiable ranges — an empty list if none of them is
+             satisfiable — or None if the header is invalid and should be ignored.
+    """
+    unit, _, specs = header.partition("=")
+    if unit.strip().lower() != "bytes" or not specs.strip():
+        return None
+
+    parts = [part.strip() for part in specs.split(",") if part.strip()]
+    if not parts or len(parts) > max_ranges:
+        return None
+
+    ranges: list[tuple[int, int]] = []
+    for part in parts:
+        first, separator, last = part.partition("-")
+        first, last = first.strip(), last.strip()
+        if not separator:
+            return None
+
+        if not first:
+            # Suffix range, like "-500" for the last 500 bytes
+            if not last.isdigit():
+                return None
+
+            length = int(last)
+            if length > 0 and size > 0:
+                ranges.append((max(size - length, 0), size - 1))
+
+            continue
+
+        if not first.isdigit() or (last and not last.isdigit()):
+            return None
+
+        start = int(first)
+        end = int(last) if last else None
+        if end is not None and end < start:
+            return None
+
+        if start < size:
+            ranges.append((start, size - 1 if end is None else min(end, size - 1)))
+
+    ranges.sort()
+    coalesced: list[tuple[int, int]] = []
+    for start, end in ranges:
+        if coalesced and start <= coalesced[-1][1] + 1:
+            coalesced[-1] = (coalesced[-1][0], max(coalesced[-1][1], end))
+        else:
+            coalesced.append((start, end))
+
+    return coalesced
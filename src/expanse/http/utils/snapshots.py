@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import hashlib
+
+from typing import TYPE_CHECKING
+from urllib.parse import urlencode
+
+from expanse.http.responses.response import Response
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from expanse.http.request import Request
+
+
+# The status code, content type, encoding, headers and body of a rendered response.
+type ResponseSnapshot = tuple[int, str | None, str, dict[str, list[str | None]], bytes]
+
+
+def request_fingerprint(request: Request, vary: Sequence[str] = ()) -> str:
+    """
+    Identify the requests that can be answered with the same response.
+
+    :param request: The request to identify.
+    :param vary: The request headers the response depends on.
+    """
+    parts = [
+        # HEAD requests are answered with the representation of GET requests
+        "GET" if request.method == "HEAD" else request.method,
+        # Applications can be served for several hosts and schemes
+        request.scheme,
+        request.http_host,
+        request.path,
+        urlencode(sorted(request.query_params.multi_items())),
+    ]
+    headers = request.headers
+    for header in vary:
+        parts.append(headers.get(header, ""))
+
+    return hashlib.blake2b("\x00".join(parts).encode(), digest_size=16).hexdigest()
+
+
+async def snapshot_response(response: Response) -> ResponseSnapshot | None:
+    """
+    Capture a response so that it can be replayed for other requests.
+
+    :return: The snapshot, or None if the response is streamed or sets cookies.
+    """
+    if response.cookies or response.headers.has("Set-Cookie"):
+        return None
+
+    body = await response.render()
+    if body is None:
+        return None
+
+    return (
+        response.status_code,
+        response.content_type,
+        response.encoding,
+        {name: list(values) for name, values in response.headers.all().items()},
+        body,
+    )
+
+
+def restore_response(snapshot: ResponseSnapshot) -> Response:
+    """
+    Create a new response from a snapshot.
+    """
+    status_code, content_type, encoding, headers, body = snapshot
+    response = Response(body, status_code, content_type=content_type, encoding=encoding)
+    for name, values in headers.items():
+        response.headers.set(name, list(values))
+
+    return response
+
+
+__all__ = [
+    "ResponseSnapshot",
+    "request_fingerprint",
+    "restore_response",
+    "snapshot_response",
+]
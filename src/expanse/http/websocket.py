@@ -0,0 +1,388 @@
+from __future__ import annotations
+
+import contextlib
+import enum
+import time
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import overload
+
+import anyio
+import msgspec
+
+from expanse.http.exceptions import WebSocketDisconnectedError
+from expanse.http.json import json_decoder
+from expanse.http.request import Request
+from expanse.types import Message
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from collections.abc import Mapping
+
+    from anyio.streams.memory import MemoryObjectReceiveStream
+    from anyio.streams.memory import MemoryObjectSendStream
+    from pydantic import BaseModel
+
+    from expanse.http.response import Response
+    from expanse.types import Receive
+    from expanse.types import Scope
+    from expanse.types import Send
+
+
+class WebSocketState(enum.Enum):
+    CONNECTING = "connecting"
+    CONNECTED = "connected"
+    DISCONNECTED = "disconnected"
+
+
+class WebSocket(Request):
+    """
+    A WebSocket connection.
+
+    The connection exposes the same information as HTTP requests — headers,
+    cookies, query and path parameters — and must be accepted before messages
+    can be exchanged.
+
+    When keepalive is enabled, the application sends a ping message
+    at regular intervals and closes the connection if the client does not
+    answer with a pong message in time. The messages of the client are then read
+    by the keepalive, which handles these messages transparently — even when
+    the endpoint only sends messages — and buffers the other ones
+    until they are received.
+    """
+
+    method = "WEBSOCKET"
+
+    # The application-level keepalive messages.
+    ping_message: str = "ping"
+    pong_message: str = "pong"
+
+    # The number of messages buffered by the keepalive until they are received.
+    # The client messages are no longer read once the buffer is full.
+    max_buffered_messages: int = 32
+
+    def __init__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        *,
+        ping_interval: float | None = None,
+        ping_timeout: float | None = None,
+    ) -> None:
+        super().__init__(scope, receive, send)
+
+        self.state: WebSocketState = WebSocketState.CONNECTING
+        self.ping_interval: float | None = ping_interval
+        self.ping_timeout: float | None = ping_timeout
+        self._accepted: anyio.Event = anyio.Event()
+        self._last_pong: float = 0.0
+        self._buffer: MemoryObjectSendStream[Message] | None = None
+        self._messages: MemoryObjectReceiveStream[Message] | None = None
+
+        if ping_interval is not None:
+            self._buffer, self._messages = anyio.create_memory_object_stream[Message](
+                self.max_buffered_messages
+            )
+
+    @property
+    def subprotocols(self) -> list[str]:
+        """
+        The subprotocols requested by the client.
+        """
+        scope = self._scope
+        if scope["type"] != "websocket":
+            return []
+
+        return list(scope.get("subprotocols", []))
+
+    async def accept(
+        self, subprotocol: str | None = None, headers: Mapping[str, str] | None = None
+    ) -> None:
+        """
+        Accept the connection.
+
+        :param subprotocol: The subprotocol chosen among the requested ones.
+        :param headers: Additional headers for the handshake response.
+        """
+        if self.state is not WebSocketState.CONNECTING:
+            raise RuntimeError("The WebSocket connection has already been accepted")
+
+        message = await self._receive()
+        if message["type"] == "websocket.disconnect":
+            self.state = WebSocketState.DISCONNECTED
+
+            raise WebSocketDisconnectedError(message.get("code", 1000))
+
+        await self._send(
+            {
+                "type": "websocket.accept",
+                "subprotocol": subprotocol,
+                "headers": [
+                    (name.lower().encode("latin-1"), value.encode("latin-1"))
+                    for name, value in (headers or {}).items()
+                ],
+            }
+        )
+
+        self.state = WebSocketState.CONNECTED
+        self._accepted.set()
+
+    async def deny(self, response: Response) -> None:
+        """
+        Reject the connection with an HTTP response, if the server supports it,
+        or by closing it otherwise, which servers turn into a 403 response.
+
+        :param response: The response to send.
+        """
+        if self.state is not WebSocketState.CONNECTING:
+            raise RuntimeError("Only pending WebSocket connections can be denied")
+
+        self.state = WebSocketState.DISCONNECTED
+
+        if "websocket.http.response" not in self.extensions:
+            await self._send({"type": "websocket.close", "code": 1008, "reason": ""})
+
+            return
+
+        body = await response.render() or b""
+        await self._send(
+            {
+                "type": "websocket.http.response.start",
+                "status": response.status_code,
+                "headers": response.encode_headers(),
+            }
+        )
+        await self._send(
+            {"type": "websocket.http.response.body", "body": body, "more_body": False}
+        )
+
+    async def receive(self) -> Message:
+        """
+        Receive the next message from the client.
+
+        :raise WebSocketDisconnectedError: If the client disconnected.
+        """
+        if self.state is not WebSocketState.CONNECTED:
+            raise RuntimeError("The WebSocket connection is not open")
+
+        if self._messages is None:
+            message = await self._receive()
+        else:
+            try:
+                message = await self._messages.receive()
+            except (anyio.EndOfStream, anyio.ClosedResourceError):
+                message = {"type": "websocket.disconnect", "code": 1006}
+
+        if message["type"] == "websocket.disconnect":
+            self.state = WebSocketState.DISCONNECTED
+
+            raise WebSocketDisconnectedError(
+                message.get("code", 1000), message.get("reason")
+            )
+
+        return message
+
+    async def receive_text(self) -> str:
+        message = await self.receive()
+        if (text := message.get("text")) is None:
+            raise TypeError("Expected a text message, received a binary one")
+
+        return text
+
+    async def receive_bytes(self) -> bytes:
+        message = await self.receive()
+        if (data := message.get("bytes")) is None:
+            raise TypeError("Expected a binary message, received a text one")
+
+        return data
+
+    @overload
+    async def receive_json(self) -> Any: ...
+
+    @overload
+    async def receive_json[M: BaseModel | msgspec.Struct](
+        self, model: type[M]
+    ) -> M: ...
+
+    async def receive_json(self, model: type[Any] | None = None) -> Any:
+        """
+        Receive a JSON message, text or binary, decoded into the given model if any.
+
+        :param model: The pydantic model or msgspec struct to decode into.
+        """
+        message = await self.receive()
+        data = message.get("text")
+        if data is None:
+            data = message.get("bytes") or b""
+
+        if model is None:
+            return msgspec.json.decode(data)
+
+        return json_decoder(model)(data)
+
+    async def send_text(self, data: str) -> None:
+        await self._send_message({"type": "websocket.send", "text": data})
+
+    async def send_bytes(self, data: bytes) -> None:
+        await self._send_message({"type": "websocket.send", "bytes": data})
+
+    async def send_json(self, data: Any, *, binary: bool = False) -> None:
+        """
+        Send a JSON message.
+
+        :param data: The data to encode, including pydantic models and msgspec structs.
+        :param binary: Whether to send the JSON document in a binary message.
+        """
+        if hasattr(data, "model_dump"):
+            data = data.model_dump(mode="json")
+
+        encoded = msgspec.json.encode(data)
+        if binary:
+            await self.send_bytes(encoded)
+        else:
+            await self.send_text(encoded.decode())
+
+    async def iter_text(self) -> AsyncIterator[str]:
+        """
+        Iterate over the text messages until the client disconnects.
+        """
+        try:
+            while True:
+                yield await self.receive_text()
+        except WebSocketDisconnectedError:
+            pass
+
+    async def iter_bytes(self) -> AsyncIterator[bytes]:
+        """
+        Iterate over the binary messages until the client disconnects.
+        """
+        try:
+            while True:
+                yield await self.receive_bytes()
+        except WebSocketDisconnectedError:
+            pass
+
+    async def iter_json(self, model: type[Any] | None = None) -> AsyncIterator[Any]:
+        """
+        Iterate over the JSON messages until the client disconnects.
+        """
+        try:
+            while True:
+                if model is None:
+                    yield await self.receive_json()
+                else:
+                    yield await self.receive_json(model)
+        except WebSocketDisconnectedError:
+            pass
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None:
+        """
+        Close the connection.
+
+        :param code: The close code.
+        :param reason: The reason for closing the connection.
+        """
+        if self.state is WebSocketState.DISCONNECTED:
+            return
+
+        self.state = WebSocketState.DISCONNECTED
+
+        await self._send(
+            {"type": "websocket.close", "code": code, "reason": reason or ""}
+        )
+
+    async def keepalive(self, cancel_scope: anyio.CancelScope) -> None:
+        """
+        Read the messages of the client and ping it at regular intervals
+        once the connection is accepted, closing it and cancelling the given scope
+        if the client stops answering.
+        """
+        if self._buffer is None or self._messages is None:
+            return
+
+        try:
+            await self._accepted.wait()
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(self._ping, cancel_scope)
+
+                await self._read_messages(self._buffer)
+
+                # The client disconnected
+                tg.cancel_scope.cancel()
+        finally:
+            self._buffer.close()
+            self._messages.close()
+
+    async def _read_messages(self, buffer: MemoryObjectSendStream[Message]) -> None:
+        """
+        Read the messages of the client until it disconnects,
+        handling the keepalive messages and buffering the other ones.
+        """
+        while True:
+            message = await self._receive()
+
+            text = message.get("text")
+            if text == self.pong_message:
+                self._last_pong = time.monotonic()
+
+                continue
+
+            if text == self.ping_message:
+                if self.state is WebSocketState.CONNECTED:
+                    with contextlib.suppress(WebSocketDisconnectedError):
+                        await self.send_text(self.pong_message)
+
+                continue
+
+            await buffer.send(message)
+
+            if message["type"] == "websocket.disconnect":
+                return
+
+    async def _ping(self, cancel_scope: anyio.CancelScope) -> None:
+        assert self.ping_interval is not None
+
+        timeout = self.ping_timeout
+        # The time of the first ping the client has not answered yet
+        unanswered_since: float | None = None
+
+        while self.state is WebSocketState.CONNECTED:
+            now = time.monotonic()
+
+            if unanswered_since is not None and self._last_pong >= unanswered_since:
+                unanswered_since = None
+
+            if (
+                timeout is not None
+                and unanswered_since is not None
+                and now - unanswered_since >= timeout
+            ):
+                await self.close(1011, "Keepalive ping timeout")
+                cancel_scope.cancel()
+
+                return
+
+            try:
+                await self.send_text(self.ping_message)
+            except WebSocketDisconnectedError:
+                return
+
+            if unanswered_since is None:
+                unanswered_since = now
+
+            await anyio.sleep(self.ping_interval)
+
+    async def _send_message(self, message: Message) -> None:
+        if self.state is not WebSocketState.CONNECTED:
+            raise RuntimeError("The WebSocket connection is not open")
+
+        try:
+            await self._send(message)
+        except OSError as e:
+            self.state = WebSocketState.DISCONNECTED
+
+            raise WebSocketDisconnectedError(1006) from e
@@ -1,13 +1,11 @@
 import re
 
-from collections import defaultdict
+from collections import OrderedDict
 from collections.abc import Callable
 from collections.abc import Iterator
 from inspect import Parameter
 from typing import Any
-from typing import Literal
 from typing import NoReturn
-from typing import TypedDict
 
 from expanse.contracts.routing.route_collection import RouteCollection
 from expanse.core.http.exceptions import HTTPException
@@ -15,50 +13,172 @@ from expanse.http.request import Request
 from expanse.http.response import Response
 from expanse.routing.exceptions import RoutingException
 from expanse.routing.route import Route
+from expanse.routing.url_template import URLTemplate
+
+
+class Node:
+    """
+    A node of the dynamic routes tree.
+
+    The children of a node are partitioned into static edges, matched by a single
+    dictionary lookup, and dynamic (parameter) edges, tried in their registration
+    order before the catch-all ones. The regex constraints of the dynamic edges
+    are grouped into a single pattern so that they are all checked with one match
+    per path segment.
+    """
+
+    __slots__ = (
+        "catch_all",
+        "children",
+        "converter",
+        "dynamic",
+        "groups",
+        "matcher",
+        "param",
+        "regex",
+        "routes",
+        "static",
+    )
+
+    def __init__(
+        self,
+        param: str | None = None,
+        regex: re.Pattern[str] | None = None,
+        converter: Callable[[str], Any] | None = None,
+        catch_all: bool = False,
+    ) -> None:
+        self.routes: dict[str, Route] = {}
+        self.param: str | None = param
+        self.regex: re.Pattern[str] | None = regex
+        self.converter: Callable[[str], Any] | None = converter
+        self.catch_all: bool = catch_all
+
+        # All the children of the node, indexed by their raw pattern token
+        self.children: dict[str, Node] = {}
+        self.static: dict[str, Node] = {}
+        self.dynamic: list[Node] = []
+
+        # The grouped regex constraints of the dynamic children, if any,
+        # and the group capturing the match of each child, 0 for the children
+        # whose constraint is checked on its own.
+        self.matcher: re.Pattern[str] | None = None
+        self.groups: list[int] = []
+
+    def child(self, token: str) -> "Node | None":
+        return self.children.get(token)
+
+    def add_child(self, token: str, node: "Node") -> "Node":
+        self.children[token] = node
+
+        if node.param is None:
+            self.static[token] = node
+        elif node.catch_all:
+            self.dynamic.append(node)
+            self._group_regexes()
+        else:
+            # Catch-all edges are only tried once the other dynamic edges failed
+            position = next(
+                (i for i, child in enumerate(self.dynamic) if child.catch_all),
+                len(self.dynamic),
+            )
+            self.dynamic.insert(position, node)
+            self._group_regexes()
+
+        return node
+
+    def _group_regexes(self) -> None:
+        self.matcher = None
+        self.groups = [0] * len(self.dynamic)
+
+        # Each constraint is checked by an optional lookahead capturing its match.
+        # Catch-all constraints apply to the rest of the path and constraints
+        # with their own groups or flags are checked on their own.
+        parts: list[str] = []
+        for position, child in enumerate(self.dynamic):
+            regex = child.regex
+            if (
+                regex is None
+                or child.catch_all
+                or regex.groups
+                or regex.flags != re.UNICODE
+            ):
+                continue
 
+            parts.append(f"(?:(?=({regex.pattern}))|)")
+            self.groups[position] = len(parts)
 
-class Static(TypedDict):
-    routes: dict[str, Route]
-    children: dict[str, "Dynamic | Static"]
-    param: None
-    regex: None
-    converter: None
-    catch_all: Literal[False]
+        if len(parts) < 2:
+            self.groups = [0] * len(self.dynamic)
 
+            return
 
-class Dynamic(TypedDict):
-    routes: dict[str, Route]
-    children: dict[str, "Dynamic | Static"]
-    param: str | None
-    regex: re.Pattern | None
-    converter: Callable[[str], Any] | None
-    catch_all: bool
+        try:
+            self.matcher = re.compile("".join(parts))
+        except re.error:
+            self.groups = [0] * len(self.dynamic)
 
 
-class Finder(RouteCollection):
-    def __init__(self) -> None:
-        self._static: defaultdict[str, Static] = defaultdict(
-            lambda: {
-                "routes": {},
-                "children": {},
-                "param": None,
-                "regex": None,
-                "converter": None,
-                "catch_all": False,
-            }
+class MatchCache:
+    """
+    A bounded LRU cache of dynamic route matches.
+
+    Entries are keyed by method and path and hold the matched route along with
+    its already converted path parameters.
+    """
+
+    __slots__ = ("_entries", "hits", "max_size", "misses")
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict[tuple[str, str], tuple[Route, dict[str, Any]]] = (
+            OrderedDict()
         )
 
-        self._dynamic: Dynamic = {
-            "routes": {},
-            "children": {},
-            "param": None,
-            "regex": None,
-            "converter": None,
-            "catch_all": False,
-        }
+    def get(self, method: str, path: str) -> tuple[Route, dict[str, Any]] | None:
+        key = (method, path)
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+
+        return entry
+
+    def set(self, method: str, path: str, route: Route, params: dict[str, Any]) -> None:
+        key = (method, path)
+
+        self._entries[key] = (route, params)
+        self._entries.move_to_end(key)
+
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class Finder(RouteCollection):
+    def __init__(self, match_cache_size: int = 0) -> None:
+        self._static: dict[str, dict[str, Route]] = {}
+        self._dynamic: Node = Node()
+
+        # Dynamic matches are only cached when a cache size is configured
+        self._match_cache: MatchCache | None = (
+            MatchCache(match_cache_size) if match_cache_size > 0 else None
+        )
 
         self._routes: dict[str, Route] = {}
         self._anonymous_routes: list[Route] = []
+        self._templates: dict[str, URLTemplate] = {}
 
     def add(self, route: Route) -> None:
         for method in sorted(route.methods):
@@ -73,18 +193,40 @@ class Finder(RouteCollection):
     def find(self, name: str) -> Route | None:
         return self._routes.get(name)
 
+    def template(self, name: str) -> URLTemplate | None:
+        if (template := self._templates.get(name)) is not None:
+            return template
+
+        route = self._routes.get(name)
+        if route is None:
+            return None
+
+        template = self._templates[name] = URLTemplate.compile(route.path)
+
+        return template
+
+    @property
+    def match_cache(self) -> MatchCache | None:
+        return self._match_cache
+
     def route(self, method: str, pattern: str, route: Route) -> None:
         if route.name:
             self._routes[route.name] = route
+            # The route may replace a previously named one
+            self._templates.pop(route.name, None)
         else:
             self._anonymous_routes.append(route)
 
+        # A new route can shadow previously cached matches
+        if self._match_cache is not None:
+            self._match_cache.clear()
+
         if "{" not in pattern:
-            self._static[pattern]["routes"][method] = route
+            self._static.setdefault(pattern, {})[method] = route
 
             return
 
-        node: Dynamic | Static = self._dynamic
+        node: Node = self._dynamic
         matches: Iterator[re.Match[str]] = re.finditer(
             r"\{([\w*]+):?([^/]*)}|\[|]|[^/\[\]{}]+", pattern
         )
@@ -92,7 +234,7 @@ class Finder(RouteCollection):
         for match in matches:
             catch_all = False
 
-            if node.get("catch_all"):
+            if node.catch_all:
                 raise RoutingException(
                     "A catch-all parameter must be the last part of the route"
                 )
@@ -101,13 +243,15 @@ class Finder(RouteCollection):
 
             # Leaf
             if token == "[":
-                node["routes"][method] = route
+                node.routes[method] = route
 
                 continue
 
             if token == "]":
                 break
 
+            child = node.child(token)
+
             if param := match[1]:
                 if param.startswith("*"):
                     param = param[1:]
@@ -116,8 +260,10 @@ class Finder(RouteCollection):
 
                     catch_all = True
 
+                    child = node.child(token)
+
                 # Dynamic
-                if token not in node["children"]:
+                if child is None:
                     converter: Callable[[str], Any] | None = None
                     if (
                         param in route.signature.parameters
@@ -127,134 +273,163 @@ class Finder(RouteCollection):
                     ):
                         converter = route.signature.parameters[param].annotation
 
-                    node["children"][token] = {
-                        "routes": {},
-                        "children": {},
-                        "param": param,
-                        "regex": re.compile(match[2]) if match[2] else None,
-                        "converter": converter,
-                        "catch_all": catch_all,
-                    }
-
-            elif token not in node["children"]:
+                    child = node.add_child(
+                        token,
+                        Node(
+                            param=param,
+                            regex=re.compile(match[2]) if match[2] else None,
+                            converter=converter,
+                            catch_all=catch_all,
+                        ),
+                    )
+
+            elif child is None:
                 # Static
-                node["children"][token] = {
-                    "routes": {},
-                    "children": {},
-                    "param": None,
-                    "regex": None,
-                    "converter": None,
-                    "catch_all": False,
-                }
+                child = node.add_child(token, Node())
 
             # Move to next node
-            node = node["children"][token]
+            node = child
 
-        node["routes"][method] = route
+        node.routes[method] = route
 
     def _match(self, request: Request, method: str, path: str) -> Route | None:
-        if path in self._static:
-            if method not in self._static[path]["routes"]:
+        if (routes := self._static.get(path)) is not None:
+            if method not in routes:
+                # WebSocket connections only match WebSocket routes
+                if method == "WEBSOCKET":
+                    return None
+
                 # Find a route that matches all methods
-                if "*" in self._static[path]["routes"]:
-                    return self._static[path]["routes"]["*"]
+                if "*" in routes:
+                    return routes["*"]
 
-                alternative_methods = list(
-                    self._static[request.url.path]["routes"].keys()
+                alternative_methods = self._alternative_methods(
+                    self._static.get(request.url.path, {})
                 )
 
                 return self._find_alternative(request, alternative_methods)
 
-            return self._static[path]["routes"][method]
+            return routes[method]
 
-        params: dict[str, Any] = {}
+        if self._match_cache is not None and (
+            cached := self._match_cache.get(method, path)
+        ):
+            route, params = cached
+            request.path_params.update(params)
 
-        node: Dynamic | Static = self._dynamic
+            return route
 
-        tokens = path.strip("/").split("/")
+        result = self._match_dynamic(path)
+        if result is None:
+            return None
 
-        while tokens and (token := tokens.pop(0)):
-            if node.get("catch_all"):
-                assert node["param"] is not None
+        node, params = result
 
-                params[node["param"]] = "/".join(
-                    [params[node["param"]], token, *tokens]
-                )
+        if not node.routes:
+            return None
 
-                break
+        if method in node.routes:
+            route = node.routes[method]
+        elif method == "WEBSOCKET":
+            return None
+        elif "*" in node.routes:
+            route = node.routes["*"]
+        else:
+            alternative_methods = self._alternative_methods(node.routes)
 
-            # Check if there is a static match
-            if token in node["children"]:
-                node = node["children"][token]
+            return self._find_alternative(request, alternative_methods)
 
-                continue
+        if self._match_cache is not None:
+            self._match_cache.set(method, path, route, params)
 
-            # Handle dynamic match
-            found = False
+        request.path_params.update(params)
 
-            for child in node["children"].values():
-                if child.get("param") is None:
-                    continue
+        return route
 
-                assert child["param"] is not None
+    def _match_dynamic(self, path: str) -> tuple[Node, dict[str, Any]] | None:
+        params: dict[str, Any] = {}
 
-                if child.get("regex") is None and child.get("converter") is None:
-                    params[child["param"]] = token
-                    node = child
-                    found = True
+        node = self._match_node(self._dynamic, path.strip("/").split("/"), 0, params)
+        if node is None:
+            return None
 
-                    break
+        return node, params
 
-                regex = child["regex"]
-                converter = child["converter"]
+    def _match_node(
+        self, node: Node, tokens: list[str], index: int, params: dict[str, Any]
+    ) -> Node | None:
+        """
+        Match the path segments starting at the given index against the subtree
+        of the given node, static edges first, and return the node of the route.
 
-                if regex is not None:
-                    if not child["catch_all"] and not re.match(regex, token):
-                        continue
-                    elif child["catch_all"]:
-                        param = "/".join([token, *tokens])
-                        if not re.match(regex, param):
-                            continue
-                        else:
-                            params[child["param"]] = param
-                            tokens.clear()
-                            node = child
-                            found = True
-
-                            break
-
-                if converter is not None:
-                    try:
-                        params[child["param"]] = converter(token)
-                    except (ValueError, TypeError):
-                        continue
-                else:
-                    params[child["param"]] = token
+        Edges leading to a dead end are backtracked from, so that the next
+        matching edges of the same level are tried.
+        """
+        count = len(tokens)
+        if index == count or not tokens[index]:
+            return node if node.routes else None
 
-                node = child
-                found = True
+        if node.catch_all:
+            assert node.param is not None
 
-                break
+            params[node.param] = "/".join([params[node.param], *tokens[index:]])
+
+            return node if node.routes else None
+
+        token = tokens[index]
 
-            if not found:
-                return None
+        # Check if there is a static match
+        child = node.static.get(token)
+        if child is not None and (
+            found := self._match_node(child, tokens, index + 1, params)
+        ):
+            return found
 
-        if not node["routes"]:
+        if not node.dynamic:
             return None
 
-        if method not in node["routes"]:
-            if "*" in node["routes"]:
-                request.path_params.update(params)
+        # Handle dynamic matches
+        matched = node.matcher.match(token) if node.matcher is not None else None
+        groups = node.groups
 
-                return node["routes"]["*"]
+        for position, child in enumerate(node.dynamic):
+            assert child.param is not None
 
-            alternative_methods = list(node["routes"].keys())
+            regex = child.regex
 
-            return self._find_alternative(request, alternative_methods)
+            if regex is not None:
+                if child.catch_all:
+                    value = "/".join(tokens[index:])
+                    if regex.match(value) is None or not child.routes:
+                        continue
 
-        request.path_params.update(params)
+                    params[child.param] = value
+
+                    return child
+
+                if matched is not None and groups[position]:
+                    if matched.group(groups[position]) is None:
+                        continue
+                elif regex.match(token) is None:
+                    continue
+
+            if child.converter is not None:
+                try:
+                    params[child.param] = child.converter(token)
+                except (ValueError, TypeError):
+                    continue
+            else:
+                params[child.param] = token
+
+            if found := self._match_node(child, tokens, index + 1, params):
+                return found
+
+            del params[child.param]
+
+        return None
 
-        return node["routes"][method]
+    def _alternative_methods(self, routes: dict[str, Route]) -> list[str]:
+        return [method for method in routes if method != "WEBSOCKET"]
 
     def _find_alternative(
         self, request: Request, alternative_methods: list[str]
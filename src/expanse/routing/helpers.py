@@ -45,6 +45,12 @@ def delete(
     return _create_decorator("DELETE", uri, name, middleware)
 
 
+def ws(
+    uri: str, name: str | None = None, middleware: type[Middleware] | str | None = None
+) -> Callable[[Endpoint], Endpoint]:
+    return _create_decorator("WEBSOCKET", uri, name, middleware)
+
+
 def group(
     name: str | None = None,
     prefix: str | None = None,
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import partial
+from typing import TYPE_CHECKING
+from typing import Annotated
+from typing import Any
+from typing import get_args
+from typing import get_origin
+
+import msgspec
+
+from expanse.container.container import Container
+from expanse.container.container import _cached_class_for_parameter
+from expanse.container.exceptions import ContainerException
+from expanse.container.exceptions import ResolutionException
+from expanse.http.form import Form
+from expanse.http.json import JSON
+from expanse.http.query import Query
+from expanse.support._concurrency import should_run_as_async
+from expanse.support._model_types import is_msgspec_struct
+from expanse.support._model_types import is_pydantic_model
+
+
+if TYPE_CHECKING:
+    import inspect
+
+    from collections.abc import Callable
+
+    from expanse.http.request import Request
+    from expanse.routing.route import Route
+
+
+class ArgumentSource(IntEnum):
+    PATH = 1
+    FORM = 2
+    JSON = 3
+    QUERY = 4
+    CONTAINER = 5
+    DEFAULT = 6
+
+
+@dataclass(frozen=True, slots=True)
+class ArgumentStep:
+    name: str
+    source: ArgumentSource
+    # The Form subclass, the model, the model decoder or the container abstract,
+    # depending on the source.
+    target: Any = None
+    default: Any = None
+
+
+class InvocationPlan:
+    """
+    A flat, precompiled description of how to call the endpoint of a route.
+
+    Introspecting the endpoint signature — which parameters are path parameters,
+    which ones are forms or typed JSON/query payloads and which ones must be
+    resolved from the container — only depends on the route itself, so it is done
+    once and the resulting steps are replayed for every request.
+    """
+
+    __slots__ = (
+        "_endpoint_class",
+        "_endpoint_method",
+        "_qualname",
+        "_steps",
+        "function",
+        "is_async",
+        "is_static",
+        "should_run_as_async",
+    )
+
+    def __init__(
+        self,
+        steps: list[ArgumentStep],
+        *,
+        function: Callable[..., Any],
+        endpoint_class: type | None = None,
+        endpoint_method: str | None = None,
+        is_async: bool = False,
+        is_static: bool = True,
+    ) -> None:
+        self._steps: tuple[ArgumentStep, ...] = tuple(steps)
+        self._endpoint_class: type | None = endpoint_class
+        self._endpoint_method: str | None = endpoint_method
+        self._qualname: str = function.__qualname__
+        self.function: Callable[..., Any] = function
+        self.is_async: bool = is_async
+        self.should_run_as_async: bool = should_run_as_async(function)
+
+        # Whether every argument of the endpoint is known at compile time.
+        self.is_static: bool = is_static
+
+    @classmethod
+    def compile(cls, route: Route) -> InvocationPlan:
+        endpoint_class: type | None = None
+        endpoint_method: str | None = None
+        if isinstance(route.endpoint, tuple):
+            endpoint_class, endpoint_method = route.endpoint
+            function = getattr(endpoint_class, endpoint_method)
+        else:
+            function = route.endpoint
+
+        _globals: dict[str, Any] | None = getattr(function, "__globals__", None)
+
+        # Signatures relying on positional-only or variadic parameters
+        # cannot be called with keyword arguments only, so their dependencies
+        # are left to the container at call time.
+        is_static = all(
+            parameter.kind in (parameter.POSITIONAL_OR_KEYWORD, parameter.KEYWORD_ONLY)
+            for parameter in route.signature.parameters.values()
+        )
+
+        steps: list[ArgumentStep] = []
+        dependencies: list[ArgumentStep] = []
+
+        for name, parameter in route.signature.parameters.items():
+            if step := cls._compile_request_step(name, parameter, route):
+                steps.append(step)
+
+                continue
+
+            if not is_static:
+                continue
+
+            klass = _cached_class_for_parameter(parameter, _globals)
+            if klass is not None:
+                dependencies.append(ArgumentStep(name, ArgumentSource.CONTAINER, klass))
+            elif parameter.default is not parameter.empty:
+                dependencies.append(
+                    ArgumentStep(
+                        name, ArgumentSource.DEFAULT, default=parameter.default
+                    )
+                )
+
+        # Request-bound arguments are extracted before any dependency
+        # is resolved from the container.
+        steps.extend(dependencies)
+
+        return cls(
+            steps,
+            function=function,
+            endpoint_class=endpoint_class,
+            endpoint_method=endpoint_method,
+            is_async=route.is_async,
+            is_static=is_static,
+        )
+
+    async def endpoint(self, container: Container) -> Callable[..., Any]:
+        """
+        Retrieve the callable endpoint, resolving its controller if necessary.
+        """
+        if self._endpoint_class is None:
+            return self.function
+
+        assert self._endpoint_method is not None
+
+        instance: Any = await container.get(self._endpoint_class)
+
+        return getattr(instance, self._endpoint_method)
+
+    async def arguments(self, request: Request, container: Container) -> dict[str, Any]:
+        """
+        Build the keyword arguments of the endpoint for the given request.
+        """
+        arguments: dict[str, Any] = {}
+
+        for step in self._steps:
+            match step.source:
+                case ArgumentSource.PATH:
+                    arguments[step.name] = request.path_params[step.name]
+                case ArgumentSource.CONTAINER:
+                    arguments[step.name] = await self._resolve(step, container)
+                case ArgumentSource.DEFAULT:
+                    arguments[step.name] = step.default
+                case ArgumentSource.FORM:
+                    arguments[step.name] = step.target(await request.form)
+                case ArgumentSource.JSON:
+                    arguments[step.name] = await request.decode_json(step.target)
+                case ArgumentSource.QUERY:
+                    arguments[step.name] = step.target(request.query_params)
+
+        return arguments
+
+    async def _resolve(self, step: ArgumentStep, container: Container) -> Any:
+        abstract = step.target
+        if abstract is Container:
+            # Shortcut for the container itself, see Container._resolve_class()
+            return container
+
+        try:
+            return await container.get(container._get_alias(abstract))
+        except ContainerException as e:
+            raise ResolutionException(
+                f'Unable to resolve dependency with name "{step.name}" '
+                f"(type: {getattr(abstract, '__module__', '')}."
+                f"{getattr(abstract, '__qualname__', abstract)}) "
+                f"in {self._qualname}"
+            ) from e
+
+    @classmethod
+    def _compile_request_step(
+        cls, name: str, parameter: inspect.Parameter, route: Route
+    ) -> ArgumentStep | None:
+        annotation = parameter.annotation
+
+        if name in route.param_names:
+            return ArgumentStep(name, ArgumentSource.PATH)
+
+        if isinstance(annotation, type) and issubclass(annotation, Form):
+            return ArgumentStep(name, ArgumentSource.FORM, annotation)
+
+        if get_origin(annotation) is not Annotated:
+            return None
+
+        model, data_type, *_ = get_args(annotation)
+        if not is_pydantic_model(model) and not is_msgspec_struct(model):
+            return None
+
+        decoder: Callable[[Any], Any] = (
+            model.model_validate
+            if is_pydantic_model(model)
+            else partial(msgspec.convert, type=model, strict=False)
+        )
+
+        if _is_marked_with(data_type, JSON):
+            # JSON bodies are decoded straight into the model
+            return ArgumentStep(name, ArgumentSource.JSON, model)
+
+        if _is_marked_with(data_type, Query):
+            return ArgumentStep(name, ArgumentSource.QUERY, decoder)
+
+        return None
+
+
+def _is_marked_with(metadata: Any, marker: object) -> bool:
+    """
+    Check whether the metadata of an Annotated type is the given marker class,
+    one of its subclasses or one of its instances.
+    """
+    klass = metadata if isinstance(metadata, type) else type(metadata)
+
+    return marker in klass.__mro__
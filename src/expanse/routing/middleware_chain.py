@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from collections.abc import Callable
+    from collections.abc import Sequence
+
+    from expanse.container.container import Container
+    from expanse.core.http.middleware.middleware import Middleware
+    from expanse.http.request import Request
+    from expanse.http.response import Response
+    from expanse.types.http.middleware import RequestHandler
+
+
+class SingletonMiddlewareRegistry:
+    """
+    The instances of the singleton middleware of an application.
+
+    The registry is bound as a singleton in the application container so that
+    the global middleware and the route middleware share the same instances.
+    """
+
+    __slots__ = ("_instances",)
+
+    def __init__(self) -> None:
+        self._instances: dict[type[Middleware], Middleware] = {}
+
+    async def get(
+        self, middleware: type[Middleware], container: Container
+    ) -> Middleware:
+        instance = self._instances.get(middleware)
+        if instance is None:
+            instance = self._instances.setdefault(
+                middleware, await container.get(middleware)
+            )
+
+        return instance
+
+
+class MiddlewareChain:
+    """
+    The middleware of a route, or of the global stack, expanded once
+    and shared by every request going through them.
+
+    Singleton middleware are resolved the first time they are needed and reused
+    afterwards, while the other ones are resolved for each request. The pipeline
+    linking the middleware to the handler of a request is built for each request,
+    since both depend on the request scoped container.
+    """
+
+    __slots__ = ("_middleware", "_pipes", "_singletons")
+
+    def __init__(self, middleware: Sequence[type[Middleware]]) -> None:
+        self._middleware: tuple[type[Middleware], ...] = tuple(middleware)
+        self._singletons: dict[type[Middleware], Middleware] = {}
+        # The handlers of the middleware, once they are all resolved singletons
+        self._pipes: list[Callable[[Request, RequestHandler], Awaitable[Response]]] = []
+
+    @property
+    def middleware(self) -> tuple[type[Middleware], ...]:
+        return self._middleware
+
+    async def pipes(
+        self, container: Container
+    ) -> list[Callable[[Request, RequestHandler], Awaitable[Response]]]:
+        """
+        Retrieve the handlers of the middleware of the chain.
+
+        :param container: The scoped container used to resolve non-singleton middleware.
+        """
+        if self._pipes or not self._middleware:
+            return self._pipes
+
+        pipes: list[Callable[[Request, RequestHandler], Awaitable[Response]]] = []
+        shared = True
+
+        for middleware in self._middleware:
+            instance = self._singletons.get(middleware)
+
+            if instance is None:
+                if getattr(middleware, "is_singleton", False):
+                    registry = await container.get(SingletonMiddlewareRegistry)
+                    instance = self._singletons[middleware] = await registry.get(
+                        middleware, container
+                    )
+                else:
+                    instance = await container.get(middleware)
+                    shared = False
+
+            pipes.append(instance.handle)
+
+        if shared:
+            self._pipes = pipes
+
+        return pipes
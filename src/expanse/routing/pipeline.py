@@ -1,6 +1,5 @@
 from collections.abc import Awaitable
 from collections.abc import Callable
-from functools import wraps
 from typing import Self
 
 from expanse.container.container import Container
@@ -43,7 +42,7 @@ class Pipeline:
         _set_container(self._container)
 
         try:
-            pipeline = await self._build_pipeline(handler)
+            pipeline = self._build_pipeline(handler)
             return await pipeline(self._request)
         except Exception as e:
             from expanse.contracts.debug.exception_handler import ExceptionHandler
@@ -59,25 +58,32 @@ class Pipeline:
         finally:
             _set_container(None)
 
-    async def _build_pipeline(self, handler: RequestHandler) -> RequestHandler:
+    def _build_pipeline(self, handler: RequestHandler) -> RequestHandler:
         stack = handler
 
         for pipe in self._pipes[::-1]:
-            stack = await self._wrap(pipe)(stack)
+            stack = _Link(pipe, stack)
 
         return stack
 
-    def _wrap(
-        self, pipe: Callable[[Request, RequestHandler], Awaitable[Response]]
-    ) -> Callable[[RequestHandler], Awaitable[RequestHandler]]:
-        @wraps(pipe)
-        async def decorator(
-            next_call: RequestHandler,
-        ) -> Callable[[Request], Awaitable[Response]]:
-            @wraps(next_call)
-            async def handler(request: Request) -> Response:
-                return await pipe(request, next_call)
 
-            return handler
+class _Link:
+    """
+    A link of the pipeline, calling a pipe with the next handler of the chain.
+
+    Links are lightweight slotted objects rather than nested closures so that
+    chaining a pipeline for a request only costs one allocation per pipe.
+    """
+
+    __slots__ = ("_next_call", "_pipe")
+
+    def __init__(
+        self,
+        pipe: Callable[[Request, RequestHandler], Awaitable[Response]],
+        next_call: RequestHandler,
+    ) -> None:
+        self._pipe = pipe
+        self._next_call = next_call
 
-        return decorator
+    async def __call__(self, request: Request) -> Response:
+        return await self._pipe(request, self._next_call)
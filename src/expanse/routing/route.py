@@ -2,12 +2,21 @@ import inspect
 import re
 import types
 
+from typing import TYPE_CHECKING
 from typing import Self
 
 from expanse.core.http.middleware.middleware import Middleware
 from expanse.types.routing import Endpoint
 
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from expanse.http.middleware.coalesce_requests import CoalescingOptions
+    from expanse.http.response_cache import ResponseCacheOptions
+    from expanse.routing.invocation_plan import InvocationPlan
+
+
 class Route:
     def __init__(
         self,
@@ -55,9 +64,17 @@ class Route:
         self.methods = [m.upper() for m in method]
         self.name: str | None = name
         self._param_names: set[str] | None = None
+        self._invocation_plan: InvocationPlan | None = None
 
         self._middlewares: list[type[Middleware] | str] = []
 
+        # The response cache options of the route, see Route.cache().
+        self.response_cache: ResponseCacheOptions | None = None
+        # The request coalescing options of the route, see Route.coalesce().
+        self.coalescing: CoalescingOptions | None = None
+        # The names of the rate limits of the route, see Route.throttle().
+        self.rate_limits: tuple[str, ...] = ()
+
     @classmethod
     def get(cls, path: str, endpoint: Endpoint, *, name: str | None = None) -> Self:
         return cls("GET", path, endpoint, name=name)
@@ -86,6 +103,12 @@ class Route:
     def head(cls, path: str, endpoint: Endpoint, *, name: str | None = None) -> Self:
         return cls("HEAD", path, endpoint, name=name)
 
+    @classmethod
+    def websocket(
+        cls, path: str, endpoint: Endpoint, *, name: str | None = None
+    ) -> Self:
+        return cls("WEBSOCKET", path, endpoint, name=name)
+
     @property
     def param_names(self) -> set[str]:
         if self._param_names is None:
@@ -93,6 +116,20 @@ class Route:
 
         return self._param_names
 
+    @property
+    def invocation_plan(self) -> "InvocationPlan":
+        """
+        The precompiled invocation plan of the route endpoint.
+
+        It is compiled on first access and reused for every subsequent request.
+        """
+        if self._invocation_plan is None:
+            from expanse.routing.invocation_plan import InvocationPlan
+
+            self._invocation_plan = InvocationPlan.compile(self)
+
+        return self._invocation_plan
+
     @property
     def formatted_endpoint(self) -> str:
         if isinstance(self.endpoint, tuple):
@@ -115,3 +152,57 @@ class Route:
         self._middlewares = list(middlewares) + self._middlewares
 
         return self
+
+    def cache(self, ttl: int | None = None, *, vary: "Sequence[str]" = ()) -> Self:
+        """
+        Serve the responses of the route from the cache.
+
+        :param ttl: The number of seconds responses are cached for, when they
+                    do not specify it with their Cache-Control header.
+        :param vary: The request headers the responses depend on.
+        """
+        from expanse.http.middleware.cache_response import CacheResponse
+        from expanse.http.response_cache import ResponseCacheOptions
+
+        self.response_cache = ResponseCacheOptions(ttl, tuple(vary))
+
+        if CacheResponse not in self._middlewares:
+            self._middlewares.append(CacheResponse)
+
+        return self
+
+    def coalesce(
+        self, timeout: float | None = None, *, vary: "Sequence[str]" = ()
+    ) -> Self:
+        """
+        Collapse identical concurrent requests to the route into a single call.
+
+        :param timeout: The maximum number of seconds to wait for the response
+                        of an identical request being processed.
+        :param vary: The request headers the responses depend on.
+        """
+        from expanse.http.middleware.coalesce_requests import CoalesceRequests
+        from expanse.http.middleware.coalesce_requests import CoalescingOptions
+
+        self.coalescing = CoalescingOptions(timeout, tuple(vary))
+
+        if CoalesceRequests not in self._middlewares:
+            self._middlewares.append(CoalesceRequests)
+
+        return self
+
+    def throttle(self, *names: str) -> Self:
+        """
+        Limit the rate of requests to the route.
+
+        :param names: The names of the rate limits to apply,
+                      the `default` one if none is given.
+        """
+        from expanse.http.middleware.throttle_requests import ThrottleRequests
+
+        self.rate_limits = names
+
+        if ThrottleRequests not in self._middlewares:
+            self._middlewares.append(ThrottleRequests)
+
+        return self
@@ -95,6 +95,14 @@ class RouteGroup(Registrar):
 
         return route
 
+    def websocket(
+        self, path: str, endpoint: Endpoint, *, name: str | None = None
+    ) -> Route:
+        route = Route.websocket(path, endpoint, name=name)
+        self.add_route(route)
+
+        return route
+
     def middleware(self, *middlewares: type[Middleware] | str) -> Self:
         self._middlewares.extend(middlewares)
 
@@ -1,35 +1,26 @@
-from collections.abc import Awaitable
-from collections.abc import Callable
 from collections.abc import Generator
 from contextlib import contextmanager
 from typing import TYPE_CHECKING
-from typing import Annotated
+from typing import Any
 from typing import Self
-from typing import get_args
-from typing import get_origin
-
-import msgspec
 
 from expanse.configuration.config import Config
 from expanse.container.container import Container
 from expanse.contracts.routing.route_collection import RouteCollection
 from expanse.contracts.routing.router import Router as RouterContract
 from expanse.core.http.exceptions import HTTPException
-from expanse.http.form import Form
-from expanse.http.json import JSON
-from expanse.http.query import Query
+from expanse.http.exceptions import WebSocketDisconnectedError
 from expanse.http.request import Request
 from expanse.http.response import Response
 from expanse.http.response_adapter import ResponseAdapter
+from expanse.http.websocket import WebSocket
 from expanse.routing.finder import Finder
+from expanse.routing.middleware_chain import MiddlewareChain
 from expanse.routing.pipeline import Pipeline
 from expanse.routing.route import Route
 from expanse.routing.route_group import RouteGroup
-from expanse.support._concurrency import should_run_as_async
 from expanse.support._concurrency import sync_to_async
 from expanse.support._concurrency import warn_about_implicit_async_safe_status
-from expanse.support._model_types import is_msgspec_struct
-from expanse.support._model_types import is_pydantic_model
 from expanse.types.http.middleware import RequestHandler
 from expanse.types.routing import Endpoint
 
@@ -41,8 +32,13 @@ if TYPE_CHECKING:
 class Router(RouterContract):
     def __init__(self, config: Config) -> None:
         self._config: Config = config
-        self._finder: Finder = Finder()
+        self._finder: Finder = Finder(
+            match_cache_size=config.get("http.route_match_cache_size", 0)
+        )
         self._middleware_groups: dict[str, list[type[Middleware]]] = {}
+        self._middleware_chains: dict[
+            tuple[type[Middleware] | str, ...], MiddlewareChain
+        ] = {}
 
     @property
     def routes(self) -> RouteCollection:
@@ -94,6 +90,14 @@ class Router(RouterContract):
 
         return route
 
+    def websocket(
+        self, path: str, endpoint: Endpoint, *, name: str | None = None
+    ) -> Route:
+        route = Route.websocket(path, endpoint, name=name)
+        self.add_route(route)
+
+        return route
+
     def add_route(self, route: Route) -> Route:
         self._finder.add(route)
 
@@ -125,6 +129,9 @@ class Router(RouterContract):
     def middleware_group(self, name: str, middleware: list[type["Middleware"]]) -> Self:
         self._middleware_groups[name] = middleware
 
+        # The middleware chains relying on the group must be rebuilt
+        self._middleware_chains.clear()
+
         return self
 
     async def handle(self, container: Container, request: Request) -> Response:
@@ -139,82 +146,67 @@ class Router(RouterContract):
         request.set_route(route)
 
         handler = self._route_handler(route, container)
+        if isinstance(request, WebSocket):
+            handler = self._websocket_handler(handler)
+
+        chain = self._middleware_chain(route)
+
+        return (
+            await Pipeline(container)
+            .use(await chain.pipes(container))
+            .send(request)
+            .to(handler)
+        )
+
+    def _middleware_chain(self, route: Route) -> MiddlewareChain:
+        # Routes sharing the same middleware declarations share the same chain
+        key = tuple(route.get_middleware())
+
+        chain = self._middleware_chains.get(key)
+        if chain is None:
+            chain = MiddlewareChain(self._expand_middleware(key))
+            self._middleware_chains[key] = chain
 
-        pipes: list[Callable[[Request, RequestHandler], Awaitable[Response]]] = []
-        for middleware in route.get_middleware():
+        return chain
+
+    def _expand_middleware(
+        self, middlewares: tuple[type["Middleware"] | str, ...]
+    ) -> list[type["Middleware"]]:
+        expanded: list[type[Middleware]] = []
+
+        for middleware in middlewares:
             if isinstance(middleware, str):
                 if middleware not in self._middleware_groups:
                     raise ValueError(
                         f"Middleware group '{middleware}' not found in the middleware groups."
                     )
 
-                for group_middleware in self._middleware_groups[middleware]:
-                    pipes.append((await container.get(group_middleware)).handle)
+                expanded.extend(self._middleware_groups[middleware])
 
                 continue
 
-            pipes.append((await container.get(middleware)).handle)
+            expanded.append(middleware)
 
-        return await Pipeline(container).use(pipes).send(request).to(handler)
+        return expanded
 
     def _route_handler(self, route: Route, container: Container) -> RequestHandler:
-        async def handler(request: Request) -> Response:
-            arguments = {}
+        plan = route.invocation_plan
 
-            for name, parameter in route.signature.parameters.items():
-                if name in route.param_names:
-                    arguments[name] = request.path_params[name]
-
-                elif isinstance(parameter.annotation, type) and issubclass(
-                    parameter.annotation, Form
-                ):
-                    arguments[name] = parameter.annotation(await request.form)
+        async def handler(request: Request) -> Response:
+            arguments = await plan.arguments(request, container)
+            endpoint = await plan.endpoint(container)
 
-                elif get_origin(parameter.annotation) is Annotated and (
-                    is_pydantic_model(
-                        (origin_args := get_args(parameter.annotation))[0]
-                    )
-                    or is_msgspec_struct(origin_args[0])
-                ):
-                    validation_model = origin_args[0]
-
-                    data_type: type[JSON] | type[Query] | JSON | Query = origin_args[1]
-
-                    if isinstance(data_type, JSON) or issubclass(data_type, JSON):  # type: ignore[arg-type]
-                        raw = await request.json
-
-                        arguments[name] = (
-                            validation_model.model_validate(raw)
-                            if is_pydantic_model(validation_model)
-                            else msgspec.convert(
-                                raw, type=validation_model, strict=False
-                            )
-                        )
-
-                    elif isinstance(data_type, Query) or issubclass(data_type, Query):  # type: ignore[arg-type]
-                        arguments[name] = (
-                            validation_model.model_validate(request.query_params)
-                            if is_pydantic_model(validation_model)
-                            else msgspec.convert(
-                                request.query_params,
-                                type=validation_model,
-                                strict=False,
-                            )
-                        )
-
-            if isinstance(route.endpoint, tuple):
-                instance: type = await container.get(route.endpoint[0])
-                endpoint = getattr(instance, route.endpoint[1])
+            if plan.is_static:
+                positional: list[Any] = []
+                keywords = arguments
             else:
-                endpoint = route.endpoint
+                positional, keywords = await container._resolve_signature(
+                    route.signature, kwargs=arguments, callable=endpoint
+                )
 
-            positional, keywords = await container._resolve_signature(
-                route.signature, kwargs=arguments, callable=endpoint
-            )
-
-            if route.is_async:
+            if plan.is_async:
                 raw_response = await endpoint(*positional, **keywords)
-            elif not should_run_as_async(endpoint):
+            elif not plan.should_run_as_async:
                 warn_about_implicit_async_safe_status(endpoint, self._config)
 
                 raw_response = endpoint(*positional, **keywords)
@@ -225,6 +217,11 @@ class Router(RouterContract):
             if isinstance(raw_response, Response):
                 return raw_response
 
+            # WebSocket endpoints communicate through the connection itself,
+            # a response is only used to deny the connections left pending.
+            if isinstance(request, WebSocket):
+                return Response(status_code=403)
+
             declared_response_type = route.signature.return_annotation
 
             adapter = await container.get(ResponseAdapter)
@@ -234,3 +231,13 @@ class Router(RouterContract):
             )
 
         return handler
+
+    def _websocket_handler(self, handler: RequestHandler) -> RequestHandler:
+        async def websocket_handler(request: Request) -> Response:
+            try:
+                return await handler(request)
+            except WebSocketDisconnectedError:
+                # The client is gone, there is nobody left to respond to
+                return Response()
+
+        return websocket_handler
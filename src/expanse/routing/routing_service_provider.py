@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 
 from expanse.contracts.routing.router import Router as RouterContract
+from expanse.routing.middleware_chain import SingletonMiddlewareRegistry
 from expanse.routing.router import Router
 from expanse.routing.url_generator import URLGenerator
 from expanse.support.service_provider import ServiceProvider
@@ -14,6 +15,7 @@ class RoutingServiceProvider(ServiceProvider):
     async def register(self) -> None:
         self._container.singleton(RouterContract, Router)
         self._container.alias(RouterContract, "router")
+        self._container.singleton(SingletonMiddlewareRegistry)
 
     async def boot(self) -> None:
         await self._container.on_resolved("view", self._register_view_locals)
@@ -0,0 +1,154 @@
+import re
+
+from typing import Any
+from urllib.parse import urlencode
+
+from expanse.routing.exceptions import InvalidURLParameter
+from expanse.routing.exceptions import NotEnoughURLParameters
+
+
+_TOKEN_REGEX = re.compile(r"\{([\w*]+):?([^/]*)}|\[|]")
+
+
+class Slot:
+    """
+    A parameter slot of a URL template.
+    """
+
+    __slots__ = ("name", "pattern", "regex")
+
+    def __init__(self, name: str, regex: str | None = None) -> None:
+        self.name: str = name
+        self.regex: str | None = regex
+        self.pattern: re.Pattern[str] | None = re.compile(regex) if regex else None
+
+    def format(self, value: Any) -> str:
+        formatted = str(value)
+
+        if self.pattern is not None and self.pattern.match(formatted) is None:
+            raise InvalidURLParameter(
+                f"Parameter [{self.name}] does not match the regex [{self.regex}]"
+            )
+
+        return formatted
+
+
+class Segment:
+    """
+    A sequence of static pieces, parameter slots and nested optional segments.
+    """
+
+    __slots__ = ("names", "parts", "required")
+
+    def __init__(self, parts: list["str | Slot | Segment"]) -> None:
+        self.parts: tuple[str | Slot | Segment, ...] = tuple(parts)
+        self.names: frozenset[str] = frozenset(
+            name
+            for part in self.parts
+            if not isinstance(part, str)
+            for name in ((part.name,) if isinstance(part, Slot) else part.names)
+        )
+        self.required: tuple[str, ...] = tuple(
+            part.name for part in self.parts if isinstance(part, Slot)
+        )
+
+    def format(self, parameters: dict[str, Any]) -> str:
+        pieces: list[str] = []
+
+        for part in self.parts:
+            if isinstance(part, str):
+                pieces.append(part)
+            elif isinstance(part, Slot):
+                pieces.append(part.format(parameters[part.name]))
+            elif all(name in parameters for name in part.required):
+                # Optional segments are only rendered when all of their
+                # own parameters have been provided.
+                pieces.append(part.format(parameters))
+
+        return "".join(pieces)
+
+
+class URLTemplate:
+    """
+    A route path compiled once into a formatter.
+
+    The path is split into static pieces, parameter slots — with their optional
+    regex validators — and optional segments, so that generating a URL does not
+    require to parse the path again.
+    """
+
+    __slots__ = ("_root", "names", "path", "required")
+
+    def __init__(self, path: str, root: Segment) -> None:
+        # The path of the route, without the parameters regexes.
+        self.path: str = path
+        self.names: frozenset[str] = root.names
+        self.required: tuple[str, ...] = root.required
+        self._root: Segment = root
+
+    @classmethod
+    def compile(cls, path: str) -> "URLTemplate":
+        stack: list[list[str | Slot | Segment]] = [[]]
+        display: list[str] = []
+        position = 0
+
+        for match in _TOKEN_REGEX.finditer(path):
+            if match.start() > position:
+                stack[-1].append(path[position : match.start()])
+
+            display.append(path[position : match.start()])
+            position = match.end()
+            token = match[0]
+
+            if token == "[":
+                stack.append([])
+                display.append(token)
+            elif token == "]":
+                display.append(token)
+                if len(stack) > 1:
+                    segment = Segment(stack.pop())
+                    stack[-1].append(segment)
+            else:
+                raw_name = match[1]
+                stack[-1].append(Slot(raw_name.removeprefix("*"), match[2] or None))
+                display.append(f"{{{raw_name}}}")
+
+        if position < len(path):
+            stack[-1].append(path[position:])
+            display.append(path[position:])
+
+        # Unbalanced optional segments are closed at the end of the path
+        while len(stack) > 1:
+            segment = Segment(stack.pop())
+            stack[-1].append(segment)
+
+        return cls("".join(display), Segment(stack[0]))
+
+    def format(self, parameters: dict[str, Any]) -> str:
+        """
+        Build a path from the template.
+
+        Parameters that are not part of the template are appended
+        as a query string.
+
+        :param parameters: The parameters to substitute.
+        """
+        missing = [name for name in self.required if name not in parameters]
+        if missing:
+            raise NotEnoughURLParameters(
+                f"Not enough parameters for URL {self.path}: "
+                f"missing {', '.join(sorted(missing))}"
+            )
+
+        path = self._root.format(parameters)
+
+        if not self.names.issuperset(parameters):
+            query = {
+                name: value
+                for name, value in parameters.items()
+                if name not in self.names
+            }
+
+            return f"{path}?{urlencode(query)}"
+
+        return path
@@ -0,0 +1,19 @@
+from expanse.console.commands.command import Command
+from expanse.static.static_builder import StaticBuilder
+
+
+class StaticBuildCommand(Command):
+    name: str = "static build"
+    description: str = (
+        "Build the static assets with fingerprinted names and precompressed variants."
+    )
+
+    async def handle(self, builder: StaticBuilder) -> int:
+        manifest = builder.build()
+
+        self.line(
+            f"{len(manifest)} static assets built in {builder.build_path}.",
+            style="success",
+        )
+
+        return 0
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import json
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
+
+class Manifest:
+    """
+    The mapping of static assets to their fingerprinted paths.
+    """
+
+    __slots__ = ("_assets", "_fingerprinted")
+
+    def __init__(self, assets: Mapping[str, str]) -> None:
+        self._assets: dict[str, str] = dict(assets)
+        self._fingerprinted: frozenset[str] = frozenset(self._assets.values())
+
+    @classmethod
+    def load(cls, path: Path) -> Manifest:
+        with path.open() as f:
+            return cls(json.load(f))
+
+    def dump(self, path: Path) -> None:
+        with path.open("w") as f:
+            json.dump(self._assets, f, indent=2, sort_keys=True)
+
+    def get(self, path: str) -> str:
+        """
+        Retrieve the fingerprinted path of an asset, or the path itself
+        if the asset is not part of the manifest.
+        """
+        return self._assets.get(path, path)
+
+    def is_fingerprinted(self, path: str) -> bool:
+        """
+        Check whether the given path is the fingerprinted path of an asset.
+        """
+        return path in self._fingerprinted
+
+    def all(self) -> dict[str, str]:
+        return dict(self._assets)
+
+    def __len__(self) -> int:
+        return len(self._assets)
@@ -1,30 +1,103 @@
-import os
-
 from pathlib import Path
 from typing import Self
 
+from expanse.http.compression import negotiate_encoding
 from expanse.http.helpers import abort
-from expanse.http.helpers import file_
+from expanse.http.request import Request
 from expanse.http.response import Response
+from expanse.http.responses.file import FileResponse
+from expanse.static.manifest import Manifest
+from expanse.static.static_index import StaticAsset
+from expanse.static.static_index import StaticIndex
+from expanse.support._concurrency import sync_to_async
 
 
 class Static:
     def __init__(
-        self, directories: list[Path], prefix: str, url: str | None = None
+        self,
+        directories: list[Path],
+        prefix: str,
+        url: str | None = None,
+        *,
+        debug: bool = False,
+        cache_control: str | None = None,
+        immutable_cache_control: str | None = None,
+        manifest: Manifest | None = None,
+        excluded: list[Path] | None = None,
+        max_memory_file_size: int = 0,
+        memory_size: int = 0,
     ) -> None:
-        self._directories = directories
         self._prefix: str = prefix.rstrip("/")
         self._url: str | None = url.rstrip("/") if url is not None else None
+        self._debug: bool = debug
+        self._cache_control: str | None = cache_control
+        self._immutable_cache_control: str | None = immutable_cache_control
+        self._manifest: Manifest | None = manifest
+        # Files are read from disk on every request in debug mode
+        # so that changes are picked up immediately.
+        self._index: StaticIndex = StaticIndex(
+            directories,
+            excluded=excluded or [],
+            max_memory_file_size=0 if debug else max_memory_file_size,
+            memory_size=0 if debug else memory_size,
+        )
+
+    async def get(self, path: str, request: Request | None = None) -> Response:
+        asset = self._find(path)
+
+        if asset is None:
+            abort(404)
 
-    async def get(self, path: str) -> Response:
-        full_path = self._find(path)
+        encodings = asset.encodings
+        encoding: str | None = None
+        if encodings and request is not None:
+            encoding = negotiate_encoding(
+                request.headers.get("Accept-Encoding", ""), encodings
+            )
 
-        if not full_path:
-            abort(404)
+        variant = asset.variants[encoding]
+        headers: dict[str, str] = {}
+
+        if encodings:
+            headers["Vary"] = "Accept-Encoding"
+
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+
+        if self._debug:
+            headers["Cache-Control"] = "no-cache"
+
+            # The validators are computed from the file itself
+            return FileResponse(
+                variant.path, content_type=asset.content_type, headers=headers
+            )
 
-        return file_(str(full_path))
+        cache_control = self._cache_control
+        if self._manifest is not None and self._manifest.is_fingerprinted(path):
+            # Fingerprinted assets never change
+            cache_control = self._immutable_cache_control or cache_control
+
+        if cache_control:
+            headers["Cache-Control"] = cache_control
+
+        headers["ETag"] = variant.etag
+        headers["Last-Modified"] = variant.last_modified
+
+        if (content := await self._index.load(variant)) is not None:
+            return Response(
+                content,
+                headers=headers,
+                content_type=asset.content_type,
+            )
+
+        return FileResponse(
+            variant.path, content_type=asset.content_type, headers=headers
+        )
 
     def url(self, path: str) -> str:
+        if self._manifest is not None:
+            path = self._manifest.get(path)
+
         static_url = []
 
         if self._url is not None:
@@ -38,21 +111,30 @@ class Static:
 
         return "/".join(static_url)
 
+    async def build_index(self) -> None:
+        """
+        Index the static directories, in a worker thread.
+        """
+        await sync_to_async(self._index.build)
+
     def add_path(self, *paths: Path) -> Self:
-        self._directories.extend(paths)
+        self._index.add(*paths)
 
         return self
 
-    def _find(self, path: str) -> Path | None:
-        for directory in self._directories:
-            directory_path = directory.joinpath(path).resolve()
+    def close(self) -> None:
+        self._index.close()
+
+    def _find(self, path: str) -> StaticAsset | None:
+        if not self._debug:
+            return self._index.get(path)
 
-            if os.path.commonpath([str(directory_path), str(directory)]) != str(
-                directory
-            ):
-                continue
+        self._index.watch()
 
-            if not directory_path.exists():
-                continue
+        asset = self._index.get(path)
+        if asset is None or not asset.variants[None].path.exists():
+            # The watcher might not have caught up with the change yet,
+            # or might not be available at all.
+            asset = self._index.refresh(path)
 
-            return directory_path
+        return asset
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import posixpath
+import shutil
+
+from typing import TYPE_CHECKING
+
+from expanse.http.compression import ENCODINGS
+from expanse.http.compression import Compression
+from expanse.static.manifest import Manifest
+from expanse.static.static_index import PRECOMPRESSED_EXTENSIONS
+from expanse.static.static_index import StaticIndex
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+
+# The name of the manifest file, in the build directory.
+MANIFEST_NAME = "manifest.json"
+
+# Assets are compressed once, at build time, so the highest levels are used.
+_BUILD_LEVELS: dict[str, int] = {"gzip": 9, "zstd": 19}
+
+_EXTENSIONS: dict[str, str] = {
+    encoding: extension for extension, encoding in PRECOMPRESSED_EXTENSIONS.items()
+}
+
+
+class StaticBuilder:
+    """
+    Build the static assets for production.
+
+    Every asset is copied to the build directory under a name containing
+    a hash of its content, alongside its precompressed variants, so that
+    it can be cached indefinitely by browsers and CDNs. The mapping of assets
+    to their fingerprinted names is written to a manifest.
+
+    Previously built files are kept so that pages referencing them
+    keep working while a new version is being deployed.
+    """
+
+    __slots__ = ("_build_path", "_compressions", "_directories")
+
+    def __init__(
+        self,
+        directories: Sequence[Path],
+        build_path: Path,
+        *,
+        encodings: Sequence[str] = ("zstd", "gzip"),
+        min_size: int = 0,
+        content_types: Sequence[str] = ("*/*",),
+    ) -> None:
+        self._directories: list[Path] = list(directories)
+        self._build_path: Path = build_path
+        self._compressions: list[Compression] = [
+            Compression(
+                ENCODINGS[encoding],
+                level=_BUILD_LEVELS[encoding],
+                min_size=min_size,
+                content_types=content_types,
+            )
+            for encoding in encodings
+            if encoding in ENCODINGS and encoding in _EXTENSIONS
+        ]
+
+    @property
+    def build_path(self) -> Path:
+        return self._build_path
+
+    @property
+    def manifest_path(self) -> Path:
+        return self._build_path / MANIFEST_NAME
+
+    def build(self) -> Manifest:
+        """
+        Build the static assets and write their manifest.
+        """
+        build_root = os.path.realpath(self._build_path)
+        assets = StaticIndex(self._directories).build()
+        fingerprinted: dict[str, str] = {}
+
+        for key, asset in assets.items():
+            stem, extension = posixpath.splitext(key)
+            if extension in PRECOMPRESSED_EXTENSIONS and stem in assets:
+                # Precompressed variants are built along with their asset
+                continue
+
+            source = asset.variants[None].path
+            if os.path.realpath(source).startswith(build_root + os.sep):
+                continue
+
+            content = source.read_bytes()
+            digest = hashlib.blake2b(content, digest_size=8).hexdigest()
+            directory, filename = posixpath.split(key)
+            name, suffix = posixpath.splitext(filename)
+            path = posixpath.join(directory, f"{name}.{digest}{suffix}")
+
+            target = self._build_path / path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(content)
+
+            encodings: set[str] = set()
+            for compression in self._compressions:
+                if not compression.applies_to(asset.content_type, len(content)):
+                    continue
+
+                compressed = compression.compress(content)
+                if len(compressed) >= len(content):
+                    continue
+
+                encoding = compression.encoding.name
+                target.with_name(target.name + _EXTENSIONS[encoding]).write_bytes(
+                    compressed
+                )
+                encodings.add(encoding)
+
+            # Precompressed variants that cannot be generated are kept as is
+            for variant_encoding, variant in asset.variants.items():
+                if variant_encoding is None or variant_encoding in encodings:
+                    continue
+
+                shutil.copyfile(
+                    variant.path,
+                    target.with_name(target.name + _EXTENSIONS[variant_encoding]),
+                )
+
+            fingerprinted[key] = path
+
+        manifest = Manifest(fingerprinted)
+        self._build_path.mkdir(parents=True, exist_ok=True)
+        manifest.dump(self.manifest_path)
+
+        return manifest
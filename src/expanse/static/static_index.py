@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import atexit
+import logging
+import mimetypes
+import os
+import threading
+
+from email.utils import formatdate
+from pathlib import Path
+from stat import S_ISREG
+from typing import TYPE_CHECKING
+
+import anyio
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+logger = logging.getLogger(__name__)
+
+# The extensions of precompressed siblings, like `app.js.gz`, and their encoding.
+PRECOMPRESSED_EXTENSIONS: dict[str, str] = {
+    ".zst": "zstd",
+    ".br": "br",
+    ".gz": "gzip",
+}
+_PREFERENCE = tuple(PRECOMPRESSED_EXTENSIONS.values())
+
+
+class AssetVariant:
+    """
+    A file serving an asset, either as is or precompressed.
+    """
+
+    __slots__ = ("content", "etag", "last_modified", "path", "size")
+
+    def __init__(self, path: Path, stat: os.stat_result) -> None:
+        self.path: Path = path
+        self.size: int = stat.st_size
+        self.etag: str = f'W/"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+        self.last_modified: str = formatdate(stat.st_mtime, usegmt=True)
+        # The content of the file, once loaded in memory.
+        self.content: bytes | None = None
+
+
+class StaticAsset:
+    """
+    An indexed static asset with its precompressed variants.
+    """
+
+    __slots__ = ("content_type", "variants")
+
+    def __init__(self, content_type: str, identity: AssetVariant) -> None:
+        self.content_type: str = content_type
+        # The variants of the asset, keyed by content coding,
+        # None being the uncompressed file.
+        self.variants: dict[str | None, AssetVariant] = {None: identity}
+
+    @property
+    def encodings(self) -> tuple[str, ...]:
+        """
+        The content codings of the precompressed variants, by order of preference.
+        """
+        return tuple(encoding for encoding in self.variants if encoding is not None)
+
+
+class StaticIndex:
+    """
+    An in-memory index of the files of the static directories.
+
+    Looking up an asset is a single dictionary access: the directories are only
+    walked when the index is built, which also ensures that only files inside
+    them can ever be served. Small files are kept in memory once they
+    have been read.
+    """
+
+    __slots__ = (
+        "_assets",
+        "_directories",
+        "_excluded",
+        "_max_memory_file_size",
+        "_memory_budget",
+        "_watcher",
+    )
+
+    def __init__(
+        self,
+        directories: list[Path],
+        *,
+        excluded: Sequence[Path] = (),
+        max_memory_file_size: int = 0,
+        memory_size: int = 0,
+    ) -> None:
+        self._directories: list[Path] = directories
+        # The files never served, like the manifest of the built assets
+        self._excluded: frozenset[str] = frozenset(
+            os.path.realpath(path) for path in excluded
+        )
+        self._max_memory_file_size: int = max_memory_file_size
+        self._memory_budget: int = memory_size
+        self._assets: dict[str, StaticAsset] | None = None
+        self._watcher: tuple[threading.Thread, threading.Event] | None = None
+
+    def get(self, path: str) -> StaticAsset | None:
+        assets = self._assets
+        if assets is None:
+            assets = self.build()
+
+        return assets.get(path)
+
+    def build(self) -> dict[str, StaticAsset]:
+        """
+        Walk the static directories and index the files they contain.
+
+        Files of the first directories take precedence.
+        """
+        assets: dict[str, StaticAsset] = {}
+        compressed: list[tuple[str, str, Path, os.stat_result]] = []
+
+        for directory in self._directories:
+            root = os.path.realpath(directory)
+            if not os.path.isdir(root):
+                continue
+
+            for dirpath, _, filenames in os.walk(root):
+                for filename in filenames:
+                    file_path = os.path.join(dirpath, filename)
+                    real_path = os.path.realpath(file_path)
+                    # Symbolic links pointing outside the directory are ignored
+                    if (
+                        os.path.commonpath([real_path, root]) != root
+                        or real_path in self._excluded
+                    ):
+                        continue
+
+                    key = Path(os.path.relpath(file_path, root)).as_posix()
+                    if key in assets:
+                        continue
+
+                    try:
+                        stat = os.stat(real_path)
+                    except OSError:
+                        continue
+
+                    path = Path(file_path)
+                    content_type, _ = mimetypes.guess_type(filename)
+                    assets[key] = StaticAsset(
+                        content_type or "application/octet-stream",
+                        AssetVariant(path, stat),
+                    )
+
+                    stem, extension = os.path.splitext(key)
+                    if extension in PRECOMPRESSED_EXTENSIONS:
+                        compressed.append(
+                            (stem, PRECOMPRESSED_EXTENSIONS[extension], path, stat)
+                        )
+
+        # Variants are registered by order of preference
+        compressed.sort(key=lambda variant: _PREFERENCE.index(variant[1]))
+        for key, encoding, path, stat in compressed:
+            if (asset := assets.get(key)) is not None:
+                asset.variants.setdefault(encoding, AssetVariant(path, stat))
+
+        self._assets = assets
+
+        return assets
+
+    def refresh(self, path: str) -> StaticAsset | None:
+        """
+        Index a single asset again, without walking the static directories.
+
+        :param path: The path of the asset, relative to the static directories.
+        """
+        assets = self._assets
+        if assets is None:
+            assets = self.build()
+
+        asset = self._index_file(path)
+        if asset is None:
+            assets.pop(path, None)
+        else:
+            assets[path] = asset
+
+        return asset
+
+    def invalidate(self) -> None:
+        """
+        Discard the index, so that it is built again on the next lookup.
+        """
+        self._assets = None
+
+    async def load(self, variant: AssetVariant) -> bytes | None:
+        """
+        Retrieve the content of a variant if it is small enough to be kept in memory.
+        """
+        if variant.content is not None:
+            return variant.content
+
+        if variant.size > self._max_memory_file_size or variant.size > (
+            self._memory_budget
+        ):
+            return None
+
+        content = await anyio.Path(variant.path).read_bytes()
+        self._memory_budget -= len(content)
+        variant.content = content
+
+        return content
+
+    def add(self, *directories: Path) -> None:
+        """
+        Add directories to the index, after the existing ones.
+        """
+        self._directories.extend(directories)
+        self.invalidate()
+
+        if self._watcher is not None:
+            self.close()
+            self.watch()
+
+    def watch(self) -> None:
+        """
+        Refresh the index whenever the static directories change.
+
+        Watching requires the `watchfiles` package and happens in a daemon thread,
+        so that it does not depend on the lifetime of any event loop.
+        """
+        if self._watcher is not None:
+            return
+
+        try:
+            from watchfiles import watch
+        except ImportError:
+            logger.debug("watchfiles is not installed, static files are not watched")
+
+            return
+
+        directories = [d for d in self._directories if d.is_dir()]
+        if not directories:
+            return
+
+        stop = threading.Event()
+
+        def _watch() -> None:
+            # The index is rebuilt in the watcher thread rather than on the next lookup
+            for _ in watch(*directories, stop_event=stop, raise_interrupt=False):
+                self.build()
+
+        thread = threading.Thread(target=_watch, name="static-watcher", daemon=True)
+        self._watcher = (thread, stop)
+        thread.start()
+
+        # The watcher must be stopped before the interpreter is finalized.
+        atexit.register(self.close)
+
+    def close(self) -> None:
+        """
+        Stop watching the static directories.
+        """
+        if self._watcher is None:
+            return
+
+        thread, stop = self._watcher
+        self._watcher = None
+        atexit.unregister(self.close)
+
+        stop.set()
+        if thread is not threading.current_thread():
+            thread.join(timeout=1)
+
+    def _index_file(self, key: str) -> StaticAsset | None:
+        """
+        Index an asset from the first static directory containing it.
+        """
+        for directory in self._directories:
+            root = os.path.realpath(directory)
+            file_path = os.path.join(root, key)
+            stat = _stat_file(file_path, root)
+            if stat is None or os.path.realpath(file_path) in self._excluded:
+                continue
+
+            content_type, _ = mimetypes.guess_type(file_path)
+            asset = StaticAsset(
+                content_type or "application/octet-stream",
+                AssetVariant(Path(file_path), stat),
+            )
+
+            # Precompressed variants are checked by order of preference
+            for extension, encoding in PRECOMPRESSED_EXTENSIONS.items():
+                variant_path = file_path + extension
+                if (variant_stat := _stat_file(variant_path, root)) is not None:
+                    asset.variants[encoding] = AssetVariant(
+                        Path(variant_path), variant_stat
+                    )
+
+            return asset
+
+        return None
+
+
+def _stat_file(path: str, root: str) -> os.stat_result | None:
+    """
+    Retrieve the status of a regular file, if it is located inside the given root.
+    """
+    real_path = os.path.realpath(path)
+    # Paths pointing outside the directory, like symbolic links, are ignored
+    if os.path.commonpath([real_path, root]) != root:
+        return None
+
+    try:
+        stat = os.stat(real_path)
+    except OSError:
+        return None
+
+    if not S_ISREG(stat.st_mode):
+        return None
+
+    return stat
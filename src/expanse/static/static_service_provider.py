@@ -1,39 +1,96 @@
+from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import cast
 
 from expanse.configuration.config import Config
+from expanse.static.manifest import Manifest
 from expanse.static.static import Static
+from expanse.static.static_builder import MANIFEST_NAME
+from expanse.static.static_builder import StaticBuilder
 from expanse.support.service_provider import ServiceProvider
 from expanse.view.view_manager import ViewManager
 
 
 if TYPE_CHECKING:
-    from pathlib import Path
-
     from expanse.core.application import Application
+    from expanse.core.console.portal import Portal
     from expanse.routing.router import Router
 
 
 class StaticServiceProvider(ServiceProvider):
     async def register(self) -> None:
         self._container.singleton(Static, self._register_static)
+        self._container.singleton(StaticBuilder, self._register_static_builder)
 
     async def boot(self) -> None:
+        from expanse.core.console.portal import Portal
+
         await self._container.on_resolved("router", self._add_static_route)
         await self._container.on_resolved("view:manager", self._register_view_globals)
+        await self._container.on_resolved(Portal, self._register_commands)
 
     async def _register_static(self, config: Config) -> Static:
-        app: Application = await self._container.get("app")
-        paths: list[Path] = config.get("static.paths", [])
-        paths = [app.base_path / p if not p.is_absolute() else p for p in paths]
+        paths = await self._get_paths(config)
         if (url := config.get("static.url")) is not None:
             url = str(url)
 
-        return Static(paths, prefix=cast("str", config.get("static.prefix")), url=url)
+        debug: bool = config.get("app.debug", False)
+        manifest: Manifest | None = None
+        excluded: list[Path] = []
+        build_path = await self._get_build_path(config)
+        if not debug and (build_path / MANIFEST_NAME).is_file():
+            # Built assets take precedence over the original ones
+            manifest = Manifest.load(build_path / MANIFEST_NAME)
+            paths = [build_path, *paths]
+            # The manifest must not shadow an asset of the same name
+            excluded.append(build_path / MANIFEST_NAME)
+
+        static = Static(
+            paths,
+            prefix=cast("str", config.get("static.prefix")),
+            url=url,
+            debug=debug,
+            cache_control=config.get("static.cache_control", "public, max-age=86400"),
+            immutable_cache_control=config.get(
+                "static.immutable_cache_control", "public, max-age=31536000, immutable"
+            ),
+            manifest=manifest,
+            excluded=excluded,
+            max_memory_file_size=config.get("static.memory_file_size", 64 * 1024),
+            memory_size=config.get("static.memory_size", 32 * 1024 * 1024),
+        )
+        self._container.terminating(static.close)
+
+        # The index is built ahead of the first request, off the event loop
+        await static.build_index()
+
+        return static
+
+    async def _register_static_builder(self, config: Config) -> StaticBuilder:
+        return StaticBuilder(
+            await self._get_paths(config),
+            await self._get_build_path(config),
+            min_size=config.get("http.compression_min_size", 0),
+            content_types=config.get("http.compression_content_types", ["*/*"]),
+        )
+
+    async def _get_paths(self, config: Config) -> list[Path]:
+        app: Application = await self._container.get("app")
+        paths: list[Path] = config.get("static.paths", [])
+
+        return [app.base_path / p if not p.is_absolute() else p for p in paths]
+
+    async def _get_build_path(self, config: Config) -> Path:
+        app: Application = await self._container.get("app")
+        build_path: Path = config.get("static.build_path", Path("build/static"))
+
+        return (
+            app.base_path / build_path if not build_path.is_absolute() else build_path
+        )
 
     async def _add_static_route(self, router: "Router") -> None:
         config = await self._container.get(Config)
-        if config.get("app.debug", False):
+        if config.get("app.debug", False) or config.get("static.serve", False):
             prefix: str = config["static.prefix"].rstrip("/")
 
             router.get(
@@ -44,3 +101,8 @@ class StaticServiceProvider(ServiceProvider):
 
     async def _register_view_globals(self, view: ViewManager) -> None:
         view.register_global(static=(await self._container.get(Static)).url)
+
+    async def _register_commands(self, portal: "Portal") -> None:
+        from expanse.static.console.commands.static_build import StaticBuildCommand
+
+        portal.add_command(StaticBuildCommand)
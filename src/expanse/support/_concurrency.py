@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import functools
+import os
+import threading
+import time
 
 from collections import deque
-from collections.abc import AsyncGenerator
 from collections.abc import Callable
 from collections.abc import Iterable
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from contextvars import Context
 from contextvars import copy_context
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import ParamSpec
@@ -68,9 +73,147 @@ def warn_about_implicit_async_safe_status(
         )
 
 
+def is_thread_sensitive(func: Callable[..., Any]) -> bool:
+    return getattr(func, "is_thread_sensitive", False)
+
+
+@dataclass(frozen=True, slots=True)
+class ThreadPoolStats:
+    max_workers: int
+    # Calls waiting for a free worker
+    queued: int
+    running: int
+    completed: int
+    # Time spent by calls waiting for a free worker, in seconds
+    total_wait_time: float
+    max_wait_time: float
+
+    @property
+    def average_wait_time(self) -> float:
+        started = self.running + self.completed
+        if not started:
+            return 0.0
+
+        return self.total_wait_time / started
+
+
+class ThreadPool:
+    """
+    A bounded pool of worker threads running synchronous callables.
+
+    The underlying executor is only started on first use.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self._max_workers: int = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+        self._queued: int = 0
+        self._running: int = 0
+        self._completed: int = 0
+        self._total_wait_time: float = 0.0
+        self._max_wait_time: float = 0.0
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def stats(self) -> ThreadPoolStats:
+        with self._lock:
+            return ThreadPoolStats(
+                max_workers=self._max_workers,
+                queued=self._queued,
+                running=self._running,
+                completed=self._completed,
+                total_wait_time=self._total_wait_time,
+                max_wait_time=self._max_wait_time,
+            )
+
+    async def run(self, func: Callable[[], T]) -> T:
+        submitted_at = time.perf_counter()
+
+        def call() -> T:
+            waited = time.perf_counter() - submitted_at
+
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+                self._total_wait_time += waited
+                self._max_wait_time = max(self._max_wait_time, waited)
+
+            try:
+                return func()
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+
+        with self._lock:
+            self._queued += 1
+
+        future = self._get_executor().submit(call)
+
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # Calls cancelled before being picked up by a worker never run
+            if future.cancelled():
+                with self._lock:
+                    self._queued -= 1
+
+            raise
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+
+            self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="expanse"
+            )
+
+        return self._executor
+
+
+# Synchronous callables run in the single thread shared by asgiref
+# in thread-sensitive mode unless a thread pool has been configured.
+_thread_pool: ThreadPool | None = None
+
+
+def get_thread_pool() -> ThreadPool | None:
+    return _thread_pool
+
+
+def configure_thread_pool(max_workers: int | None = None) -> ThreadPool | None:
+    """
+    Replace the thread pool running synchronous callables.
+
+    :param max_workers: The maximum number of worker threads.
+                        The thread pool is disabled when not set.
+    """
+    global _thread_pool
+
+    if _thread_pool is not None:
+        if max_workers == _thread_pool.max_workers:
+            return _thread_pool
+
+        # Pending calls of the previous pool are still allowed to complete
+        _thread_pool.shutdown(wait=False)
+
+    _thread_pool = ThreadPool(max_workers) if max_workers is not None else None
+
+    return _thread_pool
+
+
 async def sync_to_async[**P, T](
     func: Callable[P, T], *args: P.args, **kwargs: P.kwargs
 ) -> T:
+    thread_sensitive = is_thread_sensitive(func)
+
     if kwargs:  # pragma: no cover
         # run_sync doesn't accept 'kwargs', so bind them in here
         func = functools.partial(func, **kwargs)
@@ -78,7 +221,11 @@ async def sync_to_async[**P, T](
     context = copy_context()
     func = functools.partial(context.run, func)
 
-    result = await _asgiref_sync_to_async(func, thread_sensitive=True)(*args)
+    if thread_sensitive or _thread_pool is None:
+        # Thread-sensitive callables all run in the same thread
+        result = await _asgiref_sync_to_async(func, thread_sensitive=True)(*args)
+    else:
+        result = await _thread_pool.run(functools.partial(func, *args))
 
     if context is not None:
         # restore the context
@@ -87,36 +234,141 @@ async def sync_to_async[**P, T](
     return result
 
 
-class AsyncIteratorWrapper[T]:
-    __slots__ = ("generator", "iterator")
+# The maximum number of values of batches only bounded by their size in bytes
+_MAX_BATCH_SIZE = 1024
+
+# A batch of values, whether the iterator is exhausted
+# and the error raised while retrieving the values, if any
+type _Batch[T] = tuple[list[T], bool, Exception | None]
 
-    def __init__(self, iterator: Iterator[T] | Iterable[T]) -> None:
+
+class AsyncIteratorWrapper[T]:
+    __slots__ = (
+        "_batch_bytes",
+        "_batch_size",
+        "_buffer",
+        "_error",
+        "_exhausted",
+        "_pending",
+        "iterator",
+    )
+
+    def __init__(
+        self,
+        iterator: Iterator[T] | Iterable[T],
+        *,
+        batch_size: int | None = None,
+        batch_bytes: int | None = None,
+    ) -> None:
         """Take a sync iterator or iterable and yields values from it asynchronously.
 
+        By default, each value is retrieved in a worker thread of its own.
+        When batching is enabled, up to `batch_size` values — or values totalling
+        `batch_bytes` bytes — are retrieved per worker thread call and the next batch
+        is prefetched while the current one is consumed. When only `batch_bytes`
+        is set, batches hold at most 1024 values.
+
         Args:
             iterator: A sync iterator or iterable.
+            batch_size: The maximum number of values retrieved per worker thread call.
+            batch_bytes: The maximum size of the values retrieved per worker thread call.
         """
         self.iterator = iterator if isinstance(iterator, Iterator) else iter(iterator)
-        self.generator = self._async_generator()
 
-    def _call_next(self) -> T:
+        if batch_size is None:
+            # Batches bounded by their size in bytes are still capped in number
+            # of values since values that are not bytes or strings are not counted.
+            batch_size = 1 if batch_bytes is None else _MAX_BATCH_SIZE
+
+        self._batch_size: int = max(1, batch_size)
+        self._batch_bytes: int | None = batch_bytes
+        self._buffer: deque[T] = deque()
+        self._exhausted: bool = False
+        self._error: BaseException | None = None
+        self._pending: asyncio.Future[_Batch[T]] | None = None
+
+    @property
+    def batching(self) -> bool:
+        return self._batch_size > 1
+
+    def _next_batch(self) -> _Batch[T]:
+        """
+        Retrieve the next batch of values, whether the iterator is exhausted
+        and the error raised while retrieving them, if any.
+        """
+        batch: list[T] = []
+        size = 0
+
         try:
-            return next(self.iterator)
-        except StopIteration as e:
-            raise ValueError from e
+            for item in self.iterator:
+                batch.append(item)
 
-    async def _async_generator(self) -> AsyncGenerator[T, None]:
-        while True:
-            try:
-                yield await sync_to_async(self._call_next)
-            except ValueError:
-                return
+                if self._batch_bytes is not None and isinstance(item, bytes | str):
+                    size += len(item)
+                    if size >= self._batch_bytes:
+                        return batch, False, None
+
+                if len(batch) >= self._batch_size:
+                    return batch, False, None
+        except Exception as e:
+            if not batch:
+                raise
+
+            # The values retrieved so far are still delivered
+            # and the error is raised once they are consumed.
+            return batch, True, e
+
+        return batch, True, None
+
+    async def _fetch(self) -> _Batch[T]:
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+
+            return await pending
+
+        return await sync_to_async(self._next_batch)
 
     def __aiter__(self) -> AsyncIteratorWrapper[T]:
         return self
 
     async def __anext__(self) -> T:
-        return await self.generator.__anext__()
+        if self._buffer:
+            return self._buffer.popleft()
+
+        if self._error is not None:
+            error, self._error = self._error, None
+
+            raise error
+
+        if self._exhausted:
+            raise StopAsyncIteration
+
+        batch, self._exhausted, self._error = await self._fetch()
+
+        if not self._exhausted and self.batching:
+            # Prefetch the next batch while the current one is consumed
+            self._pending = asyncio.ensure_future(sync_to_async(self._next_batch))
+
+        if not batch:
+            return await self.__anext__()
+
+        self._buffer.extend(batch)
+
+        return self._buffer.popleft()
+
+    async def aclose(self) -> None:
+        """
+        Stop prefetching values.
+        """
+        self._exhausted = True
+        self._buffer.clear()
+
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            pending.cancel()
+
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await pending
 
 
 class AsyncRLock:
@@ -215,7 +467,12 @@ class AsyncRLock:
 __all__ = [
     "AsyncIteratorWrapper",
     "AsyncRLock",
+    "ThreadPool",
+    "ThreadPoolStats",
     "async_to_sync",
+    "configure_thread_pool",
+    "get_thread_pool",
+    "is_thread_sensitive",
     "should_run_as_async",
     "sync_to_async",
     "warn_about_implicit_async_safe_status",
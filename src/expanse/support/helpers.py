@@ -12,3 +12,19 @@ def async_safe[**P, R](safe: bool = True) -> Callable[[Callable[P, R]], Callable
         return func
 
     return decorator
+
+
+def thread_sensitive[**P, R](
+    sensitive: bool = True,
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Decorator to run a synchronous function in the single thread shared
+    by all thread-sensitive functions instead of the thread pool.
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        setattr(func, "is_thread_sensitive", sensitive)  # noqa: B010
+
+        return func
+
+    return decorator
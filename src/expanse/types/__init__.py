@@ -66,7 +66,16 @@ class PartialHTTPScope(PartialBaseScope):
     type: NotRequired[Literal["http"]]
 
 
-Scope = HTTPScope
+class WebSocketScope(BaseScope):
+    """
+    WebSocket ASGI scope type.
+    """
+
+    subprotocols: NotRequired[list[str]]
+    type: Literal["websocket"]
+
+
+Scope = HTTPScope | WebSocketScope
 PartialScope = PartialHTTPScope
 Message = MutableMapping[str, Any]
 
@@ -6,8 +6,11 @@ from pytest_codspeed.plugin import BenchmarkFixture
 from expanse.contracts.routing.router import Router
 from expanse.core.application import Application
 from expanse.http.helpers import json
+from expanse.http.request import Request
 from expanse.http.response import Response
+from expanse.routing.finder import Finder
 from expanse.routing.helpers import get
+from expanse.routing.route import Route
 from expanse.support.service_provider import ServiceProvider
 from expanse.testing.client import TestClient
 
@@ -106,3 +109,40 @@ def test_async_dependencies(
     assert response.json() == {
         "message": "dependency value, scoped: scoped value, dependency: dependency value"
     }
+
+
+async def resource(id: int, item: str) -> Response:
+    return json({"id": id, "item": item})
+
+
+@pytest.mark.parametrize("count", [1_000, 10_000])
+def test_dynamic_route_matching(count: int, benchmark: BenchmarkFixture) -> None:
+    finder = Finder()
+    for i in range(count):
+        finder.add(Route.get(f"/resources{i}/{{id}}/items/{{item}}", resource))
+
+    request = Request.create(f"http://example.com/resources{count - 1}/42/items/foo")
+
+    route = benchmark(finder.match, request)
+
+    assert route is not None
+    assert route.path == f"/resources{count - 1}/{{id}}/items/{{item}}"
+    assert request.path_params == {"id": 42, "item": "foo"}
+
+
+@pytest.mark.parametrize("count", [1_000, 10_000])
+def test_dynamic_route_matching_with_constrained_siblings(
+    count: int, benchmark: BenchmarkFixture
+) -> None:
+    finder = Finder()
+    for i in range(count):
+        finder.add(Route.get(f"/{{tenant}}/resources{i}/{{id:\\d+}}", resource))
+        finder.add(Route.get(f"/{{tenant}}/resources{i}/{{item:[a-z]+}}", resource))
+
+    request = Request.create(f"http://example.com/acme/resources{count - 1}/foo")
+
+    route = benchmark(finder.match, request)
+
+    assert route is not None
+    assert route.path == f"/{{tenant}}/resources{count - 1}/{{item:[a-z]+}}"
+    assert request.path_params == {"tenant": "acme", "item": "foo"}
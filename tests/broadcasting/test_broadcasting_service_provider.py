@@ -0,0 +1,20 @@
+from expanse.broadcasting.broadcaster import Broadcaster
+from expanse.broadcasting.broadcasters.memory import MemoryBroadcaster
+from expanse.broadcasting.broadcasters.redis import RedisBroadcaster
+from expanse.core.application import Application
+
+
+async def test_the_memory_broadcaster_is_used_by_default(app: Application) -> None:
+    broadcaster = await app.container.get(Broadcaster)
+
+    assert isinstance(broadcaster, MemoryBroadcaster)
+
+
+async def test_the_redis_broadcaster_can_be_configured(app: Application) -> None:
+    app.config["broadcasting.driver"] = "redis"
+    app.config["broadcasting.redis"] = {"connection": "default", "prefix": "app:"}
+
+    broadcaster = await app.container.get(Broadcaster)
+
+    assert isinstance(broadcaster, RedisBroadcaster)
+    assert broadcaster._prefix == "app:"
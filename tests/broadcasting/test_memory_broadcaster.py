@@ -0,0 +1,90 @@
+import asyncio
+
+from expanse.broadcasting.broadcasters.memory import MemoryBroadcaster
+from expanse.broadcasting.subscription import Event
+
+
+async def test_events_are_delivered_to_the_subscribers_of_their_channel() -> None:
+    broadcaster = MemoryBroadcaster()
+
+    async with (
+        broadcaster.subscribe("chat:1") as first,
+        broadcaster.subscribe("chat:1", "chat:2") as second,
+    ):
+        await broadcaster.publish("chat:1", {"text": "Hello"})
+        await broadcaster.publish("chat:2", "World")
+        await broadcaster.publish("chat:3", "Ignored")
+
+        assert await first.get() == Event("chat:1", {"text": "Hello"})
+        assert await second.get() == Event("chat:1", {"text": "Hello"})
+        assert await second.get() == Event("chat:2", "World")
+
+        await asyncio.sleep(0)
+
+        assert first._queue.empty()
+        assert second._queue.empty()
+
+
+async def test_subscribers_can_listen_to_channel_patterns() -> None:
+    broadcaster = MemoryBroadcaster()
+
+    async with broadcaster.subscribe("chat:*", "chat:1") as subscription:
+        await broadcaster.publish("chat:1", 1)
+        await broadcaster.publish("chat:2", 2)
+        await broadcaster.publish("news", 3)
+
+        # Events matching several patterns are only delivered once
+        assert await subscription.get() == Event("chat:1", 1)
+        assert await subscription.get() == Event("chat:2", 2)
+        assert subscription._queue.empty()
+
+
+async def test_slow_subscribers_lose_their_oldest_events() -> None:
+    broadcaster = MemoryBroadcaster(max_queue=2)
+
+    async with broadcaster.subscribe("chat") as subscription:
+        for i in range(5):
+            await broadcaster.publish("chat", i)
+
+        assert subscription.dropped == 3
+        assert await subscription.get() == Event("chat", 3)
+        assert await subscription.get() == Event("chat", 4)
+
+
+async def test_subscriptions_end_with_their_context() -> None:
+    broadcaster = MemoryBroadcaster()
+    received: list[Event] = []
+
+    async def consume() -> None:
+        async with broadcaster.subscribe("chat", max_queue=10) as subscription:
+            async for event in subscription:
+                received.append(event)
+
+                if event.data == "stop":
+                    break
+
+    task = asyncio.create_task(consume())
+    await asyncio.sleep(0)
+
+    await broadcaster.publish("chat", "Hello")
+    await broadcaster.publish("chat", "stop")
+    await task
+
+    assert [event.data for event in received] == ["Hello", "stop"]
+    assert broadcaster._subscriptions == {}
+
+
+async def test_closing_the_broadcaster_ends_the_subscriptions() -> None:
+    broadcaster = MemoryBroadcaster()
+
+    async def consume() -> list[object]:
+        async with broadcaster.subscribe("chat") as subscription:
+            return [event.data async for event in subscription]
+
+    task = asyncio.create_task(consume())
+    await asyncio.sleep(0)
+
+    await broadcaster.publish("chat", "Hello")
+    await broadcaster.close()
+
+    assert await asyncio.wait_for(task, 1) == ["Hello"]
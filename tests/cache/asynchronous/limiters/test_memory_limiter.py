@@ -0,0 +1,96 @@
+import pytest
+
+from expanse.cache.asynchronous.limiters.memory_limiter import MemoryLimiter
+from expanse.cache.asynchronous.stores.memory import MemoryStore
+from expanse.cache.synchronous.stores.memory import MemoryStore as SyncMemoryStore
+
+
+class Clock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock(6000.0)
+    monkeypatch.setattr("expanse.cache.asynchronous.limiters.limiter.time", clock)
+
+    return clock
+
+
+async def test_attempts_are_allowed_until_the_limit_is_reached(clock: Clock) -> None:
+    limiter = MemoryStore(SyncMemoryStore()).limiter()
+
+    for remaining in (2, 1, 0):
+        attempt = await limiter.attempt("key", 3, 60)
+        assert attempt.allowed
+        assert attempt.remaining == remaining
+        assert attempt.reset == 60
+
+    attempt = await limiter.attempt("key", 3, 60)
+    assert not attempt.allowed
+    assert attempt.remaining == 0
+    assert attempt.reset == 90
+
+    assert (await limiter.attempt("other", 3, 60)).allowed
+
+
+async def test_the_previous_window_is_weighted_by_its_overlap(clock: Clock) -> None:
+    limiter = MemoryStore(SyncMemoryStore()).limiter()
+
+    for _ in range(4):
+        await limiter.attempt("key", 4, 60)
+
+    # Half of the previous window still belongs to the sliding window
+    clock.now += 90
+    attempt = await limiter.attempt("key", 4, 60)
+    assert attempt.allowed
+    assert attempt.remaining == 1
+
+    attempt = await limiter.attempt("key", 4, 60)
+    assert attempt.allowed
+    assert attempt.remaining == 0
+
+    attempt = await limiter.attempt("key", 4, 60)
+    assert not attempt.allowed
+    assert attempt.reset == 30
+
+    # The counters of older windows are discarded
+    clock.now += 120
+    attempt = await limiter.attempt("key", 4, 60)
+    assert attempt.allowed
+    assert attempt.remaining == 3
+
+
+async def test_counters_are_shared_by_the_limiters_of_a_store(clock: Clock) -> None:
+    store = MemoryStore(SyncMemoryStore())
+
+    await store.limiter().attempt("key", 2, 60)
+    await store.limiter().attempt("key", 2, 60)
+
+    assert not (await store.limiter().attempt("key", 2, 60)).allowed
+
+    await store.clear()
+
+    assert (await store.limiter().attempt("key", 2, 60)).allowed
+
+
+async def test_stale_counters_are_pruned_when_too_many_keys_are_tracked(
+    clock: Clock,
+) -> None:
+    sync_store = SyncMemoryStore()
+    limiter = MemoryLimiter(sync_store, max_keys=2)
+
+    await limiter.attempt("a", 2, 60)
+    clock.now += 120
+    await limiter.attempt("b", 2, 60)
+    await limiter.attempt("c", 2, 60)
+
+    assert list(sync_store.counters) == ["b", "c"]
+
+    await limiter.attempt("d", 2, 60)
+
+    assert list(sync_store.counters) == ["c", "d"]
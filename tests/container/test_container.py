@@ -7,7 +7,11 @@ from collections.abc import Callable
 from typing import Annotated
 from typing import Any
 
+import pytest
+
 from expanse.container.container import Container
+from expanse.container.exceptions import FrozenContainerException
+from expanse.container.exceptions import ResolutionException
 
 
 class Something: ...
@@ -199,6 +203,29 @@ async def test_scoped_container_can_resolve_base_container_dependencies() -> Non
     assert isinstance(result, Concrete)
 
 
+async def test_scoped_container_state_does_not_leak_to_base_container() -> None:
+    container = Container()
+    container.instance(Container, container)
+    container.scoped("scoped", lambda _: str(uuid.uuid4()))
+
+    async with container.create_scoped_container() as c1:
+        c1.register("foo", lambda _: "foo")
+        c1.instance("bar", "bar")
+
+        assert await c1.get("scoped") == await c1.get("scoped")
+        assert await c1.get("foo") == "foo"
+        assert await c1.get("bar") == "bar"
+
+    async with container.create_scoped_container() as c2:
+        assert not c2.bound("foo")
+        assert not c2.bound("bar")
+        assert not c2.resolved("scoped")
+
+    assert not container.bound("foo")
+    assert not container.bound("bar")
+    assert not container.resolved("scoped")
+
+
 async def test_call_resolves_dependencies_and_parameters_if_parameters_only() -> None:
     container = Container()
     container.singleton(Abstract, Concrete)
@@ -351,3 +378,149 @@ async def test_call_honors_annotated_metadata_on_parameters() -> None:
 
     assert await container.call(handler_with_tag) == "foo-bar"
     assert await container.call(handler_without_tag) == "default"
+
+
+async def test_singletons_are_built_once_when_resolved_concurrently() -> None:
+    calls = 0
+
+    async def factory() -> Something:
+        nonlocal calls
+
+        calls += 1
+        await asyncio.sleep(0)
+
+        return Something()
+
+    container = Container()
+    container.singleton(Something, factory)
+
+    results = await asyncio.gather(*(container.get(Something) for _ in range(10)))
+
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+
+
+async def test_different_singletons_can_be_built_concurrently() -> None:
+    event = asyncio.Event()
+
+    async def waiting_factory() -> Something:
+        await event.wait()
+
+        return Something()
+
+    async def setting_factory() -> str:
+        event.set()
+
+        return "foo"
+
+    container = Container()
+    container.singleton(Something, waiting_factory)
+    container.singleton("foo", setting_factory)
+
+    something, foo = await asyncio.wait_for(
+        asyncio.gather(container.get(Something), container.get("foo")), timeout=1
+    )
+
+    assert isinstance(something, Something)
+    assert foo == "foo"
+    assert await container.get(Something) is something
+
+
+class Dependent:
+    def __init__(self, something: Something, container: Container) -> None:
+        self.something = something
+        self.container = container
+
+
+class Cyclic:
+    def __init__(self, something: Something) -> None:
+        self.something = something
+
+
+class OtherCyclic(Something):
+    def __init__(self, cyclic: Cyclic) -> None:
+        self.cyclic = cyclic
+
+
+async def test_frozen_container_resolves_compiled_bindings() -> None:
+    container = Container()
+    container.singleton(Something)
+    container.register(Dependent)
+
+    container.freeze()
+
+    assert container.is_frozen()
+
+    dependent = await container.get(Dependent)
+
+    assert isinstance(dependent, Dependent)
+    assert dependent.something is await container.get(Something)
+    assert dependent.container is container
+    assert await container.get(Dependent) is not dependent
+
+
+async def test_frozen_container_rejects_overriding_bindings() -> None:
+    container = Container()
+    container.singleton(Abstract, Concrete)
+
+    container.freeze()
+
+    with pytest.raises(FrozenContainerException):
+        container.singleton(Abstract, Concrete)
+
+    # Late bindings are still resolved dynamically
+    container.register("foo", lambda _: "foo")
+
+    assert await container.get("foo") == "foo"
+
+
+def test_freezing_reports_missing_bindings() -> None:
+    class Service:
+        def __init__(self, abstract: Abstract) -> None:
+            self.abstract = abstract
+
+    container = Container()
+    container.singleton(Service)
+    container.singleton("bar", "foo")
+
+    with pytest.raises(ResolutionException) as e:
+        container.freeze()
+
+    assert not container.is_frozen()
+    assert "Missing binding for [tests.container.test_container.Abstract]" in str(
+        e.value
+    )
+    assert "Unbound abstract [foo] (required by bar)" in str(e.value)
+
+
+def test_freezing_reports_circular_dependencies() -> None:
+    container = Container()
+    container.singleton(Cyclic)
+    container.singleton(Something, OtherCyclic)
+
+    with pytest.raises(ResolutionException) as e:
+        container.freeze()
+
+    assert (
+        "Circular dependency: tests.container.test_container.Cyclic -> "
+        "tests.container.test_container.Something -> "
+        "tests.container.test_container.OtherCyclic -> "
+        "tests.container.test_container.Cyclic"
+    ) in str(e.value)
+
+
+def test_failing_to_freeze_does_not_install_compiled_factories() -> None:
+    class Service:
+        def __init__(self, abstract: Abstract) -> None:
+            self.abstract = abstract
+
+    container = Container()
+    container.register(Dependent)
+    container.singleton(Something)
+    container.singleton(Service)
+
+    with pytest.raises(ResolutionException):
+        container.freeze()
+
+    assert not container.is_frozen()
+    assert container._compiled == {}
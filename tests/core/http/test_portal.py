@@ -3,9 +3,11 @@ from treat.mock import Mockery
 from expanse.container.container import Container
 from expanse.contracts.routing.router import Router
 from expanse.core.application import Application
+from expanse.core.http.middleware.middleware import singleton
 from expanse.core.http.portal import Portal
 from expanse.http.request import Request
 from expanse.http.response import Response
+from expanse.types.http.middleware import RequestHandler
 
 
 async def test_portal_prepares_response_before_sending_it_back(
@@ -26,3 +28,29 @@ async def test_portal_prepares_response_before_sending_it_back(
     response = await portal.handle(request)
 
     assert response.status_code == 200
+
+
+async def test_singleton_middleware_are_shared_by_the_portal_and_the_routes(
+    app: Application, router: Router
+) -> None:
+    instances: list[object] = []
+
+    @singleton
+    class SingletonMiddleware:
+        def __init__(self) -> None:
+            instances.append(self)
+
+        async def handle(self, request: Request, next_call: RequestHandler) -> Response:
+            return await next_call(request)
+
+    router.get("/", lambda: "Foo").middleware(SingletonMiddleware)
+
+    portal = Portal(app, router)
+    portal.set_middleware([SingletonMiddleware])
+
+    for _ in range(2):
+        response = await portal.handle(Request.create("http://localhost:8000/"))
+
+        assert response.status_code == 200
+
+    assert len(instances) == 1
@@ -0,0 +1,55 @@
+from expanse.core.application import Application
+from expanse.http.request import Request
+from expanse.support._concurrency import configure_thread_pool
+from expanse.support._concurrency import get_thread_pool
+from expanse.testing.client import TestClient
+
+
+async def test_booting_freezes_the_container_when_configured(
+    unbooted_app: Application,
+) -> None:
+    unbooted_app.config["app.freeze_container"] = True
+
+    await unbooted_app.boot()
+
+    assert unbooted_app.container.is_frozen()
+
+    async def index(request: Request) -> str:
+        return str(request.path)
+
+    router = await unbooted_app.container.get("router")
+    router.get("/", index)
+
+    with TestClient(unbooted_app, raise_server_exceptions=True) as client:
+        response = client.get("/")
+
+    assert response.status_code == 200
+    assert response.json() == "/"
+
+
+async def test_booting_does_not_freeze_the_container_by_default(
+    app: Application,
+) -> None:
+    assert not app.container.is_frozen()
+
+
+async def test_booting_does_not_enable_the_thread_pool_by_default(
+    app: Application,
+) -> None:
+    assert get_thread_pool() is None
+
+
+async def test_booting_enables_the_thread_pool_when_configured(
+    unbooted_app: Application,
+) -> None:
+    unbooted_app.config["app.thread_pool_size"] = 4
+
+    try:
+        await unbooted_app.boot()
+
+        pool = get_thread_pool()
+
+        assert pool is not None
+        assert pool.max_workers == 4
+    finally:
+        configure_thread_pool(None)
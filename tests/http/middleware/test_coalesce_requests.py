@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+
+from typing import TYPE_CHECKING
+
+from expanse.http.middleware.coalesce_requests import CoalesceRequests
+from expanse.http.request import Request
+from expanse.http.response import Response
+from expanse.http.utils.snapshots import request_fingerprint
+
+
+if TYPE_CHECKING:
+    from expanse.core.application import Application
+
+
+class SlowHandler:
+    def __init__(self, delay: float = 0.05) -> None:
+        self.calls = 0
+        self.delay = delay
+
+    async def __call__(self, request: Request) -> Response:
+        self.calls += 1
+        calls = self.calls
+        await asyncio.sleep(self.delay)
+
+        return Response(f"Call {calls}", headers={"X-Calls": str(calls)})
+
+
+async def test_identical_concurrent_requests_are_coalesced(app: Application) -> None:
+    middleware = CoalesceRequests(app)
+    handler = SlowHandler()
+
+    responses = await asyncio.gather(
+        *(
+            middleware.handle(Request.create("http://example.com/?page=1"), handler)
+            for _ in range(10)
+        )
+    )
+
+    assert handler.calls == 1
+    assert [await response.render() for response in responses] == [b"Call 1"] * 10
+    assert all(response.headers["X-Calls"] == "1" for response in responses)
+    # Every request gets its own response
+    assert len({id(response) for response in responses}) == 10
+
+
+async def test_different_requests_are_not_coalesced(app: Application) -> None:
+    middleware = CoalesceRequests(app)
+    handler = SlowHandler()
+
+    await asyncio.gather(
+        middleware.handle(Request.create("http://example.com/?page=1"), handler),
+        middleware.handle(Request.create("http://example.com/?page=2"), handler),
+        middleware.handle(
+            Request.create("http://example.com/?page=1", method="POST"), handler
+        ),
+    )
+
+    assert handler.calls == 3
+
+
+async def test_requests_go_through_after_the_timeout(app: Application) -> None:
+    app.config["http.coalescing_timeout"] = 0.01
+    middleware = CoalesceRequests(app)
+    handler = SlowHandler(delay=0.1)
+
+    responses = await asyncio.gather(
+        middleware.handle(Request.create("http://example.com/"), handler),
+        middleware.handle(Request.create("http://example.com/"), handler),
+    )
+
+    assert handler.calls == 2
+    assert [await response.render() for response in responses] == [
+        b"Call 1",
+        b"Call 2",
+    ]
+
+
+async def test_requests_go_through_if_the_leader_fails(app: Application) -> None:
+    middleware = CoalesceRequests(app)
+    calls = 0
+
+    async def handler(request: Request) -> Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+
+        if calls == 1:
+            raise RuntimeError("Failure")
+
+        return Response("Success")
+
+    results = await asyncio.gather(
+        middleware.handle(Request.create("http://example.com/"), handler),
+        middleware.handle(Request.create("http://example.com/"), handler),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], RuntimeError)
+    assert isinstance(results[1], Response)
+    assert await results[1].render() == b"Success"
+    assert calls == 2
+
+
+def test_request_fingerprint_ignores_query_parameters_order() -> None:
+    assert request_fingerprint(
+        Request.create("http://example.com/?a=1&b=2")
+    ) == request_fingerprint(Request.create("http://example.com/?b=2&a=1"))
+    assert request_fingerprint(
+        Request.create("http://example.com/", method="HEAD")
+    ) == request_fingerprint(Request.create("http://example.com/"))
+    assert request_fingerprint(
+        Request.create("http://example.com/"), ["Accept-Language"]
+    ) != request_fingerprint(
+        Request.create(
+            "http://example.com/",
+            scope={"headers": [(b"accept-language", b"fr")]},
+        ),
+        ["Accept-Language"],
+    )
+
+
+def test_request_fingerprint_depends_on_the_scheme_and_host() -> None:
+    fingerprint = request_fingerprint(Request.create("http://example.com/"))
+
+    assert fingerprint != request_fingerprint(Request.create("https://example.com/"))
+    assert fingerprint != request_fingerprint(Request.create("http://example.org/"))
+    assert fingerprint != request_fingerprint(
+        Request.create("http://example.com:8080/")
+    )
@@ -120,6 +120,100 @@ async def test_preparing_head_request_drops_content() -> None:
     assert response.headers["Content-Length"] == "23"
 
 
+async def test_etag_is_computed_from_the_body() -> None:
+    response = Response("Hello, World!").with_etag()
+
+    await response.prepare(Request.create("http://example.com"), Container())
+
+    etag = response.headers["ETag"]
+    assert etag.startswith('"')
+    assert etag.endswith('"')
+
+    other = Response("Hello, World!").with_etag()
+    await other.prepare(Request.create("http://example.com"), Container())
+
+    assert other.headers["ETag"] == etag
+
+
+@pytest.mark.parametrize(
+    ("headers", "status_code"),
+    [
+        ({"If-None-Match": '"abc"'}, 304),
+        ({"If-None-Match": 'W/"abc"'}, 304),
+        ({"If-None-Match": '"def", "abc"'}, 304),
+        ({"If-None-Match": "*"}, 304),
+        ({"If-None-Match": '"def"'}, 200),
+        ({"If-Match": '"abc"'}, 200),
+        ({"If-Match": '"def"'}, 412),
+        ({"If-Match": '"abc"', "If-None-Match": '"abc"'}, 304),
+        ({"If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"}, 304),
+        ({"If-Modified-Since": "Wed, 21 Oct 2015 07:27:59 GMT"}, 200),
+        ({"If-Modified-Since": "not a date"}, 200),
+        (
+            {
+                "If-None-Match": '"def"',
+                "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+            },
+            200,
+        ),
+        ({"If-Unmodified-Since": "Wed, 21 Oct 2015 07:27:59 GMT"}, 412),
+        ({"If-Unmodified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"}, 200),
+    ],
+)
+async def test_conditional_requests(headers: dict[str, str], status_code: int) -> None:
+    response = Response("Hello, World!").with_etag("abc")
+    response.headers["Last-Modified"] = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+    request = Request.create(
+        "http://example.com",
+        scope={
+            "headers": [
+                (name.lower().encode(), value.encode())
+                for name, value in headers.items()
+            ]
+        },
+    )
+
+    await response.prepare(request, Container())
+
+    assert response.status_code == status_code
+    assert response.headers["ETag"] == '"abc"'
+    if status_code == 200:
+        assert await response.render() == b"Hello, World!"
+    else:
+        assert not await response.render()
+
+
+async def test_not_modified_responses_drop_content() -> None:
+    response = Response("Hello, World!").with_etag("abc", weak=True)
+
+    request = Request.create(
+        "http://example.com", scope={"headers": [(b"if-none-match", b'W/"abc"')]}
+    )
+
+    await response.prepare(request, Container())
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == 'W/"abc"'
+    assert not response.headers.has("Content-Type")
+    assert not response.headers.has("Content-Length")
+    assert await response.render() is None
+
+
+async def test_preconditions_are_ignored_for_unsafe_methods() -> None:
+    response = Response("Created", status_code=201).with_etag("abc")
+
+    request = Request.create(
+        "http://example.com",
+        method="POST",
+        scope={"headers": [(b"if-none-match", b'"abc"')]},
+    )
+
+    await response.prepare(request, Container())
+
+    assert response.status_code == 201
+
+
 @pytest.mark.parametrize(
     "secure",
     [False, True],
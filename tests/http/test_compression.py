@@ -0,0 +1,60 @@
+import gzip
+import zlib
+
+import pytest
+
+from expanse.http.compression import ENCODINGS
+from expanse.http.compression import Compression
+from expanse.http.compression import negotiate_encoding
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("", None),
+        ("gzip", "gzip"),
+        ("deflate, gzip", "gzip"),
+        ("gzip;q=0.5, deflate", "deflate"),
+        ("*", "gzip"),
+        ("*;q=0.1, deflate;q=0.5", "deflate"),
+        ("gzip;q=0, deflate;q=0", None),
+        ("br, identity", None),
+    ],
+)
+def test_negotiate_encoding(accept_encoding: str, expected: str | None) -> None:
+    assert negotiate_encoding(accept_encoding, ("gzip", "deflate")) == expected
+
+
+def test_streamed_compression_can_be_decoded() -> None:
+    compressor = ENCODINGS["gzip"].compressor()
+
+    chunks = [compressor.compress(f"chunk {i}\n".encode()) for i in range(10)]
+    # Every chunk is flushed so that it can be decoded as soon as it is received
+    assert all(chunks)
+
+    decompressor = zlib.decompressobj(31)
+    assert decompressor.decompress(chunks[0]) == b"chunk 0\n"
+
+    data = b"".join(chunks) + compressor.finish()
+    assert gzip.decompress(data) == b"".join(f"chunk {i}\n".encode() for i in range(10))
+
+
+@pytest.mark.parametrize(
+    ("content_type", "size", "expected"),
+    [
+        ("application/json", 1000, True),
+        ("text/html; charset=utf-8", 1000, True),
+        ("TEXT/CSS", None, True),
+        ("application/json", 10, False),
+        ("image/png", 1000, False),
+        (None, 1000, False),
+    ],
+)
+def test_compression_applies_to(
+    content_type: str | None, size: int | None, expected: bool
+) -> None:
+    compression = Compression(
+        ENCODINGS["gzip"], min_size=500, content_types=["text/*", "application/json"]
+    )
+
+    assert compression.applies_to(content_type, size) is expected
@@ -1,6 +1,7 @@
 import pytest
 
 from expanse.http.header_bag import HeaderBag
+from expanse.http.header_bag import RawHeaderBag
 
 
 def test_init() -> None:
@@ -156,3 +157,43 @@ def test_encode() -> None:
     assert len(encoded_headers) == 2
     assert encoded_headers[0] == (b"content-type", b"application/json")
     assert encoded_headers[1] == (b"x-custom", b"value")
+
+
+def test_raw_header_bag_lookups() -> None:
+    headers = RawHeaderBag(
+        [
+            (b"content-type", b"application/json"),
+            (b"X-Forwarded-For", b"10.0.0.1"),
+            (b"x-forwarded-for", b"10.0.0.2"),
+        ]
+    )
+
+    assert headers["Content-Type"] == "application/json"
+    # Repeated headers are looked up by their last value
+    assert headers.get("X-Forwarded-For") == "10.0.0.2"
+    assert headers["X-Forwarded-For"] == "10.0.0.2"
+    assert headers.all("x-forwarded-for") == ["10.0.0.1", "10.0.0.2"]
+    assert headers.get("Non-Existent") is None
+    assert "content-type" in headers
+    assert "Non-Existent" not in headers
+    assert not headers.has("Non-Existent")
+
+    with pytest.raises(KeyError):
+        headers["Non-Existent"]
+
+
+def test_raw_header_bag_materialization() -> None:
+    raw = [(b"content-type", b"text/html"), (b"x-custom", b"value")]
+    headers = RawHeaderBag(raw)
+
+    assert headers.get("X-Missing") is None
+    assert len(headers) == 2
+    assert list(headers) == ["content-type", "x-custom"]
+    assert headers.all() == {"content-type": ["text/html"], "x-custom": ["value"]}
+
+    headers.set("X-Custom", "other", replace=False)
+    headers.remove("Content-Type")
+
+    assert headers.all() == {"x-custom": ["value", "other"]}
+    # The raw ASGI headers are left untouched
+    assert raw == [(b"content-type", b"text/html"), (b"x-custom", b"value")]
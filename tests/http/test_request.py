@@ -4,15 +4,21 @@ import asyncio
 import json
 
 from datetime import UTC
+from datetime import datetime
 from email.utils import formatdate
 from typing import TYPE_CHECKING
 from urllib.parse import quote
 
+import msgspec
 import pytest
 
+from pydantic import BaseModel
+
 from expanse.http.exceptions import ClientDisconnectedError
 from expanse.http.exceptions import ConflictingForwardedHeadersError
+from expanse.http.exceptions import ContentTooLargeError
 from expanse.http.exceptions import MalformedJSONError
+from expanse.http.exceptions import PreconditionFailedError
 from expanse.http.exceptions import SuspiciousOperationError
 from expanse.http.exceptions import UnsupportedContentTypeError
 from expanse.http.request import Request
@@ -758,6 +764,107 @@ async def test_json_malformed() -> None:
         await request.json
 
 
+class Message(BaseModel):
+    message: str
+
+
+class MessageStruct(msgspec.Struct):
+    message: str
+
+
+@pytest.mark.parametrize("model", [Message, MessageStruct])
+async def test_decode_json(model: type[Message | MessageStruct]) -> None:
+    async def receive():
+        return {"type": "http.request", "body": b'{"message": "hello"}'}
+
+    scope: PartialScope = {"headers": [(b"content-type", b"application/json")]}
+    request = Request.create("http://example.com", method="POST", scope=scope)
+    request._receive = receive
+
+    result = await request.decode_json(model)
+
+    assert isinstance(result, model)
+    assert result.message == "hello"
+
+
+async def test_decode_json_with_non_utf8_charset() -> None:
+    content = '{"message": "héllo"}'.encode("latin-1")
+
+    async def receive():
+        return {"type": "http.request", "body": content}
+
+    scope: PartialScope = {
+        "headers": [(b"content-type", b"application/json; charset=latin-1")]
+    }
+    request = Request.create("http://example.com", method="POST", scope=scope)
+    request._receive = receive
+
+    result = await request.decode_json(MessageStruct)
+
+    assert result.message == "héllo"
+
+
+@pytest.mark.parametrize("model", [Message, MessageStruct])
+async def test_decode_json_malformed(model: type[Message | MessageStruct]) -> None:
+    async def receive():
+        return {"type": "http.request", "body": b"invalid json"}
+
+    scope: PartialScope = {"headers": [(b"content-type", b"application/json")]}
+    request = Request.create("http://example.com", method="POST", scope=scope)
+    request._receive = receive
+
+    with pytest.raises(MalformedJSONError):
+        await request.decode_json(model)
+
+
+async def test_decode_json_invalid_content_type() -> None:
+    scope: PartialScope = {"headers": [(b"content-type", b"text/plain")]}
+    request = Request.create("http://example.com", scope=scope)
+
+    with pytest.raises(UnsupportedContentTypeError):
+        await request.decode_json(Message)
+
+
+async def test_body_exceeding_declared_content_length_is_rejected() -> None:
+    async def receive():
+        pytest.fail("The body should not be read")
+
+    scope: PartialScope = {"headers": [(b"content-length", b"11")]}
+    request = Request.create("http://example.com", method="POST", scope=scope)
+    request._receive = receive
+    request.set_max_body_size(10)
+
+    with pytest.raises(ContentTooLargeError):
+        await request.body
+
+
+async def test_body_exceeding_max_size_is_rejected_while_streaming() -> None:
+    chunks = [b"Hello, ", b"World!"]
+
+    async def receive():
+        return {"type": "http.request", "body": chunks.pop(0), "more_body": True}
+
+    request = Request.create("http://example.com", method="POST")
+    request._receive = receive
+    request.set_max_body_size(10)
+
+    with pytest.raises(ContentTooLargeError):
+        await request.body
+
+    assert chunks == []
+
+
+async def test_body_within_max_size() -> None:
+    async def receive():
+        return {"type": "http.request", "body": b"Hello, World!"}
+
+    request = Request.create("http://example.com", method="POST")
+    request._receive = receive
+    request.set_max_body_size(13)
+
+    assert await request.body == b"Hello, World!"
+
+
 async def test_form_urlencoded() -> None:
     content = b"name=John&age=30&city=New+York"
 
@@ -1050,3 +1157,52 @@ def test_host_with_at_sign_raises_error() -> None:
     request = Request.create("http://example.com", scope=scope)
     with pytest.raises(SuspiciousOperationError, match="Invalid host header"):
         _ = request.host
+
+
+@pytest.mark.parametrize(
+    ["header", "value"],
+    [
+        (b"if-match", b'"other"'),
+        # Weak entity tags never match If-Match
+        (b"if-match", b'W/"etag"'),
+        (b"if-none-match", b"*"),
+        (b"if-unmodified-since", b"Mon, 01 Jan 2029 00:00:00 GMT"),
+    ],
+)
+def test_check_preconditions_fails_for_unsafe_requests(
+    header: bytes, value: bytes
+) -> None:
+    scope: PartialScope = {"headers": [(header, value)]}
+    request = Request.create("http://example.com", method="PUT", scope=scope)
+
+    with pytest.raises(PreconditionFailedError):
+        request.check_preconditions(
+            etag="etag", last_modified=datetime(2030, 1, 1, tzinfo=UTC)
+        )
+
+
+@pytest.mark.parametrize(
+    ["header", "value"],
+    [
+        (b"if-match", b'"etag"'),
+        (b"if-match", b"*"),
+        (b"if-none-match", b'"other"'),
+        (b"if-unmodified-since", b"Tue, 01 Jan 2030 00:00:00 GMT"),
+    ],
+)
+def test_check_preconditions_passes_for_unsafe_requests(
+    header: bytes, value: bytes
+) -> None:
+    scope: PartialScope = {"headers": [(header, value)]}
+    request = Request.create("http://example.com", method="DELETE", scope=scope)
+
+    request.check_preconditions(
+        etag="etag", last_modified=datetime(2030, 1, 1, tzinfo=UTC)
+    )
+
+
+def test_check_preconditions_leaves_not_modified_requests_to_responses() -> None:
+    scope: PartialScope = {"headers": [(b"if-none-match", b'"etag"')]}
+    request = Request.create("http://example.com", scope=scope)
+
+    request.check_preconditions(etag="etag")
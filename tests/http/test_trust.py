@@ -0,0 +1,70 @@
+import pytest
+
+from expanse.http.trust import HostPolicy
+from expanse.http.trust import ProxyPolicy
+
+
+@pytest.mark.parametrize(
+    ("host", "trusted"),
+    [
+        ("192.168.1.1", True),
+        ("192.168.1.255", True),
+        ("192.168.2.1", False),
+        ("10.0.0.1", True),
+        ("10.0.0.2", False),
+        ("172.16.5.4", True),
+        ("2001:db8::1", True),
+        ("2001:db9::1", False),
+        ("::ffff:192.168.1.1", False),
+        ("testclient", False),
+        (None, False),
+    ],
+)
+def test_proxy_policy(host: str | None, trusted: bool) -> None:
+    policy = ProxyPolicy(
+        [
+            "192.168.1.0/24",
+            "10.0.0.1",
+            "172.16.0.0/12",
+            "172.16.0.0/16",
+            "2001:db8::/32",
+        ]
+    )
+
+    assert policy.trusts(host) is trusted
+
+
+def test_proxy_policy_trusting_any_proxy() -> None:
+    policy = ProxyPolicy(["*"])
+
+    assert policy.trusts("81.82.83.84")
+    assert not policy.trusts(None)
+
+
+def test_proxy_policy_rejects_invalid_proxies_upfront() -> None:
+    with pytest.raises(ValueError):
+        ProxyPolicy(["not-an-ip"])
+
+
+@pytest.mark.parametrize(
+    ("host", "trusted"),
+    [
+        ("example.com", True),
+        ("api.example.com", False),
+        ("example.org", True),
+        ("api.example.org", True),
+        ("v1.api.example.org", True),
+        ("badexample.org", False),
+        ("localhost", True),
+        ("foo.localhost", True),
+        ("example.net", False),
+    ],
+)
+def test_host_policy(host: str, trusted: bool) -> None:
+    policy = HostPolicy(["example.com", ".example.org", ".localhost"])
+
+    assert policy.trusts(host) is trusted
+
+
+def test_host_policy_trusting_any_host() -> None:
+    assert HostPolicy(["*"]).trusts("example.com")
@@ -0,0 +1,29 @@
+import pytest
+
+from expanse.http.utils.ranges import parse_range_header
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("bytes=0-499", [(0, 499)]),
+        ("bytes=500-", [(500, 999)]),
+        ("bytes=-200", [(800, 999)]),
+        ("bytes=-2000", [(0, 999)]),
+        ("bytes=900-1500", [(900, 999)]),
+        ("bytes=0-9, 20-29", [(0, 9), (20, 29)]),
+        ("bytes=20-29, 0-9", [(0, 9), (20, 29)]),
+        ("bytes=0-9, 5-19, 20-29", [(0, 29)]),
+        ("bytes=1000-", []),
+        ("bytes=-0", []),
+        ("bytes=10-5", None),
+        ("bytes=abc", None),
+        ("bytes=", None),
+        ("items=0-9", None),
+        ("bytes=" + ",".join(f"{i}-{i}" for i in range(0, 40, 2)), None),
+    ],
+)
+def test_parse_range_header(
+    header: str, expected: list[tuple[int, int]] | None
+) -> None:
+    assert parse_range_header(header, 1000) == expected
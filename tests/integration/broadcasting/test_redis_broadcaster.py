@@ -0,0 +1,107 @@
+import asyncio
+import os
+
+from collections.abc import AsyncGenerator
+
+import pytest
+
+from expanse.broadcasting.broadcasters.redis import RedisBroadcaster
+from expanse.broadcasting.subscription import Event
+from expanse.configuration.config import Config
+from expanse.redis.asynchronous.redis_manager import RedisManager
+
+
+pytestmark = pytest.mark.redis
+
+
+@pytest.fixture()
+async def manager() -> AsyncGenerator[RedisManager]:
+    manager = RedisManager(
+        Config(
+            {
+                "redis": {
+                    "connections": {
+                        "default": {
+                            "url": f"redis://localhost:{os.getenv('REDIS_TEST_PORT', 6379)}/0"
+                        }
+                    },
+                }
+            }
+        )
+    )
+
+    yield manager
+
+    await manager.close()
+
+
+def create_broadcaster(manager: RedisManager) -> RedisBroadcaster:
+    return RedisBroadcaster(
+        manager.connection("default"),
+        manager.create_connection("default"),
+        prefix="expanse:test:broadcast:",
+    )
+
+
+async def wait_for(
+    subscription_count: int, manager: RedisManager, channel: str = "chat"
+) -> None:
+    connection = manager.connection("default")
+
+    for _ in range(100):
+        channels = await connection.pubsub_numsub(f"expanse:test:broadcast:{channel}")
+        patterns = await connection.pubsub_numpat()
+        if channels[0][1] + patterns >= subscription_count:
+            return
+
+        await asyncio.sleep(0.01)
+
+
+async def test_events_are_delivered_across_broadcasters(manager: RedisManager) -> None:
+    publisher = create_broadcaster(manager)
+    subscriber = create_broadcaster(manager)
+
+    try:
+        async with (
+            subscriber.subscribe("chat") as chat,
+            subscriber.subscribe("news:*") as news,
+        ):
+            await wait_for(2, manager)
+
+            await asyncio.gather(
+                publisher.publish("chat", {"text": "Hello"}),
+                publisher.publish("news:sports", "Goal"),
+                publisher.publish("other", "Ignored"),
+            )
+
+            assert await asyncio.wait_for(chat.get(), 2) == Event(
+                "chat", {"text": "Hello"}
+            )
+            assert await asyncio.wait_for(news.get(), 2) == Event("news:sports", "Goal")
+    finally:
+        await publisher.close()
+        await subscriber.close()
+
+
+async def test_events_matching_several_patterns_are_only_delivered_once(
+    manager: RedisManager,
+) -> None:
+    publisher = create_broadcaster(manager)
+    subscriber = create_broadcaster(manager)
+
+    try:
+        async with subscriber.subscribe("chat:*", "chat:1") as subscription:
+            await wait_for(2, manager, "chat:1")
+
+            await publisher.publish("chat:1", 1)
+            await publisher.publish("chat:2", 2)
+
+            assert await asyncio.wait_for(subscription.get(), 2) == Event("chat:1", 1)
+            assert await asyncio.wait_for(subscription.get(), 2) == Event("chat:2", 2)
+
+            await asyncio.sleep(0.1)
+
+            assert subscription._queue.empty()
+    finally:
+        await publisher.close()
+        await subscriber.close()
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from expanse.cache.asynchronous.limiters.database_limiter import DatabaseLimiter
+from expanse.cache.config.database import DatabaseStoreConfig
+from expanse.database.asynchronous.database_manager import AsyncDatabaseManager
+
+
+if TYPE_CHECKING:
+    from expanse.core.application import Application
+    from expanse.testing.command_tester import CommandTester
+
+
+pytestmark = pytest.mark.db
+
+
+class Clock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock(6000.0)
+    monkeypatch.setattr("expanse.cache.asynchronous.limiters.limiter.time", clock)
+
+    return clock
+
+
+@pytest.fixture()
+async def limiter(
+    app: Application, name: str, command_tester: CommandTester
+) -> DatabaseLimiter:
+    app.config["database"]["default"] = name
+
+    command_tester.command("db migrate").run()
+
+    db = await app.container.get(AsyncDatabaseManager)
+
+    # Concurrent attempts in the tests retry as long as needed to be recorded
+    return DatabaseLimiter(DatabaseStoreConfig(connection=name), db, max_retries=100)
+
+
+@pytest.mark.usefixtures("setup_databases")
+@pytest.mark.parametrize("name", ["sqlite", "postgresql", "mysql"])
+async def test_attempts_are_allowed_until_the_limit_is_reached(
+    limiter: DatabaseLimiter, clock: Clock
+) -> None:
+    for remaining in (2, 1, 0):
+        attempt = await limiter.attempt("key", 3, 60)
+        assert attempt.allowed
+        assert attempt.remaining == remaining
+
+    attempt = await limiter.attempt("key", 3, 60)
+    assert not attempt.allowed
+    assert attempt.reset == 90
+
+    assert (await limiter.attempt("other", 3, 60)).allowed
+
+
+@pytest.mark.usefixtures("setup_databases")
+@pytest.mark.parametrize("name", ["sqlite", "postgresql", "mysql"])
+async def test_concurrent_attempts_are_all_counted(
+    limiter: DatabaseLimiter, clock: Clock
+) -> None:
+    attempts = await asyncio.gather(
+        *(limiter.attempt("key", 10, 60) for _ in range(10))
+    )
+
+    assert all(attempt.allowed for attempt in attempts)
+    assert sorted(attempt.remaining for attempt in attempts) == list(range(10))
+    assert not (await limiter.attempt("key", 10, 60)).allowed
+
+
+@pytest.mark.usefixtures("setup_databases")
+@pytest.mark.parametrize("name", ["sqlite", "postgresql", "mysql"])
+async def test_the_previous_window_is_weighted_after_a_rollover(
+    limiter: DatabaseLimiter, clock: Clock
+) -> None:
+    for _ in range(4):
+        await limiter.attempt("key", 4, 60)
+
+    # Half of the previous window still belongs to the sliding window
+    clock.now += 90
+    attempt = await limiter.attempt("key", 4, 60)
+    assert attempt.allowed
+    assert attempt.remaining == 1
+
+    await limiter.attempt("key", 4, 60)
+    attempt = await limiter.attempt("key", 4, 60)
+    assert not attempt.allowed
+    assert attempt.reset == 30
+
+    # The counters of older windows are no longer taken into account
+    clock.now += 120
+    attempt = await limiter.attempt("key", 4, 60)
+    assert attempt.allowed
+    assert attempt.remaining == 3
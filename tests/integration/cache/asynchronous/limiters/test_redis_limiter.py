@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import os
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from expanse.cache.asynchronous.limiters.redis_limiter import RedisLimiter
+from expanse.redis.asynchronous.redis_manager import RedisManager
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from expanse.core.application import Application
+
+
+pytestmark = pytest.mark.redis
+
+
+class Clock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock(6000.0)
+    monkeypatch.setattr("expanse.cache.asynchronous.limiters.limiter.time", clock)
+
+    return clock
+
+
+@pytest.fixture(autouse=True)
+async def setup_redis(app: Application) -> AsyncGenerator[None]:
+    from expanse.redis.redis_service_provider import RedisServiceProvider
+
+    app.config["redis"] = {
+        "connection": "default",
+        "connections": {
+            "default": {
+                "url": f"redis://localhost:{os.getenv('REDIS_TEST_PORT', '6379')}/1"
+            }
+        },
+    }
+
+    await RedisServiceProvider(app.container).register()
+
+    yield
+
+    manager = await app.container.get(RedisManager)
+    connection = manager.connection("default")
+    await connection.flushdb()
+
+
+@pytest.fixture()
+async def limiter(app: Application) -> RedisLimiter:
+    manager = await app.container.get(RedisManager)
+
+    return RedisLimiter(manager.connection("default"))
+
+
+async def test_attempts_are_allowed_until_the_limit_is_reached(
+    limiter: RedisLimiter, clock: Clock
+) -> None:
+    for remaining in (2, 1, 0):
+        attempt = await limiter.attempt("key", 3, 60)
+        assert attempt.allowed
+        assert attempt.remaining == remaining
+
+    attempt = await limiter.attempt("key", 3, 60)
+    assert not attempt.allowed
+    assert attempt.reset == 90
+
+    assert (await limiter.attempt("other", 3, 60)).allowed
+
+
+async def test_concurrent_attempts_are_all_counted(
+    limiter: RedisLimiter, clock: Clock
+) -> None:
+    attempts = await asyncio.gather(
+        *(limiter.attempt("key", 10, 60) for _ in range(10))
+    )
+
+    assert all(attempt.allowed for attempt in attempts)
+    assert sorted(attempt.remaining for attempt in attempts) == list(range(10))
+    assert not (await limiter.attempt("key", 10, 60)).allowed
+
+
+async def test_the_previous_window_is_weighted_after_a_rollover(
+    limiter: RedisLimiter, clock: Clock
+) -> None:
+    for _ in range(4):
+        await limiter.attempt("key", 4, 60)
+
+    # Half of the previous window still belongs to the sliding window
+    clock.now += 90
+    attempt = await limiter.attempt("key", 4, 60)
+    assert attempt.allowed
+    assert attempt.remaining == 1
+
+    await limiter.attempt("key", 4, 60)
+    attempt = await limiter.attempt("key", 4, 60)
+    assert not attempt.allowed
+    assert attempt.reset == 30
+
+    # The counters of older windows are no longer taken into account
+    clock.now += 120
+    attempt = await limiter.attempt("key", 4, 60)
+    assert attempt.allowed
+    assert attempt.remaining == 3
+
+
+async def test_counters_expire_after_two_windows(
+    limiter: RedisLimiter, app: Application, clock: Clock
+) -> None:
+    await limiter.attempt("key", 4, 60)
+
+    manager = await app.container.get(RedisManager)
+    connection = manager.connection("default")
+    ttl = await connection.ttl(limiter._window_key("key", 100))
+
+    assert 0 < ttl <= 120
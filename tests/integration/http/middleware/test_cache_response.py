@@ -0,0 +1,172 @@
+import pytest
+
+from expanse.contracts.routing.router import Router
+from expanse.http.middleware.cache_response import CacheResponse
+from expanse.http.request import Request
+from expanse.http.response_cache import ResponseCache
+from expanse.http.response_cache import response_ttl
+from expanse.http.responses.response import Response
+from expanse.session.middleware.load_session import LoadSession
+from expanse.testing.client import TestClient
+
+
+@pytest.fixture(autouse=True)
+def configure_cache(client: TestClient) -> None:
+    client.app.config["cache.store"] = "memory"
+
+
+class Counter:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def handle(self, request: Request) -> Response:
+        self.calls += 1
+
+        return Response(
+            f"Call {self.calls} {request.query_params.get('page', '')}",
+            content_type="text/plain",
+            headers={"X-Calls": str(self.calls)},
+        )
+
+
+def test_responses_are_served_from_the_cache(
+    client: TestClient, router: Router
+) -> None:
+    counter = Counter()
+    router.get("/", counter.handle).middleware(CacheResponse)
+
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.text == "Call 1 "
+
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.text == "Call 1 "
+    assert response.headers["X-Calls"] == "1"
+    assert response.headers["Content-Type"] == "text/plain; charset=utf-8"
+    assert counter.calls == 1
+
+
+def test_entries_are_keyed_by_query_parameters(
+    client: TestClient, router: Router
+) -> None:
+    counter = Counter()
+    router.get("/", counter.handle).middleware(CacheResponse)
+
+    assert client.get("/?page=1&sort=name").text == "Call 1 1"
+    assert client.get("/?sort=name&page=1").text == "Call 1 1"
+    assert client.get("/?page=2").text == "Call 2 2"
+    assert counter.calls == 2
+
+
+def test_entries_are_keyed_by_varying_headers(
+    client: TestClient, router: Router
+) -> None:
+    counter = Counter()
+    router.get("/", counter.handle).cache(vary=["Accept-Language"])
+
+    assert client.get("/", headers={"Accept-Language": "en"}).text == "Call 1 "
+    assert client.get("/", headers={"Accept-Language": "fr"}).text == "Call 2 "
+    assert client.get("/", headers={"Accept-Language": "en"}).text == "Call 1 "
+
+
+def test_entries_are_keyed_by_host(client: TestClient, router: Router) -> None:
+    counter = Counter()
+    router.get("/", counter.handle).middleware(CacheResponse)
+
+    assert client.get("/", headers={"Host": "a.example.com"}).text == "Call 1 "
+    assert client.get("/", headers={"Host": "b.example.com"}).text == "Call 2 "
+    assert client.get("/", headers={"Host": "a.example.com"}).text == "Call 1 "
+
+
+def test_uncacheable_requests_and_responses_are_not_cached(
+    client: TestClient, router: Router
+) -> None:
+    calls = 0
+
+    async def private() -> Response:
+        nonlocal calls
+        calls += 1
+
+        return Response("Private", headers={"Cache-Control": "private"})
+
+    async def cookie() -> Response:
+        nonlocal calls
+        calls += 1
+
+        return Response("Cookie").with_cookie("name", "value")
+
+    counter = Counter()
+    router.get("/", counter.handle).middleware(CacheResponse)
+    router.get("/private", private).middleware(CacheResponse)
+    router.get("/cookie", cookie).middleware(CacheResponse)
+
+    client.get("/", headers={"Authorization": "Bearer token"})
+    client.get("/", headers={"Authorization": "Bearer token"})
+    assert counter.calls == 2
+
+    client.get("/private")
+    client.get("/private")
+    client.get("/cookie")
+    client.get("/cookie")
+    assert calls == 4
+
+
+def test_requests_with_session_cookies_are_not_served_from_the_cache(
+    client: TestClient, router: Router
+) -> None:
+    client.app.config["session.store"] = "dictionary"
+
+    async def profile(request: Request) -> Response:
+        assert request.session is not None
+
+        if (name := request.query_params.get("login")) is not None:
+            request.session.set("name", name)
+
+        return Response(f"Hello {request.session.get('name', 'guest')}")
+
+    router.get("/profile", profile).middleware(LoadSession).cache()
+
+    john = client.get("/profile?login=John").cookies
+    client.cookies.clear()
+    jane = client.get("/profile?login=Jane").cookies
+
+    client.cookies = john
+    assert client.get("/profile").text == "Hello John"
+
+    client.cookies = jane
+    assert client.get("/profile").text == "Hello Jane"
+
+
+async def test_cached_responses_of_a_route_can_be_purged(
+    client: TestClient, router: Router
+) -> None:
+    counter = Counter()
+    router.get("/", counter.handle, name="home").cache(ttl=3600)
+
+    assert client.get("/").text == "Call 1 "
+    assert client.get("/").text == "Call 1 "
+
+    await (await client.app.container.get(ResponseCache)).purge("home")
+
+    assert client.get("/").text == "Call 2 "
+    assert client.get("/").text == "Call 2 "
+
+
+@pytest.mark.parametrize(
+    ["cache_control", "ttl"],
+    [
+        (None, 60),
+        ("public", 60),
+        ("public, max-age=10", 10),
+        ("max-age=10, s-maxage=20", 20),
+        ("max-age=0", None),
+        ("no-store", None),
+        ("no-cache", None),
+        ("private, max-age=10", None),
+    ],
+)
+def test_response_ttl_honours_cache_control(
+    cache_control: str | None, ttl: int | None
+) -> None:
+    assert response_ttl(cache_control, 60) == ttl
@@ -0,0 +1,121 @@
+import gzip
+import json
+import zlib
+
+from pathlib import Path
+
+from expanse.contracts.routing.router import Router
+from expanse.http.middleware.compress_response import CompressResponse
+from expanse.http.responses.file import FileResponse
+from expanse.http.responses.response import Response
+from expanse.http.responses.streamed import StreamedResponse
+from expanse.testing.client import TestClient
+
+
+PAYLOAD = json.dumps([{"id": i, "name": f"Item {i}"} for i in range(100)])
+
+
+async def handler() -> Response:
+    return Response(PAYLOAD, content_type="application/json")
+
+
+def test_buffered_responses_are_compressed(client: TestClient, router: Router) -> None:
+    router.get("/", handler).middleware(CompressResponse)
+
+    response = client.get("/", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert int(response.headers["Content-Length"]) < len(PAYLOAD)
+    assert response.text == PAYLOAD
+
+
+def test_encoding_is_negotiated(client: TestClient, router: Router) -> None:
+    router.get("/", handler).middleware(CompressResponse)
+
+    response = client.get("/", headers={"Accept-Encoding": "gzip;q=0.5, deflate"})
+
+    assert response.headers["Content-Encoding"] == "deflate"
+    assert response.text == PAYLOAD
+
+    response = client.get("/", headers={"Accept-Encoding": "gzip;q=0, br"})
+
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.text == PAYLOAD
+
+
+def test_small_responses_are_not_compressed(client: TestClient, router: Router) -> None:
+    router.get("/", lambda: Response("Hello")).middleware(CompressResponse)
+
+    response = client.get("/", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in response.headers
+    assert response.text == "Hello"
+
+
+def test_content_types_outside_the_allowlist_are_not_compressed(
+    client: TestClient, router: Router
+) -> None:
+    router.get(
+        "/", lambda: Response(PAYLOAD.encode(), content_type="image/png")
+    ).middleware(CompressResponse)
+
+    response = client.get("/", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in response.headers
+
+
+def test_encoded_responses_are_left_untouched(
+    client: TestClient, router: Router
+) -> None:
+    body = gzip.compress(PAYLOAD.encode())
+    router.get(
+        "/",
+        lambda: Response(
+            body,
+            content_type="application/json",
+            headers={"Content-Encoding": "gzip"},
+        ),
+    ).middleware(CompressResponse)
+
+    response = client.get("/", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Vary" not in response.headers
+    assert response.text == PAYLOAD
+
+
+def test_streamed_responses_are_compressed_incrementally(
+    client: TestClient, router: Router
+) -> None:
+    def chunks():
+        for i in range(100):
+            yield f"line {i}\n"
+
+    router.get("/", lambda: StreamedResponse(chunks)).middleware(CompressResponse)
+
+    response = client.get("/", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    assert response.text == "".join(f"line {i}\n" for i in range(100))
+
+
+def test_file_responses_are_compressed(
+    client: TestClient, router: Router, tmp_path: Path
+) -> None:
+    path = tmp_path / "data.json"
+    path.write_text(PAYLOAD)
+
+    router.get("/", lambda: FileResponse(path, chunk_size=256)).middleware(
+        CompressResponse
+    )
+
+    with client.stream("GET", "/", headers={"Accept-Encoding": "deflate"}) as response:
+        raw = b"".join(response.iter_raw())
+
+    assert response.headers["Content-Encoding"] == "deflate"
+    assert "Content-Length" not in response.headers
+    assert zlib.decompress(raw).decode() == PAYLOAD
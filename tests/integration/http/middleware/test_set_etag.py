@@ -0,0 +1,56 @@
+from expanse.contracts.routing.router import Router
+from expanse.http.middleware.compress_response import CompressResponse
+from expanse.http.middleware.set_etag import SetETag
+from expanse.http.responses.response import Response
+from expanse.testing.client import TestClient
+
+
+async def handler() -> Response:
+    return Response("Hello, World!")
+
+
+def test_responses_are_tagged(client: TestClient, router: Router) -> None:
+    router.get("/", handler).middleware(SetETag)
+
+    response = client.get("/")
+
+    assert response.status_code == 200
+    assert response.headers["ETag"]
+
+    etag = response.headers["ETag"]
+    response = client.get("/", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+
+def test_unsafe_methods_are_not_tagged(client: TestClient, router: Router) -> None:
+    router.post("/", handler).middleware(SetETag)
+
+    response = client.post("/")
+
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+
+
+def test_compressed_responses_have_weak_tags(
+    client: TestClient, router: Router
+) -> None:
+    router.get("/", lambda: Response("Hello, World!" * 100)).middleware(
+        SetETag, CompressResponse
+    )
+
+    response = client.get("/", headers={"Accept-Encoding": "identity"})
+    etag = response.headers["ETag"]
+
+    response = client.get("/", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"] == f"W/{etag}"
+
+    response = client.get(
+        "/", headers={"Accept-Encoding": "gzip", "If-None-Match": f"W/{etag}"}
+    )
+
+    assert response.status_code == 304
@@ -0,0 +1,140 @@
+import pytest
+
+from expanse.contracts.routing.router import Router
+from expanse.http.middleware.throttle_requests import ThrottleRequests
+from expanse.http.rate_limiter import RateLimiter
+from expanse.http.request import Request
+from expanse.http.responses.response import Response
+from expanse.testing.client import TestClient
+
+
+@pytest.fixture(autouse=True)
+def configure_cache(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    client.app.config["cache.store"] = "memory"
+    client.app.config["http.rate_limits"] = {"default": {"limit": 2, "window": 60}}
+
+    # Requests are made at the start of a window
+    monkeypatch.setattr(
+        "expanse.cache.asynchronous.limiters.limiter.time.time", lambda: 6000.0
+    )
+
+
+class Counter:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def handle(self) -> Response:
+        self.calls += 1
+
+        return Response(f"Call {self.calls}", content_type="text/plain")
+
+
+def test_requests_exceeding_the_limit_are_rejected(
+    client: TestClient, router: Router
+) -> None:
+    counter = Counter()
+    router.get("/", counter.handle).middleware(ThrottleRequests)
+
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.headers["RateLimit-Limit"] == "2"
+    assert response.headers["RateLimit-Remaining"] == "1"
+    assert response.headers["RateLimit-Reset"] == "60"
+
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.headers["RateLimit-Remaining"] == "0"
+
+    response = client.get("/")
+    assert response.status_code == 429
+    assert response.headers["RateLimit-Limit"] == "2"
+    assert response.headers["RateLimit-Remaining"] == "0"
+    assert response.headers["Retry-After"] == "100"
+    assert counter.calls == 2
+
+
+async def test_exhausted_keys_are_rejected_without_reaching_the_store(
+    client: TestClient, router: Router, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    router.get("/", Counter().handle).middleware(ThrottleRequests)
+
+    for _ in range(3):
+        client.get("/")
+
+    limiter = await client.app.container.get(RateLimiter)
+    assert len(limiter._exhausted) == 1
+
+    async def fail(*args: object) -> None:
+        raise AssertionError("The store should not be reached")
+
+    monkeypatch.setattr(limiter._limiter or pytest.fail(), "attempt", fail)
+
+    response = client.get("/")
+    assert response.status_code == 429
+    assert 0 < int(response.headers["Retry-After"]) <= 100
+
+
+async def test_routes_can_use_named_limits(client: TestClient, router: Router) -> None:
+    limiter = await client.app.container.get(RateLimiter)
+    limiter.define("search", 1, 60, by=lambda request: request.query_params.get("q"))
+
+    counter = Counter()
+    router.get("/search", counter.handle).throttle("search")
+
+    assert client.get("/search?q=foo").status_code == 200
+    assert client.get("/search?q=bar").status_code == 200
+    assert client.get("/search?q=foo").status_code == 429
+    assert counter.calls == 2
+
+
+def test_the_most_restrictive_limit_is_reported(
+    client: TestClient, router: Router
+) -> None:
+    client.app.config["http.rate_limits"] = {
+        "default": {"limit": 5, "window": 60},
+        "route": {"limit": 3, "window": 60, "by": "route"},
+    }
+    router.get("/", Counter().handle).throttle("default", "route")
+
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.headers["RateLimit-Limit"] == "3"
+    assert response.headers["RateLimit-Remaining"] == "2"
+
+
+async def test_requests_can_be_counted_by_user(
+    client: TestClient, router: Router
+) -> None:
+    limiter = await client.app.container.get(RateLimiter)
+    limiter.define("user", 1, 60, by=lambda request: request.headers.get("X-User"))
+
+    async def handle(request: Request) -> Response:
+        return Response("OK")
+
+    router.get("/", handle).throttle("user")
+
+    assert client.get("/", headers={"X-User": "a"}).status_code == 200
+    assert client.get("/", headers={"X-User": "b"}).status_code == 200
+    assert client.get("/", headers={"X-User": "a"}).status_code == 429
+    # Anonymous requests are counted by IP address
+    assert client.get("/").status_code == 200
+    assert client.get("/").status_code == 429
+
+
+def test_credentials_are_not_used_to_count_requests(
+    client: TestClient, router: Router
+) -> None:
+    client.app.config["http.rate_limits"] = {
+        "user": {"limit": 1, "window": 60, "by": "user"}
+    }
+    router.get("/", Counter().handle).throttle("user")
+
+    with pytest.raises(ValueError, match="Invalid rate limit key user"):
+        client.get("/", headers={"Authorization": "Bearer a"})
+
+
+def test_undefined_limits_are_reported(client: TestClient, router: Router) -> None:
+    router.get("/", Counter().handle).throttle("unknown")
+
+    with pytest.raises(ValueError, match="Rate limit unknown is not defined"):
+        client.get("/")
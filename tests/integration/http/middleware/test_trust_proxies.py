@@ -102,6 +102,33 @@ async def test_proxies_with_specific_headers(
     assert response.status_code == 200
 
 
+async def test_trusted_proxies_with_repeated_headers(
+    router: Router, client: TestClient
+) -> None:
+    client.app.config["http.trusted_proxies"] = ["192.168.1.1"]
+    trust_proxies = TrustProxies(client.app)
+
+    request = Request.create(
+        "http://example.com:8080",
+        scope={
+            "headers": [
+                (b"X-Forwarded-For", b"81.82.83.84"),
+                (b"X-Forwarded-For", b"91.92.93.94"),
+                (b"X-Forwarded-Host", b"some-host.com"),
+                (b"X-Forwarded-Host", b"some-other-host.com"),
+            ],
+            "client": ("192.168.1.1", 12345),
+        },
+    )
+
+    # The last occurrence of repeated headers is used
+    response = await trust_proxies.handle(
+        request, get_handler(ip="91.92.93.94", host="some-other-host.com")
+    )
+
+    assert response.status_code == 200
+
+
 async def test_trusted_proxies_with_port_header(
     router: Router, client: TestClient, request_: Request
 ) -> None:
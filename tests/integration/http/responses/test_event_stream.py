@@ -0,0 +1,152 @@
+import asyncio
+
+from collections.abc import AsyncIterator
+from collections.abc import Iterator
+
+import pytest
+
+from expanse.container.container import Container
+from expanse.contracts.routing.registrar import Registrar
+from expanse.http.helpers import sse
+from expanse.http.request import Request
+from expanse.http.responses.event_stream import EventStreamResponse
+from expanse.http.responses.event_stream import ServerSentEvent
+from expanse.testing.client import TestClient
+from expanse.types import Message
+from expanse.types import Send
+
+
+def test_events_are_formatted(router: Registrar, client: TestClient) -> None:
+    def events() -> Iterator[ServerSentEvent | str | dict[str, int]]:
+        yield "Hello"
+        yield ServerSentEvent("line 1\nline 2", event="update", id="1")
+        yield {"count": 2}
+        yield ServerSentEvent(comment="Nothing to see")
+
+    router.get("/events", lambda: sse(events(), retry=3000))
+
+    response = client.get("/events")
+
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "text/event-stream; charset=utf-8"
+    assert response.headers["Cache-Control"] == "no-cache"
+    assert response.text == (
+        "retry: 3000\n\n"
+        "data: Hello\n\n"
+        "id: 1\nevent: update\ndata: line 1\ndata: line 2\n\n"
+        'data: {"count":2}\n\n'
+        ": Nothing to see\n\n"
+    )
+
+
+def test_streams_resume_from_the_last_event_id(
+    router: Registrar, client: TestClient
+) -> None:
+    async def events(last_event_id: str | None) -> AsyncIterator[ServerSentEvent]:
+        start = int(last_event_id) + 1 if last_event_id is not None else 1
+        for i in range(start, 4):
+            yield ServerSentEvent(i, id=str(i))
+
+    router.get("/events", lambda: sse(events))
+
+    assert client.get("/events").text.count("data:") == 3
+
+    response = client.get("/events", headers={"Last-Event-ID": "2"})
+    assert response.text == "id: 3\ndata: 3\n\n"
+
+
+def test_invalid_event_ids_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        ServerSentEvent("data", id="1\n2").encode()
+
+
+async def test_heartbeats_are_sent_while_no_event_is_produced() -> None:
+    async def events() -> AsyncIterator[str]:
+        yield "first"
+        await asyncio.sleep(0.1)
+        yield "second"
+
+    response = EventStreamResponse(events(), heartbeat=0.02)
+    messages = await send_body(response)
+
+    bodies = [message["body"] for message in messages]
+    assert bodies[0] == b"data: first\n\n"
+    assert b": heartbeat\n\n" in bodies
+    assert bodies[-2:] == [b"data: second\n\n", b""]
+
+
+async def test_slow_clients_are_dropped_with_the_drop_policy() -> None:
+    produced: list[int] = []
+    closed = asyncio.Event()
+
+    async def events() -> AsyncIterator[int]:
+        try:
+            for i in range(100):
+                produced.append(i)
+                yield i
+        finally:
+            closed.set()
+
+    response = EventStreamResponse(events(), max_queue=2, policy="drop")
+
+    async def slow_send(message: Message) -> None:
+        await asyncio.sleep(0.01)
+
+    messages = await send_body(response, slow_send)
+
+    assert len(produced) < 100
+    assert closed.is_set()
+    assert messages[-1] == {
+        "type": "http.response.body",
+        "body": b"",
+        "more_body": False,
+    }
+
+
+async def test_producers_are_closed_when_the_client_disconnects() -> None:
+    closed = asyncio.Event()
+
+    async def events() -> AsyncIterator[int]:
+        try:
+            while True:
+                yield 1
+                await asyncio.sleep(0.01)
+        finally:
+            closed.set()
+
+    response = EventStreamResponse(events())
+    request = Request.create("http://localhost/")
+    await response.prepare(request, Container())
+
+    async def send(message: Message) -> None:
+        pass
+
+    async def receive() -> Message:
+        await asyncio.sleep(0.05)
+
+        return {"type": "http.disconnect"}
+
+    await asyncio.wait_for(response.send_body(send, receive), 1)
+
+    assert closed.is_set()
+
+
+async def send_body(
+    response: EventStreamResponse, send: Send | None = None
+) -> list[Message]:
+    messages: list[Message] = []
+
+    async def record(message: Message) -> None:
+        if send is not None:
+            await send(message)
+
+        messages.append(message)
+
+    async def receive() -> Message:
+        await asyncio.Event().wait()
+
+        return {"type": "http.disconnect"}
+
+    await response.send_body(record, receive)
+
+    return messages
@@ -1,8 +1,14 @@
+from collections.abc import MutableMapping
 from pathlib import Path
+from typing import Any
 
+import anyio
+import pytest
 import whenever
 
+from expanse.container.container import Container
 from expanse.contracts.routing.registrar import Registrar
+from expanse.http.request import Request
 from expanse.http.responses.file import FileResponse
 from expanse.testing.client import TestClient
 
@@ -105,3 +111,228 @@ def test_file_response_with_special_characters(
     assert "Content-Encoding" not in response.headers
     assert response.headers["Last-Modified"] is not None
     assert response.text == "This is a test file."
+
+
+def test_file_response_is_not_sent_if_not_modified(
+    router: Registrar, client: TestClient, tmp_path: Path
+) -> None:
+    path = tmp_path.joinpath("test.txt")
+    path.write_text("This is a test file.")
+    router.get("/file", lambda: FileResponse(path))
+
+    response = client.get("/file")
+
+    stat = path.stat()
+    etag = response.headers["ETag"]
+    assert etag == f'W/"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+
+    response = client.get("/file", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+    response = client.get(
+        "/file", headers={"If-Modified-Since": response.headers["Last-Modified"]}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_file_response_uses_the_etag_from_metadata(
+    router: Registrar, client: TestClient
+) -> None:
+    def create_response() -> FileResponse:
+        response = FileResponse(iter([b"This is a test file."]), filename="test.txt")
+        response.metadata = {"size": 20, "etag": '"abc123"'}
+
+        return response
+
+    router.get("/file", create_response)
+
+    response = client.get("/file")
+
+    assert response.headers["ETag"] == '"abc123"'
+    assert response.text == "This is a test file."
+
+    response = client.get("/file", headers={"If-None-Match": '"abc123"'})
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+@pytest.fixture()
+def data_file(router: Registrar, tmp_path: Path) -> Path:
+    path = tmp_path.joinpath("data.bin")
+    path.write_bytes(bytes(range(256)) * 4)
+
+    router.get("/file", lambda: FileResponse(path, chunk_size=100))
+
+    return path
+
+
+def test_file_response_with_single_range(client: TestClient, data_file: Path) -> None:
+    response = client.get("/file", headers={"Range": "bytes=10-19"})
+
+    assert response.status_code == 206
+    assert response.headers["Accept-Ranges"] == "bytes"
+    assert response.headers["Content-Range"] == "bytes 10-19/1024"
+    assert response.headers["Content-Length"] == "10"
+    assert response.content == data_file.read_bytes()[10:20]
+
+    response = client.get("/file", headers={"Range": "bytes=-300"})
+
+    assert response.status_code == 206
+    assert response.headers["Content-Range"] == "bytes 724-1023/1024"
+    assert response.content == data_file.read_bytes()[-300:]
+
+
+def test_file_response_with_multiple_ranges(
+    client: TestClient, data_file: Path
+) -> None:
+    response = client.get("/file", headers={"Range": "bytes=0-4, 500-749"})
+
+    assert response.status_code == 206
+    content_type = response.headers["Content-Type"]
+    assert content_type.startswith("multipart/byteranges; boundary=")
+    assert int(response.headers["Content-Length"]) == len(response.content)
+
+    boundary = content_type.split("boundary=")[1]
+    data = data_file.read_bytes()
+    assert (
+        response.content
+        == (
+            f"--{boundary}\r\n"
+            "Content-Type: application/octet-stream\r\n"
+            "Content-Range: bytes 0-4/1024\r\n\r\n"
+        ).encode()
+        + data[0:5]
+        + (
+            f"\r\n--{boundary}\r\n"
+            "Content-Type: application/octet-stream\r\n"
+            "Content-Range: bytes 500-749/1024\r\n\r\n"
+        ).encode()
+        + data[500:750]
+        + f"\r\n--{boundary}--\r\n".encode()
+    )
+
+
+def test_file_response_with_unsatisfiable_range(
+    client: TestClient, data_file: Path
+) -> None:
+    response = client.get("/file", headers={"Range": "bytes=2000-"})
+
+    assert response.status_code == 416
+    assert response.headers["Content-Range"] == "bytes */1024"
+    assert response.content == b""
+
+
+def test_file_response_with_invalid_range(client: TestClient, data_file: Path) -> None:
+    response = client.get("/file", headers={"Range": "bytes=20-10"})
+
+    assert response.status_code == 200
+    assert response.content == data_file.read_bytes()
+
+
+def test_file_response_with_if_range(client: TestClient, data_file: Path) -> None:
+    response = client.get("/file")
+    etag = response.headers["ETag"]
+    last_modified = response.headers["Last-Modified"]
+
+    response = client.get(
+        "/file", headers={"Range": "bytes=0-9", "If-Range": last_modified}
+    )
+
+    assert response.status_code == 206
+    assert response.content == data_file.read_bytes()[:10]
+
+    response = client.get(
+        "/file",
+        headers={"Range": "bytes=0-9", "If-Range": "Mon, 01 Jan 2001 00:00:00 GMT"},
+    )
+
+    assert response.status_code == 200
+    assert response.content == data_file.read_bytes()
+
+    # Weak entity tags never satisfy If-Range
+    response = client.get("/file", headers={"Range": "bytes=0-9", "If-Range": etag})
+
+    assert response.status_code == 200
+    assert response.content == data_file.read_bytes()
+
+
+def test_file_response_with_strong_if_range(
+    router: Registrar, client: TestClient, data_file: Path
+) -> None:
+    router.get("/tagged", lambda: FileResponse(data_file, headers={"ETag": '"v1"'}))
+
+    response = client.get("/tagged", headers={"Range": "bytes=0-9", "If-Range": '"v1"'})
+
+    assert response.status_code == 206
+    assert response.content == data_file.read_bytes()[:10]
+
+    response = client.get(
+        "/tagged", headers={"Range": "bytes=0-9", "If-Range": '"outdated"'}
+    )
+
+    assert response.status_code == 200
+    assert response.content == data_file.read_bytes()
+
+
+async def _send_file(
+    response: FileResponse, extensions: dict[str, Any], headers: list[Any]
+) -> list[dict[str, Any]]:
+    request = Request.create(
+        "http://example.com/file",
+        scope={"extensions": extensions, "headers": headers},
+    )
+    await response.prepare(request, Container())
+
+    messages: list[dict[str, Any]] = []
+    sent = anyio.Event()
+
+    async def send(message: MutableMapping[str, Any]) -> None:
+        messages.append(dict(message))
+        if not message.get("more_body", False):
+            sent.set()
+
+    async def receive() -> dict[str, Any]:
+        await sent.wait()
+
+        return {"type": "http.disconnect"}
+
+    await response.send_body(send, receive)
+
+    return messages
+
+
+async def test_file_response_uses_pathsend_if_supported(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("test.txt")
+    path.write_text("This is a test file.")
+
+    messages = await _send_file(FileResponse(path), {"http.response.pathsend": {}}, [])
+
+    assert messages == [{"type": "http.response.pathsend", "path": str(path.resolve())}]
+
+
+async def test_file_response_uses_zerocopysend_if_supported(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("test.txt")
+    path.write_text("This is a test file.")
+
+    messages = await _send_file(
+        FileResponse(path),
+        {"http.response.zerocopysend": {}},
+        [(b"range", b"bytes=5-9")],
+    )
+
+    assert len(messages) == 2
+    assert messages[0]["type"] == "http.response.zerocopysend"
+    assert messages[0]["offset"] == 5
+    assert messages[0]["count"] == 5
+    assert messages[0]["more_body"] is True
+    assert messages[1] == {
+        "type": "http.response.body",
+        "body": b"",
+        "more_body": False,
+    }
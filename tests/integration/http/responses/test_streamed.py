@@ -0,0 +1,120 @@
+import asyncio
+
+from collections.abc import AsyncIterator
+from collections.abc import Iterator
+
+from expanse.container.container import Container
+from expanse.contracts.routing.registrar import Registrar
+from expanse.http.request import Request
+from expanse.http.responses.streamed import FLUSH
+from expanse.http.responses.streamed import StreamedResponse
+from expanse.testing.client import TestClient
+from expanse.types import Message
+
+
+def rows() -> Iterator[str]:
+    yield "id,name\n"
+
+    for i in range(100):
+        yield f"{i},name-{i}\n"
+
+
+def test_streamed_response(router: Registrar, client: TestClient) -> None:
+    router.get("/export", lambda: StreamedResponse(rows(), content_type="text/csv"))
+
+    response = client.get("/export")
+
+    assert response.status_code == 200
+    assert response.text == "".join(rows())
+
+
+def test_streamed_response_with_batches(router: Registrar, client: TestClient) -> None:
+    router.get(
+        "/export",
+        lambda: StreamedResponse(rows(), content_type="text/csv", batch_size=16),
+    )
+    router.get(
+        "/export-bytes",
+        lambda: StreamedResponse(rows(), content_type="text/csv", batch_bytes=256),
+    )
+
+    assert client.get("/export").text == "".join(rows())
+    assert client.get("/export-bytes").text == "".join(rows())
+
+
+async def test_streamed_response_coalesces_chunks() -> None:
+    response = StreamedResponse(rows(), buffer_size=512)
+    messages = await send_body(response)
+
+    assert [len(message["body"]) for message in messages] == [516, 517, 55]
+    assert b"".join(message["body"] for message in messages) == "".join(rows()).encode()
+
+
+async def test_streamed_response_can_be_flushed_explicitly() -> None:
+    async def chunks() -> AsyncIterator[bytes | str]:
+        yield "a"
+        yield FLUSH
+        yield FLUSH
+        yield "b"
+        yield "c"
+
+    response = StreamedResponse(chunks(), buffer_size=512)
+
+    assert [message["body"] for message in await send_body(response)] == [
+        b"a",
+        b"bc",
+    ]
+
+
+async def test_streamed_response_is_flushed_periodically() -> None:
+    async def chunks() -> AsyncIterator[bytes]:
+        yield b"a"
+        await asyncio.sleep(0.05)
+        yield b"b"
+        yield b"c"
+
+    response = StreamedResponse(chunks(), buffer_size=512, flush_interval=0.01)
+
+    assert [message["body"] for message in await send_body(response)] == [
+        b"ab",
+        b"c",
+    ]
+
+
+async def test_streamed_response_stops_when_sending_fails() -> None:
+    request = Request.create(
+        "http://localhost/", scope={"asgi": {"version": "3.0", "spec_version": "2.4"}}
+    )
+    response = StreamedResponse(rows())
+    await response.prepare(request, Container())
+
+    sent: list[Message] = []
+
+    async def send(message: Message) -> None:
+        if len(sent) == 2:
+            raise OSError("Client disconnected")
+
+        sent.append(message)
+
+    async def receive() -> Message:
+        raise AssertionError("Disconnections are detected when sending")
+
+    await response.send_body(send, receive)
+
+    assert len(sent) == 2
+
+
+async def send_body(response: StreamedResponse) -> list[Message]:
+    messages: list[Message] = []
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    async def receive() -> Message:
+        await asyncio.Event().wait()
+
+        return {"type": "http.disconnect"}
+
+    await response.send_body(send, receive)
+
+    return messages
@@ -76,3 +76,31 @@ def test_msgspec_validation_errors_are_correctly_reported(
             }
         ],
     }
+
+
+def test_malformed_json_is_reported_as_bad_request(
+    router: Router, client: TestClient
+) -> None:
+    router.post("/", create_foo_validated)
+
+    response = client.post(
+        "/", content=b'{"bar":', headers={"Content-Type": "application/json"}
+    )
+
+    assert response.status_code == 400
+
+
+def test_bodies_larger_than_the_configured_maximum_are_rejected(
+    router: Router, client: TestClient
+) -> None:
+    client.app.config["http.max_body_size"] = 10
+    router.post("/", create_foo_validated_msgspec)
+
+    response = client.post("/", json={"bar": 42, "baz": "something"})
+
+    assert response.status_code == 413
+
+    response = client.post("/", json={"bar": 42})
+
+    assert response.status_code == 200
+    assert response.json() == {"bar": 42}
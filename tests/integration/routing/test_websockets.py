@@ -0,0 +1,363 @@
+import asyncio
+
+import msgspec
+import pytest
+
+from expanse.contracts.routing.router import Router
+from expanse.core.application import Application
+from expanse.core.http.exceptions import HTTPException
+from expanse.core.http.middleware.middleware import Middleware
+from expanse.http.request import Request
+from expanse.http.response import Response
+from expanse.http.websocket import WebSocket
+from expanse.routing.helpers import ws
+from expanse.types import Message
+from expanse.types import Scope
+from expanse.types.http.middleware import RequestHandler
+
+
+class Greeting(msgspec.Struct):
+    name: str
+
+
+class Client:
+    def __init__(
+        self,
+        app: Application,
+        path: str,
+        *,
+        query_string: bytes = b"",
+        subprotocols: list[str] | None = None,
+        extensions: dict[str, dict[object, object]] | None = None,
+    ) -> None:
+        self._app = app
+        self._scope: Scope = {
+            "type": "websocket",
+            "asgi": {"version": "3.0", "spec_version": "2.4"},
+            "http_version": "1.1",
+            "scheme": "ws",
+            "server": ("localhost", 80),
+            "client": ("127.0.0.1", 1234),
+            "root_path": "",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query_string,
+            "headers": [(b"host", b"localhost")],
+            "subprotocols": subprotocols or [],
+            "extensions": extensions or {},
+        }
+        self._incoming: asyncio.Queue[Message] = asyncio.Queue()
+        self._outgoing: asyncio.Queue[Message] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+
+    async def connect(self) -> Message:
+        self._task = asyncio.create_task(
+            self._app(self._scope, self._incoming.get, self._outgoing.put)
+        )
+        await self._incoming.put({"type": "websocket.connect"})
+
+        return await self.receive()
+
+    async def send_text(self, text: str) -> None:
+        await self._incoming.put({"type": "websocket.receive", "text": text})
+
+    async def disconnect(self, code: int = 1000) -> None:
+        await self._incoming.put({"type": "websocket.disconnect", "code": code})
+
+    async def receive(self) -> Message:
+        return await asyncio.wait_for(self._outgoing.get(), 1)
+
+    async def wait(self) -> None:
+        assert self._task is not None
+
+        await asyncio.wait_for(self._task, 1)
+
+
+async def test_websocket_routes_exchange_messages(
+    app: Application, router: Router
+) -> None:
+    async def echo(websocket: WebSocket, room: str) -> None:
+        await websocket.accept()
+
+        async for text in websocket.iter_text():
+            await websocket.send_text(f"{room}: {text}")
+
+    router.websocket("/rooms/{room}", echo)
+
+    client = Client(app, "/rooms/lobby")
+
+    assert (await client.connect())["type"] == "websocket.accept"
+
+    await client.send_text("Hello")
+    assert await client.receive() == {"type": "websocket.send", "text": "lobby: Hello"}
+
+    await client.disconnect()
+    await client.wait()
+
+    assert client._outgoing.empty()
+
+
+async def test_websocket_json_messages_are_decoded_into_models(
+    app: Application, router: Router
+) -> None:
+    async def greet(websocket: WebSocket) -> None:
+        await websocket.accept()
+
+        greeting = await websocket.receive_json(Greeting)
+
+        await websocket.send_json({"message": f"Hello {greeting.name}"})
+
+    router.websocket("/greet", greet)
+
+    client = Client(app, "/greet")
+    await client.connect()
+    await client.send_text('{"name": "John"}')
+
+    assert await client.receive() == {
+        "type": "websocket.send",
+        "text": '{"message":"Hello John"}',
+    }
+    # The connection is closed once the endpoint returns
+    assert await client.receive() == {
+        "type": "websocket.close",
+        "code": 1000,
+        "reason": "",
+    }
+    await client.wait()
+
+
+async def test_websocket_routes_can_be_declared_with_decorators(
+    app: Application, router: Router
+) -> None:
+    @ws("/decorated", name="decorated")
+    async def endpoint(websocket: WebSocket) -> None:
+        await websocket.accept(subprotocol="chat")
+        await websocket.send_bytes(b"data")
+
+    router.handler(endpoint)
+
+    client = Client(app, "/decorated", subprotocols=["chat"])
+
+    assert (await client.connect())["subprotocol"] == "chat"
+    assert await client.receive() == {"type": "websocket.send", "bytes": b"data"}
+
+
+async def test_websocket_routes_do_not_match_http_requests(
+    app: Application, router: Router
+) -> None:
+    async def endpoint(websocket: WebSocket) -> None:
+        await websocket.accept()
+
+    router.websocket("/socket", endpoint)
+
+    with pytest.raises(HTTPException) as e:
+        await router.handle(app.container, Request.create("http://localhost/socket"))
+
+    assert e.value.status_code == 404
+
+
+async def test_http_routes_do_not_match_websocket_connections(
+    app: Application, router: Router
+) -> None:
+    router.get("/page", lambda: "Page")
+
+    client = Client(app, "/page")
+
+    assert await client.connect() == {
+        "type": "websocket.close",
+        "code": 1008,
+        "reason": "",
+    }
+    await client.wait()
+
+
+async def test_unaccepted_connections_are_denied_with_the_returned_response(
+    app: Application, router: Router
+) -> None:
+    async def endpoint(websocket: WebSocket) -> Response:
+        return Response("Forbidden", status_code=403)
+
+    router.websocket("/socket", endpoint)
+
+    client = Client(app, "/socket", extensions={"websocket.http.response": {}})
+
+    start = await client.connect()
+
+    assert start["type"] == "websocket.http.response.start"
+    assert start["status"] == 403
+    assert await client.receive() == {
+        "type": "websocket.http.response.body",
+        "body": b"Forbidden",
+        "more_body": False,
+    }
+    await client.wait()
+
+
+async def test_connections_left_pending_by_the_endpoint_are_forbidden(
+    app: Application, router: Router
+) -> None:
+    async def endpoint(websocket: WebSocket) -> None:
+        return None
+
+    router.websocket("/socket", endpoint)
+
+    client = Client(app, "/socket", extensions={"websocket.http.response": {}})
+
+    start = await client.connect()
+
+    assert start["type"] == "websocket.http.response.start"
+    assert start["status"] == 403
+    await client.wait()
+
+
+async def test_route_middleware_apply_to_websocket_connections(
+    app: Application, router: Router
+) -> None:
+    class Authenticate(Middleware):
+        async def handle(self, request: Request, next_call: RequestHandler) -> Response:
+            if request.query_params.get("token") != "secret":
+                raise HTTPException(401, "Unauthorized")
+
+            return await next_call(request)
+
+    async def endpoint(websocket: WebSocket) -> None:
+        await websocket.accept()
+
+    router.websocket("/socket", endpoint).middleware(Authenticate)
+
+    client = Client(app, "/socket")
+    assert (await client.connect())["code"] == 1008
+
+    client = Client(app, "/socket", query_string=b"token=secret")
+    assert (await client.connect())["type"] == "websocket.accept"
+
+
+async def test_errors_close_accepted_connections(
+    app: Application, router: Router
+) -> None:
+    async def endpoint(websocket: WebSocket) -> None:
+        await websocket.accept()
+
+        raise RuntimeError("Failure")
+
+    router.websocket("/socket", endpoint)
+
+    client = Client(app, "/socket")
+    await client.connect()
+
+    assert (await client.receive())["code"] == 1011
+    await client.wait()
+
+
+async def test_keepalive_answers_and_sends_pings(
+    app: Application, router: Router
+) -> None:
+    app.config["http.websocket_ping_interval"] = 0.05
+    app.config["http.websocket_ping_timeout"] = 0.05
+
+    async def endpoint(websocket: WebSocket) -> None:
+        await websocket.accept()
+
+        await websocket.send_text(await websocket.receive_text())
+
+    router.websocket("/socket", endpoint)
+
+    client = Client(app, "/socket")
+    await client.connect()
+
+    assert await client.receive() == {"type": "websocket.send", "text": "ping"}
+
+    await client.send_text("pong")
+    await client.send_text("ping")
+    await client.send_text("Hello")
+
+    assert await client.receive() == {"type": "websocket.send", "text": "pong"}
+    assert await client.receive() == {"type": "websocket.send", "text": "Hello"}
+    await client.wait()
+
+
+async def test_keepalive_closes_unresponsive_connections(
+    app: Application, router: Router
+) -> None:
+    app.config["http.websocket_ping_interval"] = 0.05
+    app.config["http.websocket_ping_timeout"] = 0.05
+
+    async def endpoint(websocket: WebSocket) -> None:
+        await websocket.accept()
+
+        await websocket.receive()
+
+    router.websocket("/socket", endpoint)
+
+    client = Client(app, "/socket")
+    await client.connect()
+
+    assert await client.receive() == {"type": "websocket.send", "text": "ping"}
+    assert await client.receive() == {
+        "type": "websocket.close",
+        "code": 1011,
+        "reason": "Keepalive ping timeout",
+    }
+    await client.wait()
+
+
+async def test_keepalive_closes_connections_unresponsive_for_several_pings(
+    app: Application, router: Router
+) -> None:
+    app.config["http.websocket_ping_interval"] = 0.05
+    app.config["http.websocket_ping_timeout"] = 0.2
+
+    async def endpoint(websocket: WebSocket) -> None:
+        await websocket.accept()
+
+        await websocket.receive()
+
+    router.websocket("/socket", endpoint)
+
+    client = Client(app, "/socket")
+    await client.connect()
+
+    pings = 0
+    while (message := await client.receive())["type"] == "websocket.send":
+        assert message["text"] == "ping"
+
+        pings += 1
+        assert pings < 10
+
+    assert pings > 1
+    assert message == {
+        "type": "websocket.close",
+        "code": 1011,
+        "reason": "Keepalive ping timeout",
+    }
+    await client.wait()
+
+
+async def test_keepalive_keeps_connections_of_endpoints_only_sending_messages_open(
+    app: Application, router: Router
+) -> None:
+    app.config["http.websocket_ping_interval"] = 0.05
+    app.config["http.websocket_ping_timeout"] = 0.05
+
+    async def endpoint(websocket: WebSocket) -> None:
+        await websocket.accept()
+
+        for i in range(5):
+            await asyncio.sleep(0.05)
+            await websocket.send_text(str(i))
+
+    router.websocket("/socket", endpoint)
+
+    client = Client(app, "/socket")
+    await client.connect()
+
+    texts: list[str] = []
+    while (message := await client.receive())["type"] == "websocket.send":
+        if message["text"] == "ping":
+            await client.send_text("pong")
+        else:
+            texts.append(message["text"])
+
+    assert texts == ["0", "1", "2", "3", "4"]
+    assert message == {"type": "websocket.close", "code": 1000, "reason": ""}
+    await client.wait()
@@ -1,3 +1,5 @@
+import gzip
+
 from pathlib import Path
 
 from pydantic import HttpUrl
@@ -5,6 +7,8 @@ from pydantic import HttpUrl
 from expanse.contracts.routing.router import Router
 from expanse.http.helpers import view
 from expanse.http.response import Response
+from expanse.static.static import Static
+from expanse.static.static_builder import StaticBuilder
 from expanse.static.static_service_provider import StaticServiceProvider
 from expanse.testing.client import TestClient
 from expanse.view.view_service_provider import ViewServiceProvider
@@ -99,3 +103,215 @@ async def test_static_url_with_empty_prefix(client: TestClient) -> None:
     response = client.get("/foo")
     assert response.status_code == 200
     assert "https://assets.example.com/foo.txt" in response.text
+
+
+async def test_endpoint_is_set_up_if_serving_is_enabled(
+    client: TestClient, tmp_path: Path
+) -> None:
+    provider = StaticServiceProvider(client.app.container)
+
+    tmp_path.joinpath("app.css").write_text("body { color: red; }")
+    client.app.config["app.debug"] = False
+    client.app.config["static.serve"] = True
+    client.app.config["static.paths"] = [tmp_path]
+    await client.app.register(provider)
+    await provider.boot()
+
+    response = client.get("/static/app.css")
+    assert response.status_code == 200
+    assert response.text == "body { color: red; }"
+    assert response.headers["Content-Type"] == "text/css; charset=utf-8"
+    assert response.headers["Cache-Control"] == "public, max-age=86400"
+    assert response.headers["ETag"].startswith('W/"')
+    assert "Last-Modified" in response.headers
+
+    response = client.get(
+        "/static/app.css", headers={"If-None-Match": response.headers["ETag"]}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+    response = client.get("/static/missing.css")
+    assert response.status_code == 404
+
+    response = client.get("/static/../test_static.py")
+    assert response.status_code == 404
+
+
+async def test_small_files_are_kept_in_memory(
+    client: TestClient, tmp_path: Path
+) -> None:
+    provider = StaticServiceProvider(client.app.container)
+
+    tmp_path.joinpath("small.txt").write_text("Small")
+    tmp_path.joinpath("large.txt").write_text("Large")
+    client.app.config["app.debug"] = False
+    client.app.config["static.serve"] = True
+    client.app.config["static.paths"] = [tmp_path]
+    client.app.config["static.memory_file_size"] = 5
+    await client.app.register(provider)
+    await provider.boot()
+
+    assert client.get("/static/small.txt").text == "Small"
+
+    tmp_path.joinpath("small.txt").write_text("Other")
+    tmp_path.joinpath("large.txt").write_text("Large file")
+
+    assert client.get("/static/small.txt").text == "Small"
+    assert client.get("/static/large.txt").text == "Large file"
+
+
+async def test_precompressed_variants_are_served(
+    client: TestClient, tmp_path: Path
+) -> None:
+    provider = StaticServiceProvider(client.app.container)
+
+    content = b"console.log('Hello');" * 10
+    tmp_path.joinpath("app.js").write_bytes(content)
+    tmp_path.joinpath("app.js.gz").write_bytes(gzip.compress(content))
+    client.app.config["app.debug"] = False
+    client.app.config["static.serve"] = True
+    client.app.config["static.paths"] = [tmp_path]
+    await client.app.register(provider)
+    await provider.boot()
+
+    response = client.get("/static/app.js", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.content == content
+
+    identity = client.get("/static/app.js", headers={"Accept-Encoding": "identity"})
+    assert identity.status_code == 200
+    assert "Content-Encoding" not in identity.headers
+    assert identity.headers["Vary"] == "Accept-Encoding"
+    assert identity.content == content
+    assert identity.headers["ETag"] != response.headers["ETag"]
+
+
+async def test_new_files_are_served_in_debug_mode(
+    client: TestClient, tmp_path: Path
+) -> None:
+    provider = StaticServiceProvider(client.app.container)
+
+    client.app.config["static.paths"] = [tmp_path]
+    await client.app.register(provider)
+    await provider.boot()
+
+    assert client.get("/static/new.txt").status_code == 404
+
+    tmp_path.joinpath("new.txt").write_text("New")
+
+    response = client.get("/static/new.txt")
+    assert response.status_code == 200
+    assert response.text == "New"
+    assert response.headers["Cache-Control"] == "no-cache"
+
+
+async def test_static_assets_support_conditional_ranges(
+    client: TestClient, tmp_path: Path
+) -> None:
+    tmp_path.joinpath("data.bin").write_bytes(bytes(range(256)))
+
+    provider = StaticServiceProvider(client.app.container)
+
+    client.app.config["app.debug"] = False
+    client.app.config["static.serve"] = True
+    client.app.config["static.paths"] = [tmp_path]
+    client.app.config["static.memory_file_size"] = 0
+    await client.app.register(provider)
+    await provider.boot()
+
+    response = client.get("/static/data.bin")
+    etag = response.headers["ETag"]
+    last_modified = response.headers["Last-Modified"]
+    assert etag.startswith("W/")
+
+    response = client.get(
+        "/static/data.bin", headers={"Range": "bytes=0-9", "If-Range": last_modified}
+    )
+    assert response.status_code == 206
+    assert response.content == bytes(range(10))
+
+    # Weak entity tags never satisfy If-Range
+    response = client.get(
+        "/static/data.bin", headers={"Range": "bytes=0-9", "If-Range": etag}
+    )
+    assert response.status_code == 200
+    assert response.content == bytes(range(256))
+
+
+async def test_built_assets_are_used_outside_of_debug_mode(
+    client: TestClient, tmp_path: Path
+) -> None:
+    source = tmp_path / "static"
+    source.mkdir()
+    source.joinpath("app.css").write_text("body { color: red; }")
+    manifest = StaticBuilder([source], tmp_path / "build").build()
+    fingerprinted = manifest.get("app.css")
+
+    provider = StaticServiceProvider(client.app.container)
+
+    client.app.config["app.debug"] = False
+    client.app.config["static.serve"] = True
+    client.app.config["static.paths"] = [source]
+    client.app.config["static.build_path"] = tmp_path / "build"
+    client.app.config["view.paths"] = [FIXTURES_DIR]
+    await client.app.register(ViewServiceProvider(client.app.container))
+    await client.app.register(provider)
+    await provider.boot()
+
+    assert (await client.app.container.get(Static)).url("app.css") == (
+        f"/static/{fingerprinted}"
+    )
+
+    response = client.get(f"/static/{fingerprinted}")
+    assert response.status_code == 200
+    assert response.text == "body { color: red; }"
+    assert response.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+
+    response = client.get("/static/app.css")
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "public, max-age=86400"
+
+
+async def test_manifest_of_built_assets_does_not_shadow_an_asset(
+    client: TestClient, tmp_path: Path
+) -> None:
+    source = tmp_path / "static"
+    source.mkdir()
+    source.joinpath("manifest.json").write_text('{"name": "My App"}')
+    StaticBuilder([source], tmp_path / "build").build()
+
+    provider = StaticServiceProvider(client.app.container)
+
+    client.app.config["app.debug"] = False
+    client.app.config["static.serve"] = True
+    client.app.config["static.paths"] = [source]
+    client.app.config["static.build_path"] = tmp_path / "build"
+    await client.app.register(provider)
+    await provider.boot()
+
+    response = client.get("/static/manifest.json")
+    assert response.status_code == 200
+    assert response.text == '{"name": "My App"}'
+
+
+async def test_manifest_is_ignored_in_debug_mode(
+    client: TestClient, tmp_path: Path
+) -> None:
+    source = tmp_path / "static"
+    source.mkdir()
+    source.joinpath("app.css").write_text("body { color: red; }")
+    StaticBuilder([source], tmp_path / "build").build()
+
+    provider = StaticServiceProvider(client.app.container)
+
+    client.app.config["static.paths"] = [source]
+    client.app.config["static.build_path"] = tmp_path / "build"
+    await client.app.register(provider)
+    await provider.boot()
+
+    assert (await client.app.container.get(Static)).url("app.css") == (
+        "/static/app.css"
+    )
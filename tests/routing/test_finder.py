@@ -0,0 +1,181 @@
+from expanse.http.request import Request
+from expanse.http.response import Response
+from expanse.routing.finder import Finder
+from expanse.routing.route import Route
+
+
+async def show(id: int, order: str) -> Response:
+    return Response(f"{id}:{order}")
+
+
+def test_dynamic_matches_are_not_cached_by_default() -> None:
+    finder = Finder()
+    finder.add(Route.get("/users/{id}/orders/{order}", show))
+
+    request = Request.create("http://example.com/users/42/orders/foo")
+
+    assert finder.match(request) is not None
+    assert finder.match_cache is None
+
+
+def test_dynamic_matches_are_cached_with_their_converted_parameters() -> None:
+    finder = Finder(match_cache_size=10)
+    route = Route.get("/users/{id}/orders/{order}", show)
+    finder.add(route)
+
+    assert finder.match_cache is not None
+
+    for _ in range(3):
+        request = Request.create("http://example.com/users/42/orders/foo")
+
+        assert finder.match(request) is route
+        assert request.path_params == {"id": 42, "order": "foo"}
+
+    assert finder.match_cache.misses == 1
+    assert finder.match_cache.hits == 2
+    assert len(finder.match_cache) == 1
+
+
+def test_match_cache_evicts_least_recently_used_entries() -> None:
+    finder = Finder(match_cache_size=2)
+    finder.add(Route.get("/users/{id}/orders/{order}", show))
+
+    assert finder.match_cache is not None
+
+    for path in ["/users/1/orders/a", "/users/2/orders/a", "/users/1/orders/a"]:
+        finder.match(Request.create(f"http://example.com{path}"))
+
+    finder.match(Request.create("http://example.com/users/3/orders/a"))
+
+    assert len(finder.match_cache) == 2
+
+    finder.match(Request.create("http://example.com/users/1/orders/a"))
+    finder.match(Request.create("http://example.com/users/2/orders/a"))
+
+    assert finder.match_cache.hits == 2
+    assert finder.match_cache.misses == 4
+
+
+def test_match_cache_is_invalidated_when_routes_are_added() -> None:
+    finder = Finder(match_cache_size=10)
+    finder.add(Route.get("/users/{id}/orders/{order}", show))
+
+    assert finder.match_cache is not None
+
+    finder.match(Request.create("http://example.com/users/42/orders/foo"))
+
+    assert len(finder.match_cache) == 1
+
+    static_route = Route.get("/users/42/orders/foo", show)
+    finder.add(static_route)
+
+    assert len(finder.match_cache) == 0
+    assert (
+        finder.match(Request.create("http://example.com/users/42/orders/foo"))
+        is static_route
+    )
+
+
+async def user(id: int) -> Response:
+    return Response(str(id))
+
+
+async def slug(slug: str) -> Response:
+    return Response(slug)
+
+
+async def page(path: str) -> Response:
+    return Response(path)
+
+
+def test_static_segments_take_precedence_over_dynamic_ones() -> None:
+    finder = Finder()
+    dynamic = Route.get("/users/{id}", user)
+    static = Route.get("/users/me", user)
+    finder.add(dynamic)
+    finder.add(static)
+
+    assert finder.match(Request.create("http://example.com/users/me")) is static
+
+    request = Request.create("http://example.com/users/42")
+    assert finder.match(request) is dynamic
+    assert request.path_params == {"id": 42}
+
+
+def test_dynamic_segments_are_tried_in_order_until_one_matches() -> None:
+    finder = Finder()
+    converted = Route.get("/items/{id}", user)
+    constrained = Route.get("/items/{slug:[a-z]+}", slug)
+    catch_all = Route.get("/items/{*path}", page)
+    finder.add(catch_all)
+    finder.add(converted)
+    finder.add(constrained)
+
+    request = Request.create("http://example.com/items/42")
+    assert finder.match(request) is converted
+    assert request.path_params == {"id": 42}
+
+    request = Request.create("http://example.com/items/shoes")
+    assert finder.match(request) is constrained
+    assert request.path_params == {"slug": "shoes"}
+
+    # Catch-all segments are only tried once the other ones did not match
+    request = Request.create("http://example.com/items/Shoes/red")
+    assert finder.match(request) is catch_all
+    assert request.path_params == {"path": "Shoes/red"}
+
+
+def test_regex_constraints_of_a_segment_are_grouped() -> None:
+    finder = Finder()
+    numeric = Route.get("/files/{id:\\d+}", user)
+    lowercase = Route.get("/files/{slug:[a-z]+}", slug)
+    finder.add(numeric)
+    finder.add(lowercase)
+
+    assert finder._dynamic.static["files"].matcher is not None
+
+    request = Request.create("http://example.com/files/12")
+    assert finder.match(request) is numeric
+    assert request.path_params == {"id": 12}
+
+    request = Request.create("http://example.com/files/readme")
+    assert finder.match(request) is lowercase
+    assert request.path_params == {"slug": "readme"}
+
+    assert finder.match(Request.create("http://example.com/files/README")) is None
+
+
+def test_matching_backtracks_from_dead_ends() -> None:
+    finder = Finder()
+    tab = Route.get("/users/me/settings/{tab}", page)
+    settings = Route.get("/users/{slug}/settings", slug)
+    posts = Route.get("/users/{slug}/posts", slug)
+    finder.add(tab)
+    finder.add(settings)
+    finder.add(posts)
+
+    request = Request.create("http://example.com/users/me/settings/privacy")
+    assert finder.match(request) is tab
+    assert request.path_params == {"tab": "privacy"}
+
+    # The static segment leads to a segment without routes
+    request = Request.create("http://example.com/users/me/settings")
+    assert finder.match(request) is settings
+    assert request.path_params == {"slug": "me"}
+
+    # The static segment leads to no matching segment
+    request = Request.create("http://example.com/users/me/posts")
+    assert finder.match(request) is posts
+    assert request.path_params == {"slug": "me"}
+
+
+def test_parameters_of_backtracked_segments_are_discarded() -> None:
+    finder = Finder()
+    product = Route.get("/shop/{category}/{id:\\d+}", show)
+    reviews = Route.get("/shop/{slug}/reviews", slug)
+    finder.add(product)
+    finder.add(reviews)
+
+    request = Request.create("http://example.com/shop/shoes/reviews")
+    assert finder.match(request) is reviews
+    assert request.path_params == {"slug": "shoes"}
@@ -2,10 +2,14 @@ import pytest
 
 from expanse.configuration.config import Config
 from expanse.container.container import Container
+from expanse.core.http.middleware.middleware import singleton
 from expanse.http.request import Request
+from expanse.http.response import Response
+from expanse.routing.invocation_plan import InvocationPlan
 from expanse.routing.route import Route
 from expanse.routing.router import Router
 from expanse.support.helpers import async_safe
+from expanse.types.http.middleware import RequestHandler
 
 
 async def test_router_warns_about_implicit_async_safe_status() -> None:
@@ -58,3 +62,98 @@ async def test_router_does_not_warn_about_implicit_async_safe_status_if_globally
     await router.handle(Container(), request)
 
     assert recwarn.list == []
+
+
+async def test_router_compiles_the_invocation_plan_of_a_route_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class Dependency:
+        pass
+
+    async def endpoint(id: int, dependency: Dependency, page: int = 1) -> Response:
+        return Response(f"{id}:{type(dependency).__name__}:{page}")
+
+    compiled: list[InvocationPlan] = []
+    compile_plan = InvocationPlan.compile
+
+    def compile(route: Route) -> InvocationPlan:
+        plan = compile_plan(route)
+        compiled.append(plan)
+
+        return plan
+
+    monkeypatch.setattr(InvocationPlan, "compile", compile)
+
+    router = Router(Config({}))
+    route = router.add_route(Route.get("/users/{id}", endpoint))
+
+    request = Request.create("http://example.com/users/42", method="GET")
+    first = await router.handle(Container(), request)
+
+    request = Request.create("http://example.com/users/43", method="GET")
+    second = await router.handle(Container(), request)
+
+    assert await first.render() == b"42:Dependency:1"
+    assert await second.render() == b"43:Dependency:1"
+    assert compiled == [route.invocation_plan]
+    assert route.invocation_plan.is_static
+
+
+async def test_router_reuses_singleton_middleware_across_requests() -> None:
+    instances: list[object] = []
+
+    class TrackingMiddleware:
+        def __init__(self) -> None:
+            instances.append(self)
+
+        async def handle(self, request: Request, next_call: RequestHandler) -> Response:
+            return await next_call(request)
+
+    @singleton
+    class SingletonMiddleware(TrackingMiddleware):
+        pass
+
+    async def endpoint() -> Response:
+        return Response("Hello, world!")
+
+    router = Router(Config({}))
+    router.add_route(Route.get("/test", endpoint).middleware(TrackingMiddleware))
+    router.add_route(Route.get("/singleton", endpoint).middleware(SingletonMiddleware))
+
+    for _ in range(2):
+        await router.handle(Container(), Request.create("http://example.com/test"))
+        await router.handle(Container(), Request.create("http://example.com/singleton"))
+
+    assert len(instances) == 3
+    assert len([i for i in instances if isinstance(i, SingletonMiddleware)]) == 1
+
+
+async def test_router_rebuilds_middleware_chains_when_groups_change() -> None:
+    calls: list[str] = []
+
+    class FirstMiddleware:
+        async def handle(self, request: Request, next_call: RequestHandler) -> Response:
+            calls.append("first")
+
+            return await next_call(request)
+
+    class SecondMiddleware:
+        async def handle(self, request: Request, next_call: RequestHandler) -> Response:
+            calls.append("second")
+
+            return await next_call(request)
+
+    async def endpoint() -> Response:
+        return Response("Hello, world!")
+
+    router = Router(Config({}))
+    router.middleware_group("web", [FirstMiddleware])
+    router.add_route(Route.get("/test", endpoint).middleware("web"))
+
+    await router.handle(Container(), Request.create("http://example.com/test"))
+
+    router.middleware_group("web", [SecondMiddleware])
+
+    await router.handle(Container(), Request.create("http://example.com/test"))
+
+    assert calls == ["first", "second"]
@@ -90,3 +90,37 @@ def test_generator_can_generate_route_urls_with_simple_param_and_catch_all(
         url.to_route("foo", {"name": "john", "path": "documents/report.pdf"})
         == "/foo/john/documents/report.pdf"
     )
+
+
+def test_generator_can_generate_route_urls_with_optional_segments(
+    router: Router, url: URLGenerator
+) -> None:
+    router.get(r"/posts[/{page:\d+}]", lambda: "", name="posts")
+
+    assert url.to_route("posts") == "/posts"
+    assert url.to_route("posts", {"page": 2}) == "/posts/2"
+    assert url.to_route("posts", {"sort": "date"}) == "/posts?sort=date"
+
+    with pytest.raises(InvalidURLParameter):
+        url.to_route("posts", {"page": "foo"})
+
+
+def test_route_templates_are_compiled_once(router: Router, url: URLGenerator) -> None:
+    router.get("/foo/{bar}", lambda: "", name="foo")
+
+    template = router.routes.template("foo")
+
+    assert template is router.routes.template("foo")
+    assert url.to_route("foo", {"bar": "baz"}) == "/foo/baz"
+
+
+def test_route_templates_are_invalidated_when_routes_are_added(
+    router: Router, url: URLGenerator
+) -> None:
+    router.get("/foo/{bar}", lambda: "", name="foo")
+
+    assert url.to_route("foo", {"bar": "baz"}) == "/foo/baz"
+
+    router.get("/bar/{bar}", lambda: "", name="foo")
+
+    assert url.to_route("foo", {"bar": "baz"}) == "/bar/baz"
@@ -0,0 +1,25 @@
+from pathlib import Path
+
+from expanse.core.application import Application
+from expanse.static.static_service_provider import StaticServiceProvider
+from expanse.testing.command_tester import CommandTester
+
+
+async def test_command_builds_static_assets(app: Application, tmp_path: Path) -> None:
+    tester = CommandTester(app)
+
+    tmp_path.joinpath("static").mkdir()
+    tmp_path.joinpath("static", "app.js").write_text("console.log(1);")
+    app.config["static.paths"] = [tmp_path / "static"]
+    app.config["static.build_path"] = tmp_path / "build"
+
+    provider = StaticServiceProvider(app.container)
+    await app.register(provider)
+    await provider.boot()
+
+    command = tester.command("static build")
+    code = command.run()
+
+    assert code == 0
+    assert "1 static assets built" in command.output.fetch()
+    assert (tmp_path / "build" / "manifest.json").is_file()
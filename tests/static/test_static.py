@@ -7,6 +7,7 @@ from expanse.core.helpers import _use_container
 from expanse.core.http.exceptions import HTTPException
 from expanse.http.request import Request
 from expanse.static.static import Static
+from expanse.static.static_index import StaticIndex
 
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
@@ -37,3 +38,37 @@ async def test_get_returns_404_not_found_if_file_does_not_exist(
                 await static.get("bar.txt")
 
             assert e.value.status_code == 404
+
+
+async def test_debug_misses_only_index_the_requested_file(
+    app: Application, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    static = Static([tmp_path], prefix="/static", debug=True)
+    await static.build_index()
+
+    def build(self: StaticIndex) -> None:
+        raise AssertionError("The static directories should not be walked again")
+
+    monkeypatch.setattr(StaticIndex, "build", build)
+    monkeypatch.setattr(StaticIndex, "watch", lambda self: None)
+
+    tmp_path.joinpath("new.txt").write_text("New")
+    tmp_path.joinpath("new.txt.gz").write_bytes(b"compressed")
+    tmp_path.parent.joinpath("secret.txt").write_text("Secret")
+
+    async with app.container.create_scoped_container() as container:
+        container.instance(Request, Request.create("http://example.com"))
+
+        async with _use_container(container):
+            request = Request.create(
+                "http://example.com", scope={"headers": [(b"accept-encoding", b"gzip")]}
+            )
+            response = await static.get("new.txt", request)
+
+            assert response.status_code == 200
+            assert response.headers["Content-Encoding"] == "gzip"
+
+            with pytest.raises(HTTPException) as e:
+                await static.get("../secret.txt")
+
+            assert e.value.status_code == 404
@@ -0,0 +1,79 @@
+import gzip
+import json
+
+from pathlib import Path
+
+from expanse.static.manifest import Manifest
+from expanse.static.static_builder import StaticBuilder
+
+
+def test_build_copies_assets_with_fingerprinted_names(tmp_path: Path) -> None:
+    source = tmp_path / "static"
+    source.joinpath("css").mkdir(parents=True)
+    source.joinpath("css", "app.css").write_text("body { color: red; }" * 50)
+    source.joinpath("logo.min.svg").write_text("<svg></svg>")
+    build_path = tmp_path / "build"
+
+    manifest = StaticBuilder([source], build_path, min_size=100).build()
+
+    css = manifest.get("css/app.css")
+    assert css.startswith("css/app.") and css.endswith(".css")
+    assert css != "css/app.css"
+    assert build_path.joinpath(css).read_text() == "body { color: red; }" * 50
+    assert gzip.decompress(build_path.joinpath(css + ".gz").read_bytes()) == (
+        b"body { color: red; }" * 50
+    )
+
+    svg = manifest.get("logo.min.svg")
+    assert svg.startswith("logo.min.") and svg.endswith(".svg")
+    assert build_path.joinpath(svg).read_text() == "<svg></svg>"
+    # Files smaller than the minimum size are not precompressed
+    assert not build_path.joinpath(svg + ".gz").exists()
+
+    assert json.loads(build_path.joinpath("manifest.json").read_text()) == {
+        "css/app.css": css,
+        "logo.min.svg": svg,
+    }
+    assert Manifest.load(build_path / "manifest.json").all() == manifest.all()
+
+
+def test_fingerprints_depend_on_content(tmp_path: Path) -> None:
+    source = tmp_path / "static"
+    source.mkdir()
+    source.joinpath("app.js").write_text("console.log(1);")
+    builder = StaticBuilder([source], tmp_path / "build")
+
+    first = builder.build().get("app.js")
+    assert builder.build().get("app.js") == first
+
+    source.joinpath("app.js").write_text("console.log(2);")
+    second = builder.build().get("app.js")
+
+    assert second != first
+    # Previous builds are kept
+    assert (tmp_path / "build" / first).exists()
+    assert (tmp_path / "build" / second).exists()
+
+
+def test_existing_precompressed_variants_are_kept(tmp_path: Path) -> None:
+    source = tmp_path / "static"
+    source.mkdir()
+    source.joinpath("app.js").write_text("console.log(1);")
+    source.joinpath("app.js.br").write_bytes(b"brotli")
+    build_path = tmp_path / "build"
+
+    manifest = StaticBuilder([source], build_path, encodings=[]).build()
+
+    assert len(manifest) == 1
+    assert build_path.joinpath(manifest.get("app.js") + ".br").read_bytes() == (
+        b"brotli"
+    )
+
+
+def test_manifest_returns_unknown_paths_as_is() -> None:
+    manifest = Manifest({"app.js": "app.0123456789abcdef.js"})
+
+    assert manifest.get("app.js") == "app.0123456789abcdef.js"
+    assert manifest.get("other.js") == "other.js"
+    assert manifest.is_fingerprinted("app.0123456789abcdef.js")
+    assert not manifest.is_fingerprinted("app.js")
@@ -0,0 +1,251 @@
+import asyncio
+import threading
+
+from collections.abc import Iterator
+
+import pytest
+
+from expanse.support._concurrency import AsyncIteratorWrapper
+from expanse.support._concurrency import ThreadPool
+from expanse.support._concurrency import configure_thread_pool
+from expanse.support._concurrency import get_thread_pool
+from expanse.support._concurrency import sync_to_async
+from expanse.support.helpers import thread_sensitive
+
+
+def current_thread() -> int:
+    return threading.get_ident()
+
+
+@thread_sensitive()
+def current_sensitive_thread() -> int:
+    return threading.get_ident()
+
+
+@pytest.fixture(autouse=True)
+def disable_thread_pool() -> Iterator[None]:
+    yield
+
+    configure_thread_pool(None)
+
+
+async def test_sync_functions_share_a_single_thread_by_default() -> None:
+    local = threading.local()
+
+    def open_session() -> None:
+        local.session = "session"
+
+    def get_session() -> str | None:
+        return getattr(local, "session", None)
+
+    assert get_thread_pool() is None
+
+    await sync_to_async(open_session)
+
+    # Thread-bound resources, like synchronous database sessions,
+    # remain available to subsequent calls.
+    assert await sync_to_async(get_session) == "session"
+    assert await sync_to_async(current_thread) != threading.get_ident()
+
+
+async def test_sync_functions_run_in_the_thread_pool() -> None:
+    pool = configure_thread_pool(4)
+
+    assert pool is not None
+    assert get_thread_pool() is pool
+    assert await sync_to_async(current_thread) != threading.get_ident()
+
+    stats = pool.stats()
+
+    assert stats.max_workers == 4
+    assert stats.completed >= 1
+    assert stats.queued == 0
+    assert stats.running == 0
+
+
+async def test_slow_sync_functions_do_not_block_other_ones() -> None:
+    configure_thread_pool(2)
+    event = threading.Event()
+
+    def wait() -> bool:
+        return event.wait(timeout=1)
+
+    waiting = asyncio.ensure_future(sync_to_async(wait))
+
+    await sync_to_async(event.set)
+
+    assert await waiting
+
+
+async def test_thread_sensitive_functions_run_in_the_same_thread() -> None:
+    configure_thread_pool(4)
+
+    first = await sync_to_async(current_sensitive_thread)
+    second = await sync_to_async(current_sensitive_thread)
+
+    assert first == second
+
+
+async def test_thread_pool_can_be_disabled() -> None:
+    configure_thread_pool(4)
+
+    assert configure_thread_pool(None) is None
+    assert get_thread_pool() is None
+
+
+async def test_sync_generators_can_be_consumed_from_the_thread_pool() -> None:
+    configure_thread_pool(4)
+
+    def generate() -> Iterator[bytes]:
+        yield b"Hello"
+        yield b" "
+        yield b"World"
+
+    chunks = [chunk async for chunk in AsyncIteratorWrapper(generate())]
+
+    assert chunks == [b"Hello", b" ", b"World"]
+
+
+async def test_thread_pool_reports_wait_time_and_queue_depth() -> None:
+    pool = ThreadPool(1)
+    started = threading.Event()
+    release = threading.Event()
+
+    def block() -> bool:
+        started.set()
+
+        return release.wait(timeout=1)
+
+    blocking = asyncio.ensure_future(pool.run(block))
+    queued = asyncio.ensure_future(pool.run(lambda: True))
+
+    # Once the first call runs, the second one waits for the single worker
+    assert await asyncio.to_thread(started.wait, 1)
+
+    assert pool.stats().queued == 1
+    assert pool.stats().running == 1
+
+    release.set()
+
+    assert await blocking
+    assert await queued
+
+    stats = pool.stats()
+
+    assert stats.completed == 2
+    assert stats.queued == 0
+    assert stats.max_wait_time > 0
+    assert stats.average_wait_time > 0
+
+    pool.shutdown()
+
+
+async def test_async_iterator_wrapper_yields_values() -> None:
+    values = [value async for value in AsyncIteratorWrapper(range(5))]
+
+    assert values == [0, 1, 2, 3, 4]
+
+
+async def test_async_iterator_wrapper_retrieves_values_in_batches() -> None:
+    batches: list[int] = []
+
+    class Wrapper(AsyncIteratorWrapper[int]):
+        def _next_batch(self) -> tuple[list[int], bool, Exception | None]:
+            batch, exhausted, error = super()._next_batch()
+            batches.append(len(batch))
+
+            return batch, exhausted, error
+
+    wrapper = Wrapper(range(10), batch_size=4)
+
+    assert wrapper.batching
+    assert [value async for value in wrapper] == list(range(10))
+    assert batches == [4, 4, 2]
+
+
+async def test_async_iterator_wrapper_retrieves_values_in_batches_of_bytes() -> None:
+    calls = 0
+
+    class Chunks:
+        def __iter__(self) -> Iterator[bytes]:
+            return self
+
+        def __next__(self) -> bytes:
+            nonlocal calls
+
+            calls += 1
+            if calls > 8:
+                raise StopIteration
+
+            return b"x" * 10
+
+    wrapper = AsyncIteratorWrapper(Chunks(), batch_bytes=25)
+
+    assert [chunk async for chunk in wrapper] == [b"x" * 10] * 8
+
+
+async def test_async_iterator_wrapper_caps_the_length_of_batches_of_bytes() -> None:
+    batches: list[int] = []
+
+    class Wrapper(AsyncIteratorWrapper[int]):
+        def _next_batch(self) -> tuple[list[int], bool, Exception | None]:
+            batch, exhausted, error = super()._next_batch()
+            batches.append(len(batch))
+
+            return batch, exhausted, error
+
+    # Values that are not bytes do not count towards the size of batches
+    wrapper = Wrapper(range(2000), batch_bytes=25)
+
+    assert [value async for value in wrapper] == list(range(2000))
+    assert batches == [1024, 976]
+
+
+async def test_async_iterator_wrapper_raises_errors_after_retrieved_values() -> None:
+    def generate() -> Iterator[int]:
+        yield 1
+        yield 2
+
+        raise RuntimeError("Boom")
+
+    wrapper = AsyncIteratorWrapper(generate(), batch_size=10)
+    values: list[int] = []
+
+    with pytest.raises(RuntimeError, match="Boom"):
+        async for value in wrapper:
+            values.append(value)
+
+    assert values == [1, 2]
+
+
+async def test_async_iterator_wrapper_raises_errors_after_prefetched_values() -> None:
+    def generate() -> Iterator[int]:
+        yield 1
+        yield 2
+        yield 3
+        yield 4
+
+        raise RuntimeError("Boom")
+
+    wrapper = AsyncIteratorWrapper(generate(), batch_size=3)
+    values: list[int] = []
+
+    with pytest.raises(RuntimeError, match="Boom"):
+        async for value in wrapper:
+            values.append(value)
+
+            # Let the next batch be prefetched while the current one is consumed
+            await asyncio.sleep(0.01)
+
+    assert values == [1, 2, 3, 4]
+
+
+async def test_async_iterator_wrapper_can_be_closed_early() -> None:
+    wrapper = AsyncIteratorWrapper(iter(range(100)), batch_size=10)
+
+    assert await anext(wrapper) == 0
+
+    await wrapper.aclose()
+
+    with pytest.raises(StopAsyncIteration):
+        await anext(wrapper)